@@ -0,0 +1,217 @@
+"""Benchmark the new data callback pipeline with a simulated fast data source.
+
+Every channel gets its own `MeasurementManagerAsync`. A producer thread per channel
+appends points to a fake .NET curve and fires the `NewDataAdded` handler,
+like the PalmSens SDK does from its own threads.
+
+The coalesced pipeline (default) is compared with the previous implementation,
+which creates new wrappers and wakes up the event loop for every event.
+
+Usage:
+
+    python benchmarks/bench_callbacks.py --channels 8 --rate 5000 --duration 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import threading
+import time
+from array import array
+from dataclasses import dataclass
+
+import pypalmsens  # noqa: F401, loads the .NET runtime
+from pypalmsens._instruments.callback import CallbackData
+from pypalmsens._instruments.dispatch import CallbackDispatcher, EventCoalescer
+from pypalmsens._instruments.measurement_manager_async import (
+    Callbacks,
+    MeasurementManagerAsync,
+)
+from pypalmsens.data import DataArray
+
+
+class FakeEvent:
+    """Minimal stand-in for a .NET event, supports `+=` and `-=`."""
+
+    def __iadd__(self, handler):
+        return self
+
+    def __isub__(self, handler):
+        return self
+
+
+@dataclass
+class FakeValue:
+    Value: float
+
+
+class FakePSArray:
+    """Minimal stand-in for `PalmSens.Data.DataArray`."""
+
+    def __init__(self):
+        self.values = array('d')
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, index):
+        return FakeValue(self.values[index])
+
+    def GetValues(self, offset=0.0, start=0, count=None, inverse=False):
+        if count is None:
+            count = len(self.values) - start
+        return self.values[start : start + count]
+
+
+class FakePSCurve:
+    """Minimal stand-in for `PalmSens.Plottables.Curve`."""
+
+    def __init__(self):
+        self.XAxisDataArray = FakePSArray()
+        self.YAxisDataArray = FakePSArray()
+        self.NewDataAdded = FakeEvent()
+        self.Finished = FakeEvent()
+
+    def GetHashCode(self):
+        return id(self)
+
+
+@dataclass
+class FakeArgs:
+    StartIndex: int
+    Count: int
+
+    def GetCurve(self):
+        return self.curve  # type: ignore
+
+
+def legacy_curve_data_added_callback(manager, pscurve, args):
+    """Callback pipeline before event coalescing, for comparison."""
+    data = CallbackData(
+        x_array=DataArray(psarray=pscurve.XAxisDataArray),
+        y_array=DataArray(psarray=pscurve.YAxisDataArray),
+        start=args.StartIndex,
+        id=pscurve.GetHashCode(),
+    )
+
+    for callback in manager.callbacks.curve_new_data:
+        manager.dispatcher.call_soon_threadsafe(callback, data, key=data.id)
+
+
+def produce(manager, pscurve, *, rate: float, duration: float, batch: int, legacy: bool):
+    """Append points at the given rate, firing a data event for every `batch` points."""
+    x = pscurve.XAxisDataArray.values
+    y = pscurve.YAxisDataArray.values
+
+    interval = batch / rate
+    n_batches = int(rate * duration / batch)
+    t0 = time.perf_counter()
+
+    for i in range(n_batches):
+        start = len(x)
+
+        for j in range(batch):
+            x.append(start + j)
+            y.append(1.0)
+
+        args = FakeArgs(StartIndex=start, Count=batch)
+
+        if legacy:
+            legacy_curve_data_added_callback(manager, pscurve, args)
+        else:
+            manager.curve_data_added_callback(pscurve, args)
+
+        if (delay := t0 + (i + 1) * interval - time.perf_counter()) > 0:
+            time.sleep(delay)
+
+
+async def run(*, channels: int, rate: float, duration: float, batch: int, legacy: bool):
+    loop = asyncio.get_running_loop()
+
+    received = [0] * channels
+    calls = [0] * channels
+
+    managers = []
+    curves = []
+
+    for channel in range(channels):
+
+        def callback(data, channel=channel):
+            received[channel] += len(data.new_x())
+            calls[channel] += 1
+
+        manager = MeasurementManagerAsync(comm=None)  # type: ignore
+        manager.loop = loop
+        manager.callbacks = Callbacks(curve_new_data=[callback])
+        manager.dispatcher = CallbackDispatcher(loop, manager.callback_metrics)
+        manager.coalescer = EventCoalescer(loop, manager._dispatch_curve_data)
+
+        pscurve = FakePSCurve()
+        args = FakeArgs(StartIndex=0, Count=0)
+        args.curve = pscurve  # type: ignore
+        manager.begin_receive_curve_callback(None, args)  # type: ignore
+
+        managers.append(manager)
+        curves.append(pscurve)
+
+    threads = [
+        threading.Thread(
+            target=produce,
+            args=(manager, pscurve),
+            kwargs={'rate': rate, 'duration': duration, 'batch': batch, 'legacy': legacy},
+        )
+        for manager, pscurve in zip(managers, curves)
+    ]
+
+    cpu0 = time.process_time()
+    t0 = time.perf_counter()
+
+    for thread in threads:
+        thread.start()
+
+    while any(thread.is_alive() for thread in threads):
+        await asyncio.sleep(0.01)
+
+    for manager in managers:
+        manager.coalescer.drain()
+        await manager.dispatcher.join()
+
+    await asyncio.sleep(0.1)
+
+    wall = time.perf_counter() - t0
+    cpu = time.process_time() - cpu0
+
+    produced = sum(len(pscurve.XAxisDataArray) for pscurve in curves)
+    latency = max(manager.callback_metrics.max_latency for manager in managers)
+
+    label = 'legacy' if legacy else 'coalesced'
+    print(
+        f'{label:>10}: {produced} points, {sum(received)} received, '
+        f'{sum(calls)} callbacks, wall {wall:.2f} s, cpu {cpu:.2f} s, '
+        f'max latency {latency * 1000:.1f} ms'
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    _ = parser.add_argument('--channels', type=int, default=8)
+    _ = parser.add_argument('--rate', type=float, default=5000, help='Points per second')
+    _ = parser.add_argument('--duration', type=float, default=5, help='Seconds')
+    _ = parser.add_argument('--batch', type=int, default=1, help='Points per data event')
+    args = parser.parse_args()
+
+    for legacy in (True, False):
+        asyncio.run(
+            run(
+                channels=args.channels,
+                rate=args.rate,
+                duration=args.duration,
+                batch=args.batch,
+                legacy=legacy,
+            )
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -26,7 +26,18 @@ from . import (
     stages,
     types,
 )
-from ._instruments.instrument import Instrument, discover, discover_async
+from ._data.stream import DataStream, recover_stream
+from ._instruments.broadcast import LivePublisher, LiveSubscriber
+from ._instruments.capabilities import CapabilitiesStore
+from ._instruments.discovery import DiscoveryCache, DiscoveryEvent, InstrumentWatcher
+from ._instruments.dispatch import run_in_executor
+from ._instruments.health import Backoff, PoolMonitor
+from ._instruments.instrument import (
+    Instrument,
+    discover,
+    discover_async,
+    discover_iter_async,
+)
 from ._instruments.instrument_manager import (
     InstrumentManager,
     connect,
@@ -39,6 +50,13 @@ from ._instruments.instrument_manager_async import (
 )
 from ._instruments.instrument_pool import InstrumentPool
 from ._instruments.instrument_pool_async import InstrumentPoolAsync
+from ._instruments.mux_sweep import MuxSweep
+from ._instruments.process_pool import InstrumentProcessPoolAsync
+from ._instruments.rpc import InstrumentClient, InstrumentServer
+from ._instruments.scheduler import JobConstraints, JobScheduler
+from ._instruments.shared import MeasurementTimeoutError
+from ._instruments.simulated import SimulatedInstrument
+from ._instruments.watchdog import Watchdog
 from ._io import load_method_file, load_session_file, save_method_file, save_session_file
 from ._methods.mixed_mode import MixedMode
 from ._methods.techniques import (
@@ -78,19 +96,40 @@ __all__ = [
     'connect_async',
     'discover',
     'discover_async',
+    'discover_iter_async',
     'measure',
     'measure_async',
+    'recover_stream',
+    'run_in_executor',
     'load_method_file',
     'load_session_file',
     'save_method_file',
     'save_session_file',
     'stages',
     'types',
+    'Backoff',
+    'CapabilitiesStore',
+    'DiscoveryCache',
+    'DiscoveryEvent',
     'Instrument',
+    'InstrumentClient',
+    'InstrumentServer',
+    'InstrumentWatcher',
+    'JobConstraints',
+    'JobScheduler',
+    'DataStream',
     'InstrumentManager',
     'InstrumentManagerAsync',
     'InstrumentPool',
     'InstrumentPoolAsync',
+    'InstrumentProcessPoolAsync',
+    'LivePublisher',
+    'LiveSubscriber',
+    'MeasurementTimeoutError',
+    'MuxSweep',
+    'PoolMonitor',
+    'SimulatedInstrument',
+    'Watchdog',
     'ACVoltammetry',
     'ChronoAmperometry',
     'ChronoCoulometry',
@@ -4,6 +4,8 @@ from collections.abc import Sequence
 from typing import TYPE_CHECKING, Any, overload
 
 import numpy as np
+from System import IntPtr
+from System.Runtime.InteropServices import Marshal
 from typing_extensions import override
 
 from .._converters import cr_enum_to_string, pr_enum_to_string
@@ -108,6 +110,28 @@ class DataArray(Sequence[float]):
         """Export data array to list."""
         return list(self._psarray.GetValues())
 
+    def _to_numpy_range(self, start: int, stop: int) -> np.ndarray:
+        """Export values in the range `[start, stop)` to numpy using a single bulk copy.
+
+        The values are the same as `array[i]`."""
+        count = min(stop, len(self)) - start
+
+        if count <= 0:
+            return np.empty(0, dtype=np.float64)
+
+        # For (m)iDC, `GetValues()` returns the value in range instead of `Value`
+        if self.type == 'miDC':
+            return np.array([self._psarray[i].Value for i in range(start, start + count)])
+
+        values = np.empty(count, dtype=np.float64)
+        Marshal.Copy(
+            self._psarray.GetValues(0.0, start, count, False),
+            0,
+            IntPtr(values.ctypes.data),
+            count,
+        )
+        return values
+
     @property
     def type(self) -> AllowedArrayTypes:
         """Array type as str."""
@@ -23,6 +23,8 @@ from .peak import Peak
 if TYPE_CHECKING:
     from PalmSens import Measurement as PSMeasurement
 
+    from .._instruments.timings import MeasurementTimings
+
 
 @dataclass(frozen=True)
 class DeviceInfo:
@@ -85,6 +87,9 @@ class Measurement:
     def __init__(self, *, psmeasurement: PSMeasurement):
         self._psmeasurement = psmeasurement
 
+        self.timings: MeasurementTimings | None = None
+        """Stage timings, only recorded if `timing_stats` is set on the instrument manager."""
+
     @override
     def __repr__(self):
         return f'{type(self).__name__}(title={self.title}, timestamp={self.timestamp}, device={self.device.type})'
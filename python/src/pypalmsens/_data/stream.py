@@ -0,0 +1,391 @@
+from __future__ import annotations
+
+import gzip
+import json
+import re
+import warnings
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Literal, get_args
+
+import numpy as np
+import PalmSens
+import System
+from PalmSens.Data import DataArray as PSDataArray
+from PalmSens.Data import GenericValue, IDataValue
+from PalmSens.Units import CustomSIUnit
+from pydantic import BaseModel, Field, TypeAdapter
+
+from .._io import save_session_file
+from .curve import CurveMetadata
+from .eisdata import EISDataMetadata
+from .measurement import Measurement, MeasurementMetadata
+from .types import AllowedArrayTypes, array_str_to_enum
+
+# Data rows are written by pydantic as `{"id":<id>,"data":[<values>]}`,
+# all other lines contain metadata
+_ROW_PATTERN = re.compile(rb'\{"id":(-?\d+),"data":\[([^\]\n]*)\]\}')
+_METADATA_PATTERN = re.compile(rb'\{"(?!id":)[^\n]*')
+
+_metadata_adapter: TypeAdapter[MeasurementMetadata | CurveMetadata | EISDataMetadata] = (
+    TypeAdapter(MeasurementMetadata | CurveMetadata | EISDataMetadata)
+)
+
+
+@dataclass(frozen=True, slots=True)
+class DataStream:
+    """Options to stream data to a series of files, see `measure(stream=...)`.
+
+    The data are written to numbered segments next to `path`, e.g. `run.0000.jsonl`,
+    `run.0001.jsonl`, etc. A new segment is started as soon as one of the limits is
+    reached. Every segment starts with the metadata of the measurement and
+    the active curves, so that each segment can be read on its own.
+
+    The segments are listed in a manifest, e.g. `run.manifest.json`.
+    Pass the manifest to `recover_stream()` to read all segments at once.
+    """
+
+    path: Path | str
+    """Base name of the data stream, e.g. `run.jsonl`."""
+
+    max_bytes: int | None = None
+    """Start a new segment when the current segment exceeds this size in bytes."""
+
+    max_rows: int | None = None
+    """Start a new segment after this number of data rows."""
+
+    max_seconds: float | None = None
+    """Start a new segment after this number of seconds."""
+
+    compress: bool = False
+    """If True, compress closed segments with gzip in a background thread."""
+
+
+class StreamSegment(BaseModel):
+    """Segment of a data stream, see `StreamManifest`."""
+
+    index: int
+    """Segment number."""
+
+    filename: str
+    """File name relative to the manifest."""
+
+    started: datetime
+    """Time the segment was opened."""
+
+    n_rows: int = 0
+    """Number of data rows."""
+
+    n_bytes: int = 0
+    """Size of the uncompressed segment in bytes."""
+
+    closed: bool = False
+    """True if the segment is complete."""
+
+    compressed: bool = False
+    """True if the segment is compressed with gzip."""
+
+
+class StreamManifest(BaseModel):
+    """List of segments written for a `DataStream`."""
+
+    type: Literal['manifest'] = 'manifest'
+
+    segments: list[StreamSegment] = Field(default_factory=list)
+    """Segments in order."""
+
+    finished: bool = False
+    """True if the measurement ended and all segments are closed."""
+
+
+def _segment_path(path: Path | str, index: int) -> Path:
+    """Return path of segment, e.g. `run.jsonl` -> `run.0003.jsonl`."""
+    path = Path(path)
+    suffix = path.suffix or '.jsonl'
+    return path.with_name(f'{path.stem}.{index:04d}{suffix}')
+
+
+def _manifest_path(path: Path | str) -> Path:
+    """Return path of manifest, e.g. `run.jsonl` -> `run.manifest.json`."""
+    path = Path(path)
+    return path.with_name(f'{path.stem}.manifest.json')
+
+
+def _read_segments(path: Path) -> bytes:
+    """Read and concatenate all segments listed in a manifest."""
+    manifest = StreamManifest.model_validate_json(path.read_bytes())
+
+    segments = []
+    for segment in manifest.segments:
+        segment_path = path.with_name(segment.filename)
+
+        if not segment_path.exists() and not segment.compressed:
+            # Compressed after the manifest was last written
+            segment_path = segment_path.with_name(segment_path.name + '.gz')
+
+        segments.append(_read_bytes(segment_path))
+
+    # Only the last segment can be cut off, ensure the others end with a newline
+    raw = b''.join(
+        segment if segment.endswith(b'\n') or i == len(segments) - 1 else segment + b'\n'
+        for i, segment in enumerate(segments)
+    )
+    return raw
+
+
+def _read_bytes(path: Path) -> bytes:
+    """Read file, decompress if the file is compressed with gzip."""
+    if path.suffix == '.gz':
+        with gzip.open(path, 'rb') as f:
+            try:
+                return f.read()
+            except EOFError:
+                # Compression was interrupted
+                return b''
+    return path.read_bytes()
+
+
+@dataclass(frozen=True, slots=True)
+class RecoveredCurve:
+    """Curve recovered from a data stream."""
+
+    metadata: CurveMetadata
+    """Curve metadata."""
+
+    data: np.ndarray
+    """Array with shape `(n_points, 2)`, with the x and y values."""
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    @property
+    def title(self) -> str:
+        """Curve title."""
+        return self.metadata.title
+
+    @property
+    def x(self) -> np.ndarray:
+        """X values."""
+        return self.data[:, 0]
+
+    @property
+    def y(self) -> np.ndarray:
+        """Y values."""
+        return self.data[:, 1]
+
+
+@dataclass(frozen=True, slots=True)
+class RecoveredEISData:
+    """EIS data recovered from a data stream."""
+
+    metadata: EISDataMetadata
+    """EIS data metadata."""
+
+    data: np.ndarray
+    """Array with shape `(n_points, n_columns)`, see `metadata.columns`."""
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        """Return column by name."""
+        return self.data[:, self.metadata.columns.index(column)]
+
+    @property
+    def title(self) -> str:
+        """EIS data title."""
+        return self.metadata.title
+
+
+@dataclass(frozen=True)
+class RecoveredMeasurement:
+    """Measurement recovered from a data stream, see `recover_stream()`."""
+
+    metadata: MeasurementMetadata | None
+    """Measurement metadata, None if the stream does not contain these."""
+
+    curves: list[RecoveredCurve] = field(default_factory=list)
+    """Recovered curves, in order of appearance."""
+
+    eis_data: list[RecoveredEISData] = field(default_factory=list)
+    """Recovered EIS data, in order of appearance."""
+
+    truncated: bool = False
+    """True if the last line of the stream was incomplete and skipped."""
+
+    n_skipped: int = 0
+    """Number of data rows skipped because their curve or EIS data metadata are missing."""
+
+    def to_measurement(self) -> Measurement:
+        """Rebuild a measurement with the SDK, e.g. to save it with `save_session_file()`.
+
+        Only curves are rebuilt. EIS data are not supported.
+
+        Returns
+        -------
+        measurement : Measurement
+        """
+        if self.metadata is None:
+            raise ValueError('Cannot rebuild measurement without measurement metadata.')
+
+        if self.eis_data:
+            warnings.warn(
+                'EIS data cannot be rebuilt and are not included in the measurement.',
+                stacklevel=2,
+            )
+
+        psmeasurement = PalmSens.Measurement(self.metadata.method._to_psmethod())
+        psmeasurement.Title = self.metadata.title
+
+        timestamp = self.metadata.timestamp
+        psmeasurement.TimeStamp = System.DateTime(
+            timestamp.year,
+            timestamp.month,
+            timestamp.day,
+            timestamp.hour,
+            timestamp.minute,
+            timestamp.second,
+        )
+
+        for curve in self.curves:
+            metadata = curve.metadata
+            x_array, y_array = (
+                _to_psarray(metadata.labels[i], metadata.units[i], curve.data[:, i])
+                for i in range(2)
+            )
+            pscurve = PalmSens.Plottables.Curve(x_array, y_array, metadata.title, True)
+            _ = psmeasurement.AddCurve(pscurve)
+
+        return Measurement(psmeasurement=psmeasurement)
+
+
+def _to_psarray(quantity: str, unit: str, values: np.ndarray) -> PSDataArray:
+    """Create .NET data array from values."""
+    array_type = quantity if quantity in get_args(AllowedArrayTypes) else 'None'
+    enum = array_str_to_enum(array_type)  # type: ignore
+
+    if PSDataArray.SupportedDefaultUnit(enum):
+        psunit = PSDataArray.GetDefaultUnit(enum)
+    else:
+        psunit = CustomSIUnit(unit, quantity, unit)
+
+    psarray = PSDataArray(quantity, psunit, enum)
+    _extend_psarray(psarray, values)
+    return psarray
+
+
+def _extend_psarray(psarray: PSDataArray, values: np.ndarray) -> None:
+    """Append values to .NET data array."""
+    psarray.AddRange(
+        System.Array[IDataValue]([GenericValue(value) for value in values.tolist()])
+    )
+
+
+def _parse_values(chunks: list[bytes], n_columns: int) -> np.ndarray:
+    """Parse the data values of all rows for a curve or EIS data set at once."""
+    if not chunks:
+        return np.empty((0, n_columns))
+
+    # Non-finite values are written as null
+    joined = b','.join(chunks).replace(b'null', b'nan').decode()
+    values = np.fromstring(joined, sep=',')
+
+    if values.size == len(chunks) * n_columns:
+        return values.reshape(-1, n_columns)
+
+    # Rows with a different number of values, parse row by row and pad with nan
+    data = np.full((len(chunks), n_columns), np.nan)
+    for i, chunk in enumerate(chunks):
+        row = json.loads(b'[' + chunk.replace(b'null', b'NaN') + b']')[:n_columns]
+        data[i, : len(row)] = row
+    return data
+
+
+def recover_stream(path: str | Path, session: str | Path | None = None) -> RecoveredMeasurement:
+    """Recover measurement data from a data stream file.
+
+    Reads a file written by `measure(stream=...)`, for example after a crash or power
+    outage. An incomplete last line is skipped.
+
+    For a stream written in segments with `DataStream`, pass the manifest
+    (e.g. `run.manifest.json`) to read all segments. Segments compressed
+    with gzip (.gz) are decompressed.
+
+    Parameters
+    ----------
+    path : str | Path
+        Path to the data stream file (.jsonl), segment (.jsonl.gz), or manifest
+        (.manifest.json).
+    session : str | Path, optional
+        If specified, also save the recovered measurement to this session file (.pssession).
+        Only curves are saved, see `RecoveredMeasurement.to_measurement()`.
+
+    Returns
+    -------
+    measurement : RecoveredMeasurement
+        Recovered metadata with the curve and EIS data as numpy arrays.
+    """
+    path = Path(path)
+
+    if path.name.endswith('.manifest.json'):
+        raw = _read_segments(path)
+    else:
+        raw = _read_bytes(path)
+
+    complete, _, last = raw.rpartition(b'\n')
+    truncated = False
+
+    if last.strip():
+        # The newline is missing after the last line, or the line was cut off
+        try:
+            _ = json.loads(last)
+        except ValueError:
+            truncated = True
+        else:
+            complete = raw
+
+    # Split the values from the rows without parsing them,
+    # all values of a curve are parsed at once by numpy
+    chunks: defaultdict[bytes, list[bytes]] = defaultdict(list)
+
+    for id, values in _ROW_PATTERN.findall(complete):
+        chunks[id].append(values)
+
+    rows = {int(id): values for id, values in chunks.items()}
+
+    measurement_metadata = None
+    curves = []
+    eis_data = []
+    seen: set[int] = set()
+
+    for line in _METADATA_PATTERN.findall(complete):
+        parsed = _metadata_adapter.validate_json(line)
+
+        if isinstance(parsed, MeasurementMetadata):
+            measurement_metadata = parsed
+        elif parsed.id in seen:
+            # Metadata are repeated at the start of every segment
+            continue
+        elif isinstance(parsed, CurveMetadata):
+            seen.add(parsed.id)
+            data = _parse_values(rows.pop(parsed.id, []), len(parsed.columns))
+            curves.append(RecoveredCurve(metadata=parsed, data=data))
+        elif isinstance(parsed, EISDataMetadata):
+            seen.add(parsed.id)
+            data = _parse_values(rows.pop(parsed.id, []), len(parsed.columns))
+            eis_data.append(RecoveredEISData(metadata=parsed, data=data))
+
+    recovered = RecoveredMeasurement(
+        metadata=measurement_metadata,
+        curves=curves,
+        eis_data=eis_data,
+        truncated=truncated,
+        n_skipped=sum(len(values) for values in rows.values()),
+    )
+
+    if session:
+        save_session_file(session, [recovered.to_measurement()])
+
+    return recovered
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
-from .capabilities import AnalogComponent, Capabilities
-from .instrument import Instrument, discover, discover_async
+from .broadcast import LivePublisher, LiveSubscriber
+from .capabilities import AnalogComponent, Capabilities, CapabilitiesStore
+from .discovery import DiscoveryCache, DiscoveryEvent, InstrumentWatcher
+from .dispatch import CallbackMetrics, run_in_executor
+from .health import Backoff, HealthEvent, PoolMonitor
+from .instrument import Instrument, discover, discover_async, discover_iter_async
 from .instrument_manager import (
     InstrumentManager,
     connect,
@@ -14,19 +18,53 @@ from .instrument_manager_async import (
 )
 from .instrument_pool import InstrumentPool
 from .instrument_pool_async import InstrumentPoolAsync
+from .live_buffer import LiveBuffer
+from .mux_sweep import MuxSweep
+from .process_pool import InstrumentProcessPoolAsync
+from .rpc import InstrumentClient, InstrumentServer, RemoteError, RemoteInstrumentManager
+from .scheduler import JobConstraints, JobScheduler
+from .shared import MeasurementTimeoutError
+from .simulated import SimulatedInstrument
+from .status_recorder import StatusRecorder
+from .watchdog import Watchdog
 
 __all__ = [
     'connect',
     'connect_async',
     'discover',
     'discover_async',
+    'discover_iter_async',
     'measure',
     'measure_async',
+    'run_in_executor',
+    'Backoff',
+    'CallbackMetrics',
     'Capabilities',
+    'CapabilitiesStore',
     'AnalogComponent',
+    'DiscoveryCache',
+    'DiscoveryEvent',
+    'HealthEvent',
     'Instrument',
+    'InstrumentClient',
+    'InstrumentServer',
+    'InstrumentWatcher',
+    'JobConstraints',
+    'JobScheduler',
     'InstrumentManager',
     'InstrumentManagerAsync',
     'InstrumentPool',
     'InstrumentPoolAsync',
+    'InstrumentProcessPoolAsync',
+    'LiveBuffer',
+    'LivePublisher',
+    'LiveSubscriber',
+    'MeasurementTimeoutError',
+    'MuxSweep',
+    'PoolMonitor',
+    'RemoteError',
+    'RemoteInstrumentManager',
+    'SimulatedInstrument',
+    'StatusRecorder',
+    'Watchdog',
 ]
@@ -0,0 +1,421 @@
+from __future__ import annotations
+
+import asyncio
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal
+
+import numpy as np
+from typing_extensions import override
+
+if TYPE_CHECKING:
+    from .callback import CallbackData, CallbackDataEIS
+
+Address = str | Path | tuple[str, int]
+"""Unix domain socket path, or `(host, port)` tuple for TCP."""
+
+AllowedBatchKinds = Literal['curve', 'eis', 'end']
+
+_KINDS: tuple[AllowedBatchKinds, ...] = ('curve', 'eis', 'end')
+
+# Frame layout (little endian):
+#   uint32   payload length
+#   uint8    kind, index into `_KINDS`
+#   int64    curve or EIS data identifier
+#   int64    index of the first row
+#   uint32   number of rows
+#   uint8    number of columns
+#   source and column names, each as uint16 length + utf-8
+#   float64  data, row by row
+_LENGTH = struct.Struct('<I')
+_HEADER = struct.Struct('<BqqIB')
+_STR_LENGTH = struct.Struct('<H')
+
+
+def _pack_str(value: str) -> bytes:
+    encoded = value.encode()
+
+    if len(encoded) > 0xFFFF:
+        raise ValueError(
+            f'Cannot publish {value[:20]!r}..., names are limited to 65535 bytes in utf-8'
+        )
+
+    return _STR_LENGTH.pack(len(encoded)) + encoded
+
+
+@dataclass(frozen=True, slots=True)
+class LiveBatch:
+    """Batch of new data published by a `LivePublisher`."""
+
+    kind: AllowedBatchKinds
+    """Type of batch, 'curve' or 'eis' for new data, 'end' at the end of a measurement."""
+
+    source: str
+    """Name of the channel that produced the data."""
+
+    id: int
+    """Curve or EIS data identifier."""
+
+    start: int
+    """Index of the first row in the curve or EIS data set."""
+
+    names: tuple[str, ...]
+    """Column names."""
+
+    data: np.ndarray
+    """Array with shape `(n_rows, n_columns)`."""
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        """Return column by name."""
+        return self.data[:, self.names.index(name)]
+
+    def _encode(self) -> bytes:
+        """Encode batch as binary frame."""
+        data = np.ascontiguousarray(self.data, dtype='<f8')
+        n_rows, n_columns = data.shape
+
+        payload = b''.join(
+            (
+                _HEADER.pack(_KINDS.index(self.kind), self.id, self.start, n_rows, n_columns),
+                _pack_str(self.source),
+                *(_pack_str(name) for name in self.names),
+                data.tobytes(),
+            )
+        )
+        return _LENGTH.pack(len(payload)) + payload
+
+    @classmethod
+    def _decode(cls, payload: bytes) -> LiveBatch:
+        """Decode binary frame, without the length prefix."""
+        kind, id, start, n_rows, n_columns = _HEADER.unpack_from(payload)
+        offset = _HEADER.size
+
+        strings = []
+        for _ in range(n_columns + 1):
+            (length,) = _STR_LENGTH.unpack_from(payload, offset)
+            offset += _STR_LENGTH.size
+            strings.append(payload[offset : offset + length].decode())
+            offset += length
+
+        data = np.frombuffer(payload, dtype='<f8', offset=offset, count=n_rows * n_columns)
+
+        return cls(
+            kind=_KINDS[kind],
+            source=strings[0],
+            id=id,
+            start=start,
+            names=tuple(strings[1:]),
+            data=data.reshape(n_rows, n_columns),
+        )
+
+
+class LiveSubscription:
+    """Async iterator over the batches of a `LivePublisher` in the same process.
+
+    Use `LivePublisher.subscribe()` to create one.
+
+    If the consumer cannot keep up, the oldest batches are dropped,
+    see `n_dropped`."""
+
+    def __init__(self, max_queue: int):
+        self._queue: asyncio.Queue[LiveBatch | bytes | None] = asyncio.Queue(max_queue)
+        self._closed: bool = False
+
+        self.n_dropped: int = 0
+        """Number of batches dropped because the queue was full."""
+
+    def _put(self, item: LiveBatch | bytes | None) -> None:
+        if self._queue.full():
+            _ = self._queue.get_nowait()
+            self.n_dropped += 1
+        self._queue.put_nowait(item)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> LiveBatch:
+        item = None if self._closed else await self._queue.get()
+
+        if item is None:
+            self._closed = True
+            raise StopAsyncIteration
+
+        assert isinstance(item, LiveBatch)
+        return item
+
+
+class _RemoteSubscription(LiveSubscription):
+    """Queue of encoded frames for a connected `LiveSubscriber`."""
+
+
+class LivePublisher:
+    """Broadcast live measurement data to other processes on this computer.
+
+    Assign the publisher to `InstrumentManagerAsync.publisher` or
+    `InstrumentManager.publisher` to publish the new data of every
+    measurement. Subscribers connect with `LiveSubscriber`, or
+    call `subscribe()` in the same process.
+
+    Every subscriber has its own bounded queue. If a subscriber cannot keep up,
+    its oldest batches are dropped, so that slow subscribers never
+    delay the measurement or other subscribers.
+
+    Parameters
+    ----------
+    address : str | Path | tuple[str, int]
+        Path to a Unix domain socket, or `(host, port)` for TCP.
+        Use port 0 to pick a free port, see `address` after `start()`.
+    max_queue : int
+        Maximum number of batches queued per subscriber.
+    """
+
+    def __init__(
+        self,
+        address: Address = ('127.0.0.1', 0),
+        *,
+        max_queue: int = 1024,
+    ):
+        self._address: Address = address
+        self.max_queue: int = max_queue
+
+        self._server: asyncio.Server | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._subscriptions: set[LiveSubscription] = set()
+        self._n_remote: int = 0
+
+        self.n_published: int = 0
+        """Number of batches published."""
+
+    @override
+    def __repr__(self):
+        return f'{type(self).__name__}(address={self.address!r}, subscribers={len(self._subscriptions)})'
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    @property
+    def address(self) -> Address:
+        """Address subscribers connect to."""
+        if self._server is not None and isinstance(self._address, tuple):
+            return self._server.sockets[0].getsockname()[:2]
+        return self._address
+
+    @property
+    def n_dropped(self) -> int:
+        """Number of batches dropped for current subscribers."""
+        return sum(subscription.n_dropped for subscription in self._subscriptions)
+
+    async def start(self) -> None:
+        """Start accepting subscribers on the running event loop."""
+        self._loop = asyncio.get_running_loop()
+
+        if isinstance(self._address, tuple):
+            host, port = self._address
+            self._server = await asyncio.start_server(self._handle_subscriber, host, port)
+        else:
+            self._server = await asyncio.start_unix_server(
+                self._handle_subscriber, str(self._address)
+            )
+
+    async def close(self) -> None:
+        """Stop the server and end all subscriptions, removes the Unix domain socket."""
+        for subscription in self._subscriptions:
+            subscription._put(None)
+
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+            if not isinstance(self._address, tuple):
+                Path(self._address).unlink(missing_ok=True)
+
+    def subscribe(self) -> LiveSubscription:
+        """Subscribe from within this process.
+
+        Returns
+        -------
+        subscription : LiveSubscription
+            Async iterator over new batches.
+        """
+        subscription = LiveSubscription(self.max_queue)
+        self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: LiveSubscription) -> None:
+        """End subscription."""
+        subscription._put(None)
+        self._subscriptions.discard(subscription)
+
+    def publish(self, batch: LiveBatch) -> None:
+        """Publish batch to all subscribers, can be called from any thread.
+
+        Parameters
+        ----------
+        batch : LiveBatch
+            Batch to publish.
+        """
+        if not self._subscriptions or self._loop is None:
+            return
+
+        # Encode once for all remote subscribers
+        frame = batch._encode() if self._n_remote else None
+
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        if running_loop is self._loop:
+            self._fan_out(batch, frame)
+        else:
+            _ = self._loop.call_soon_threadsafe(self._fan_out, batch, frame)
+
+    def _fan_out(self, batch: LiveBatch, frame: bytes | None) -> None:
+        self.n_published += 1
+
+        for subscription in self._subscriptions:
+            if isinstance(subscription, _RemoteSubscription):
+                if frame is not None:
+                    subscription._put(frame)
+            else:
+                subscription._put(batch)
+
+    def _publish_curve_data(self, source: str, data: CallbackData) -> None:
+        """Publish new curve data, called by the measurement manager."""
+        self.publish(
+            LiveBatch(
+                kind='curve',
+                source=source,
+                id=data.id,
+                start=data.start,
+                names=('x', 'y'),
+                data=data.new_block(),
+            )
+        )
+
+    def _publish_eis_data(self, source: str, data: CallbackDataEIS) -> None:
+        """Publish new EIS data, called by the measurement manager."""
+        columns = data.new_columns()
+
+        self.publish(
+            LiveBatch(
+                kind='eis',
+                source=source,
+                id=data.id,
+                start=data.start,
+                names=tuple(columns),
+                data=np.column_stack(tuple(columns.values())),
+            )
+        )
+
+    def _publish_end(self, source: str) -> None:
+        """Publish end of measurement, called by the measurement manager."""
+        self.publish(
+            LiveBatch(
+                kind='end',
+                source=source,
+                id=0,
+                start=0,
+                names=(),
+                data=np.empty((0, 0)),
+            )
+        )
+
+    async def _handle_subscriber(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        """Send frames to a connected subscriber until it disconnects."""
+        subscription = _RemoteSubscription(self.max_queue)
+        self._subscriptions.add(subscription)
+        self._n_remote += 1
+
+        try:
+            while (frame := await subscription._queue.get()) is not None:
+                assert isinstance(frame, bytes)
+                writer.write(frame)
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self._subscriptions.discard(subscription)
+            self._n_remote -= 1
+            writer.close()
+
+
+class LiveSubscriber:
+    """Receive live measurement data from a `LivePublisher` in another process.
+
+    Iterate over the subscriber to receive the batches, for example:
+
+        async with ps.LiveSubscriber(('127.0.0.1', 8765)) as subscriber:
+            async for batch in subscriber:
+                print(batch.source, batch['y'].mean())
+
+    Parameters
+    ----------
+    address : str | Path | tuple[str, int]
+        Address of the publisher, see `LivePublisher.address`.
+    """
+
+    def __init__(self, address: Address):
+        self.address: Address = address
+
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+
+    @override
+    def __repr__(self):
+        return f'{type(self).__name__}(address={self.address!r}, connected={self._reader is not None})'
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def connect(self) -> None:
+        """Connect to the publisher."""
+        if isinstance(self.address, tuple):
+            host, port = self.address
+            self._reader, self._writer = await asyncio.open_connection(host, port)
+        else:
+            self._reader, self._writer = await asyncio.open_unix_connection(str(self.address))
+
+    async def close(self) -> None:
+        """Disconnect from the publisher."""
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except ConnectionError:
+                pass
+
+        self._reader = None
+        self._writer = None
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> LiveBatch:
+        if self._reader is None:
+            raise StopAsyncIteration
+
+        try:
+            (length,) = _LENGTH.unpack(await self._reader.readexactly(_LENGTH.size))
+            payload = await self._reader.readexactly(length)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            raise StopAsyncIteration
+
+        return LiveBatch._decode(payload)
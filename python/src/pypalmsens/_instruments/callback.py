@@ -3,6 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any, Generator, Literal, Protocol
 
+import numpy as np
 import PalmSens
 from PalmSens.Comm import StatusEventArgs
 from typing_extensions import override
@@ -41,48 +42,201 @@ class CallbackData:
     id: int = 0
     """Curve identifier."""
 
+    _stop: int | None = field(default=None, repr=False)
+    """End of the new data (exclusive). If None, use the current length of the arrays."""
+
     @property
     def index(self) -> int:
         """Index of last point."""
+        if self._stop is not None:
+            return self._stop - 1
         return len(self.x_array) - 1
 
+    def last_datapoint(self) -> dict[str, Any]:
+        """Return last measured data point."""
+        index = self.index
+        return {
+            'index': index,
+            'x': self.x_array[index],
+            'y': self.y_array[index],
+        }
+
+    @property
+    def last_x(self) -> float:
+        """Return last measured x value."""
+        return self.x_array[self.index]
+
+    @property
+    def last_y(self) -> float:
+        """Return last measured y value."""
+        return self.y_array[self.index]
+
+    def new_x(self) -> np.ndarray:
+        """Return new x values since last callback as numpy array."""
+        return self.x_array._to_numpy_range(self.start, self.index + 1)
+
+    def new_y(self) -> np.ndarray:
+        """Return new y values since last callback as numpy array."""
+        return self.y_array._to_numpy_range(self.start, self.index + 1)
+
+    def new_block(self) -> np.ndarray:
+        """Return new data points since last callback as numpy array.
+
+        The array has shape `(n, 2)`, with the x values in the first
+        and the y values in the second column. Unlike `new_x()` and `new_y()`,
+        both columns are guaranteed to have the same length.
+        """
+        stop = min(self.index + 1, len(self.y_array))
+        return np.column_stack(
+            (
+                self.x_array._to_numpy_range(self.start, stop),
+                self.y_array._to_numpy_range(self.start, stop),
+            )
+        )
+
+    def new_datapoints(self) -> Generator[dict[str, Any]]:
+        """Return new data points since last callback."""
+        return _block_datapoints(self.new_block(), self.start)
+
+    def _streaming_rows(self) -> Generator[DataRow]:
+        """Return new data points for data stream."""
+        return _block_rows(self.new_block(), self.id)
+
+    def _detach(self) -> DetachedCallbackData:
+        """Return a copy of the new data that does not reference .NET objects.
+
+        The copy can be pickled, e.g. to pass it to a process pool."""
+        block = self.new_block()
+        return DetachedCallbackData(
+            x=block[:, 0].copy(),
+            y=block[:, 1].copy(),
+            start=self.start,
+            id=self.id,
+        )
+
+    @override
+    def __str__(self):
+        return str(self.last_datapoint())
+
+
+@dataclass(slots=True)
+class DetachedCallbackData:
+    """New data of a curve, copied from the .NET arrays.
+
+    Callbacks that run in another process (see `run_in_executor()` and
+    `InstrumentProcessPoolAsync`) or on a remote instrument server receive this
+    class instead of `CallbackData`. It only holds the points since the last call,
+    and does not give access to the complete data arrays."""
+
+    x: np.ndarray
+    """New x values, from `start` to `index`."""
+
+    y: np.ndarray
+    """New y values, from `start` to `index`."""
+
+    start: int
+    """Start index for the new data."""
+
+    id: int = 0
+    """Curve identifier."""
+
+    @property
+    def index(self) -> int:
+        """Index of last point."""
+        return self.start + len(self.x) - 1
+
     def last_datapoint(self) -> dict[str, Any]:
         """Return last measured data point."""
         return {
             'index': self.index,
-            'x': self.x_array[-1],
-            'y': self.y_array[-1],
+            'x': self.last_x,
+            'y': self.last_y,
         }
 
     @property
     def last_x(self) -> float:
         """Return last measured x value."""
-        return self.x_array[-1]
+        return float(self.x[-1])
 
     @property
     def last_y(self) -> float:
         """Return last measured y value."""
-        return self.y_array[-1]
+        return float(self.y[-1])
+
+    def new_x(self) -> np.ndarray:
+        """Return new x values since last callback as numpy array."""
+        return self.x
+
+    def new_y(self) -> np.ndarray:
+        """Return new y values since last callback as numpy array."""
+        return self.y
+
+    def new_block(self) -> np.ndarray:
+        """Return new data points since last callback as numpy array of shape `(n, 2)`."""
+        return np.column_stack((self.x, self.y))
 
     def new_datapoints(self) -> Generator[dict[str, Any]]:
         """Return new data points since last callback."""
-        for i in range(self.start, self.index + 1):
-            yield {
-                'x': self.x_array[i],
-                'y': self.y_array[i],
-                'index': i,
-            }
+        return _block_datapoints(self.new_block(), self.start)
 
     def _streaming_rows(self) -> Generator[DataRow]:
         """Return new data points for data stream."""
-        for i in range(self.start, self.index + 1):
-            yield DataRow(id=self.id, data=[self.x_array[i], self.y_array[i]])
+        return _block_rows(self.new_block(), self.id)
 
     @override
     def __str__(self):
         return str(self.last_datapoint())
 
 
+class CallbackDataProtocol(Protocol):
+    """New curve data passed to a callback, `CallbackData` or `DetachedCallbackData`."""
+
+    @property
+    def start(self) -> int:
+        """Start index for the new data."""
+        ...
+
+    @property
+    def id(self) -> int:
+        """Curve identifier."""
+        ...
+
+    @property
+    def index(self) -> int:
+        """Index of last point."""
+        ...
+
+    @property
+    def last_x(self) -> float:
+        """Return last measured x value."""
+        ...
+
+    @property
+    def last_y(self) -> float:
+        """Return last measured y value."""
+        ...
+
+    def last_datapoint(self) -> dict[str, Any]:
+        """Return last measured data point."""
+        ...
+
+    def new_x(self) -> np.ndarray:
+        """Return new x values since last callback as numpy array."""
+        ...
+
+    def new_y(self) -> np.ndarray:
+        """Return new y values since last callback as numpy array."""
+        ...
+
+    def new_block(self) -> np.ndarray:
+        """Return new data points since last callback as numpy array of shape `(n, 2)`."""
+        ...
+
+    def new_datapoints(self) -> Generator[dict[str, Any]]:
+        """Return new data points since last callback."""
+        ...
+
+
 @dataclass(slots=True)
 class CallbackDataEIS:
     """Data returned by the EIS new data callback."""
@@ -99,36 +253,169 @@ class CallbackDataEIS:
     id: int = 0
     """EIS Data object id."""
 
+    _columns: list[DataArray] | None = field(default=None, repr=False)
+    """Non-derived arrays in the dataset, shared between callbacks for the same EIS data."""
+
+    def _arrays(self) -> list[DataArray]:
+        """Return non-derived arrays in the dataset."""
+        if self._columns is None:
+            self._columns = [array for array in self.data.values() if not array.is_derived]
+        return self._columns
+
+    def last_datapoint(self) -> dict[str, float]:
+        """Return last measured data point."""
+        ret = {array.name: array[self.index] for array in self._arrays()}
+        ret['index'] = self.index
+        return ret
+
+    def new_columns(self) -> dict[str, np.ndarray]:
+        """Return new data since last callback as numpy arrays.
+
+        Derived arrays (e.g. admittance, capacitance) are not included.
+
+        Returns
+        -------
+        columns : dict[str, np.ndarray]
+            New values from `start` to `index` keyed by the array name.
+        """
+        stop = self.index + 1
+        return {array.name: array._to_numpy_range(self.start, stop) for array in self._arrays()}
+
+    def new_datapoints(self) -> Generator[dict[str, float]]:
+        """Return new data points since last callback."""
+        return _column_datapoints(self.new_columns(), self.start)
+
+    def _streaming_rows(self) -> Generator[DataRow]:
+        """Return new data points for data stream."""
+        return _column_rows(self.new_columns(), self.id)
+
+    def _detach(self) -> DetachedCallbackDataEIS:
+        """Return a copy of the new data that does not reference .NET objects.
+
+        The copy can be pickled, e.g. to pass it to a process pool."""
+        return DetachedCallbackDataEIS(
+            columns=self.new_columns(),
+            start=self.start,
+            index=self.index,
+            id=self.id,
+        )
+
+    @override
+    def __str__(self):
+        return str(self.last_datapoint())
+
+
+@dataclass(slots=True)
+class DetachedCallbackDataEIS:
+    """New EIS data, copied from the .NET dataset.
+
+    Callbacks that run in another process or on a remote instrument server
+    receive this class instead of `CallbackDataEIS`, see `DetachedCallbackData`."""
+
+    columns: dict[str, np.ndarray]
+    """New values from `start` to `index` keyed by the array name."""
+
+    start: int
+    """Start index for the new data."""
+
+    index: int
+    """Index of last point."""
+
+    id: int = 0
+    """EIS Data object id."""
+
     def last_datapoint(self) -> dict[str, float]:
         """Return last measured data point."""
-        ret = {
-            array.name: array[self.index]
-            for array in self.data.arrays()
-            if not array.is_derived
-        }
+        ret = {name: float(values[-1]) for name, values in self.columns.items()}
         ret['index'] = self.index
         return ret
 
+    def new_columns(self) -> dict[str, np.ndarray]:
+        """Return new data since last callback as numpy arrays."""
+        return dict(self.columns)
+
     def new_datapoints(self) -> Generator[dict[str, float]]:
         """Return new data points since last callback."""
-        for i in range(self.start, self.index + 1):
-            ret = {array.name: array[i] for array in self.data.values() if not array.is_derived}
-            ret['index'] = i
-            yield ret
+        return _column_datapoints(self.new_columns(), self.start)
 
     def _streaming_rows(self) -> Generator[DataRow]:
         """Return new data points for data stream."""
-        for i in range(self.start, self.index + 1):
-            data = [array[i] for array in self.data.values() if not array.is_derived]
-            yield DataRow(id=self.id, data=data)
+        return _column_rows(self.new_columns(), self.id)
 
     @override
     def __str__(self):
         return str(self.last_datapoint())
 
 
+class CallbackDataEISProtocol(Protocol):
+    """New EIS data passed to a callback, `CallbackDataEIS` or `DetachedCallbackDataEIS`."""
+
+    @property
+    def start(self) -> int:
+        """Start index for the new data."""
+        ...
+
+    @property
+    def index(self) -> int:
+        """Index of last point."""
+        ...
+
+    @property
+    def id(self) -> int:
+        """EIS Data object id."""
+        ...
+
+    def last_datapoint(self) -> dict[str, float]:
+        """Return last measured data point."""
+        ...
+
+    def new_columns(self) -> dict[str, np.ndarray]:
+        """Return new data since last callback as numpy arrays."""
+        ...
+
+    def new_datapoints(self) -> Generator[dict[str, float]]:
+        """Return new data points since last callback."""
+        ...
+
+
+def _block_datapoints(block: np.ndarray, start: int) -> Generator[dict[str, Any]]:
+    for i, (x, y) in enumerate(block.tolist(), start=start):
+        yield {
+            'x': x,
+            'y': y,
+            'index': i,
+        }
+
+
+def _block_rows(block: np.ndarray, id: int) -> Generator[DataRow]:
+    for row in block.tolist():
+        yield DataRow(id=id, data=row)
+
+
+def _column_datapoints(
+    columns: dict[str, np.ndarray], start: int
+) -> Generator[dict[str, float]]:
+    values = {name: column.tolist() for name, column in columns.items()}
+    n = len(next(iter(values.values()), []))
+
+    for i in range(n):
+        ret = {name: column[i] for name, column in values.items()}
+        ret['index'] = start + i
+        yield ret
+
+
+def _column_rows(columns: dict[str, np.ndarray], id: int) -> Generator[DataRow]:
+    values = [column.tolist() for column in columns.values()]
+
+    for row in zip(*values):
+        yield DataRow(id=id, data=list(row))
+
+
 class Callback(Protocol):
-    """Type signature for callback."""
+    """Type signature for callback.
+
+    The synchronous `measure()` calls it on the calling thread, the async API
+    and `measure_nowait()` on the event loop thread."""
 
     def __call__(self, data: CallbackData) -> None: ...
 
@@ -139,6 +426,18 @@ class CallbackEIS(Protocol):
     def __call__(self, data: CallbackDataEIS) -> None: ...
 
 
+class DetachedCallback(Protocol):
+    """Type signature for callback in another process or on a remote server."""
+
+    def __call__(self, data: CallbackDataProtocol) -> None: ...
+
+
+class DetachedCallbackEIS(Protocol):
+    """Type signature for callback EIS in another process or on a remote server."""
+
+    def __call__(self, data: CallbackDataEISProtocol) -> None: ...
+
+
 @dataclass(slots=True)
 class Status:
     """Device Status class."""
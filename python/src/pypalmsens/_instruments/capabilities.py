@@ -1,20 +1,75 @@
 from __future__ import annotations
 
-from typing import Literal
+import os
+import re
+from pathlib import Path
+from typing import Any, Iterator, Literal, Protocol, runtime_checkable
 
+import clr
 import PalmSens
-from pydantic import BaseModel, ConfigDict, computed_field
+import System
+from PalmSens.Comm import enumDeviceType
+from PalmSens.Devices import DeviceCapabilities, GetDeviceCapabilities
+from pydantic import BaseModel, ConfigDict, PrivateAttr, computed_field
+from System.Collections.Generic import List
+from System.Reflection import BindingFlags
+from typing_extensions import override
 
 from .._converters import (
     cr_enum_to_string,
+    cr_string_to_enum,
     pr_enum_to_string,
+    pr_string_to_enum,
     single_to_double,
 )
+from .._methods.cache import psmethod_cache
 from .._types import (
     AllowedCurrentRanges,
     AllowedMethods,
     AllowedPotentialRanges,
+    MethodTypeCompatible,
 )
+from .shared import MethodIncompatibleError
+
+_LICENSE_FIELD = '#=zwx6eHG3b1LR8wq0g$g=='
+"""Name of the private license mask field of `DeviceCapabilities`."""
+
+
+def _license_field() -> System.Reflection.FieldInfo:
+    """Return the license mask field, raise if the SDK no longer has it."""
+    flags = BindingFlags.Instance | BindingFlags.NonPublic
+    psfield = clr.GetClrType(DeviceCapabilities).GetField(_LICENSE_FIELD, flags)
+
+    if psfield is None or psfield.FieldType != clr.GetClrType(System.UInt64):
+        raise RuntimeError(
+            f'License mask `{_LICENSE_FIELD}` not found in `DeviceCapabilities`.'
+        )
+
+    return psfield
+
+
+def get_license_mask(capabilities: DeviceCapabilities) -> int:
+    """Return the mask of licensed features of the device."""
+    return int(_license_field().GetValue(capabilities))
+
+
+def set_license_mask(capabilities: DeviceCapabilities, mask: int) -> None:
+    """Set the mask of licensed features of the device."""
+    _license_field().SetValue(capabilities, System.UInt64(mask))
+
+
+@runtime_checkable
+class CommProtocol(Protocol):
+    """Attributes of the comm manager read by `CapabilitiesInterface`."""
+
+    @property
+    def Capabilities(self) -> DeviceCapabilities: ...
+
+    @property
+    def ClientConnection(self) -> Any: ...
+
+    @property
+    def DeviceSerial(self) -> Any: ...
 
 
 class AnalogComponent(BaseModel):
@@ -70,7 +125,7 @@ class AnalogComponent(BaseModel):
 class CapabilitiesInterface(BaseModel):
     """Interface to convert from PalmSens.Devices.Capabilities to dataclass."""
 
-    comm: PalmSens.Comm.CommManager
+    comm: CommProtocol
 
     model_config = {'arbitrary_types_allowed': True}
 
@@ -102,7 +157,7 @@ class CapabilitiesInterface(BaseModel):
     @computed_field
     @property
     def connection(self) -> str:
-        return self.comm.Capabilities.ConnDescription
+        return self.comm.Capabilities.ConnDescription or ''
 
     @computed_field
     @property
@@ -152,7 +207,7 @@ class CapabilitiesInterface(BaseModel):
     @computed_field
     @property
     def firmware_build_date(self) -> str:
-        return self.comm.Capabilities.FirmwareTimeStamp
+        return self.comm.Capabilities.FirmwareTimeStamp or ''
 
     @computed_field
     @property
@@ -167,7 +222,7 @@ class CapabilitiesInterface(BaseModel):
     @computed_field
     @property
     def firmware_special_description(self) -> str:
-        return self.comm.Capabilities.SpecialFirmwareDescription
+        return self.comm.Capabilities.SpecialFirmwareDescription or ''
 
     @computed_field
     @property
@@ -179,6 +234,11 @@ class CapabilitiesInterface(BaseModel):
     def hardware_revision(self) -> int:
         return self.comm.Capabilities.HardwareRevision
 
+    @computed_field
+    @property
+    def license_mask(self) -> int:
+        return get_license_mask(self.comm.Capabilities)
+
     @computed_field
     @property
     def max_v_aux(self) -> float:
@@ -382,6 +442,9 @@ class Capabilities(BaseModel):
     hardware_revision: int
     """Gets the hardware revision."""
 
+    license_mask: int
+    """Bit mask of the features licensed on this device, such as EIS and GEIS."""
+
     max_v_aux: float
     """Maximum potential output of the AUX port in V."""
 
@@ -454,11 +517,218 @@ class Capabilities(BaseModel):
     supports_ir_drop_compensation: bool
     """Whether the device supports IR Drop compensation"""
 
+    _pscapabilities: DeviceCapabilities | None = PrivateAttr(default=None)
+
+    @override
+    def __eq__(self, other: object) -> bool:
+        # The cached .NET object is not part of the value
+        if not isinstance(other, Capabilities):
+            return NotImplemented
+        return self.__dict__ == other.__dict__
+
     @classmethod
-    def _from_comm(cls, comm: PalmSens.Comm.CommManager) -> Capabilities:
+    def _from_comm(cls, comm: CommProtocol) -> Capabilities:
         """Initialize model from comm manager."""
         interface = CapabilitiesInterface(comm=comm)
-        return cls.model_validate(interface.model_dump())
+        capabilities = cls.model_validate(interface.model_dump())
+        capabilities._pscapabilities = comm.Capabilities
+        return capabilities
+
+    def _to_pscapabilities(self) -> DeviceCapabilities:
+        """Return dotnet capabilities, rebuilt from the device type if loaded from file.
+
+        The rebuilt capabilities have the defaults of the device type,
+        with the firmware version, licenses, feature flags and ranges of this device.
+        """
+        if self._pscapabilities is not None:
+            return self._pscapabilities
+
+        device_type = getattr(enumDeviceType, self.device_type)
+        pscapabilities = GetDeviceCapabilities.GetCapabilities(device_type, None)
+
+        pscapabilities.FirmwareVersion = self.firmware_version
+        set_license_mask(pscapabilities, self.license_mask)
+        pscapabilities.BiPotPresent = self.has_bipot
+        pscapabilities.IsSlaveChannel = self.is_hw_sync_slave
+        pscapabilities.IsHardwareSynchronizationMaster = self.is_hw_sync_master
+        pscapabilities.SupportsIRDropComp = self.supports_ir_drop_compensation
+
+        pscapabilities.SupportedRanges = _current_ranges(self.supported_current_ranges)
+        pscapabilities.SupportedAppliedRanges = _current_ranges(
+            self.supported_applied_current_ranges
+        )
+        pscapabilities.SupportedBipotRanges = _current_ranges(
+            self.supported_bipot_current_ranges
+        )
+        pscapabilities.SupportedPotentialRanges = _potential_ranges(
+            self.supported_potential_ranges
+        )
+
+        self._pscapabilities = pscapabilities
+        return pscapabilities
+
+    def validate_method(self, method: PalmSens.Method | MethodTypeCompatible) -> None:
+        """Validate method against these capabilities, also without connection.
+
+        Raise `MethodIncompatibleError` if the method cannot be validated.
+
+        Parameters
+        -----------
+        method: MethodType
+            The method to validate.
+        """
+        validate_method(method, self._to_pscapabilities())
+
+    def get_estimated_duration(
+        self,
+        method: PalmSens.Method | MethodTypeCompatible,
+        include_pretreatment: bool = False,
+    ) -> float:
+        """Get the estimated duration for this method, also without connection.
+
+        Parameters
+        -----------
+        method : MethodType
+            The method to get the estimated duration for.
+        include_pretreatment : bool
+            If True, add the estimated duration of the pretreatment phase and,
+            if versus OCP is enabled, the maximum OCP time.
+
+        Returns
+        -------
+        float
+            Estimated duration in seconds.
+        """
+        return estimated_duration(
+            method, self._to_pscapabilities(), include_pretreatment=include_pretreatment
+        )
+
+
+def validate_method(
+    method: PalmSens.Method | MethodTypeCompatible, capabilities: DeviceCapabilities
+) -> None:
+    """Raise `MethodIncompatibleError` if the method has fatal validation errors."""
+    with psmethod_cache.lease(method) as psmethod:
+        errors = psmethod.Validate(capabilities)
+
+    if any(error.IsFatal for error in errors):
+        message = '\n'.join([error.Message for error in errors])
+        raise MethodIncompatibleError(f'Method not compatible:\n{message}')
+
+
+def estimated_duration(
+    method: PalmSens.Method | MethodTypeCompatible,
+    capabilities: DeviceCapabilities,
+    include_pretreatment: bool = False,
+) -> float:
+    """Return the estimated duration of the method in seconds."""
+    with psmethod_cache.lease(method) as psmethod:
+        duration = psmethod.GetMinimumEstimatedMeasurementDuration(capabilities)
+
+        if include_pretreatment:
+            duration += psmethod.PretreatmentDuration
+
+            if psmethod.OCPmode:
+                duration += psmethod.OCPMaxOCPTime
+
+    return duration
+
+
+def _current_ranges(ranges: list[AllowedCurrentRanges]) -> List[PalmSens.CurrentRange]:
+    psranges = List[PalmSens.CurrentRange]()
+    for item in ranges:
+        psranges.Add(cr_string_to_enum(item))
+    return psranges
+
+
+def _potential_ranges(ranges: list[AllowedPotentialRanges]) -> List[PalmSens.PotentialRange]:
+    psranges = List[PalmSens.PotentialRange]()
+    for item in ranges:
+        psranges.Add(pr_string_to_enum(item))
+    return psranges
+
+
+class CapabilitiesStore:
+    """Store capabilities of instruments on disk, one profile per serial number.
+
+    Assign a store to `InstrumentManager.capabilities_store` to save the
+    capabilities every time the instrument connects. Saved profiles
+    can validate methods and estimate durations without an instrument:
+
+        store = ps.CapabilitiesStore('profiles')
+        capabilities = store.load('ES4HR20B0008')
+
+        for method in recipes:
+            capabilities.validate_method(method)
+
+    Parameters
+    ----------
+    path : str | Path
+        Directory for the profiles, created if it does not exist.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path: Path = Path(path)
+
+    @override
+    def __repr__(self):
+        return f'{type(self).__name__}({str(self.path)!r})'
+
+    def __contains__(self, serial_number: str) -> bool:
+        return self._profile_path(serial_number).exists()
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the serial numbers of the saved profiles."""
+        for path in sorted(self.path.glob('*.json')):
+            yield Capabilities.model_validate_json(path.read_bytes()).serial_number
+
+    def __len__(self) -> int:
+        return len(list(self.path.glob('*.json')))
+
+    def save(self, capabilities: Capabilities) -> Path:
+        """Save capabilities, replace the profile with the same serial number.
+
+        Parameters
+        ----------
+        capabilities : Capabilities
+            Capabilities to save.
+
+        Returns
+        -------
+        path : Path
+            Path to the profile.
+        """
+        self.path.mkdir(parents=True, exist_ok=True)
+        path = self._profile_path(capabilities.serial_number)
+
+        # Write to temporary file first so that readers never see a partial profile
+        tmp = path.with_name(path.name + '.tmp')
+        _ = tmp.write_text(capabilities.model_dump_json(indent=2))
+        os.replace(tmp, path)
+
+        return path
+
+    def load(self, serial_number: str) -> Capabilities:
+        """Load capabilities by serial number.
+
+        Parameters
+        ----------
+        serial_number : str
+            Serial number of the instrument.
+
+        Returns
+        -------
+        capabilities : Capabilities
+        """
+        path = self._profile_path(serial_number)
+
+        if not path.exists():
+            raise KeyError(f'No capabilities saved for {serial_number!r}.')
+
+        return Capabilities.model_validate_json(path.read_bytes())
+
+    def _profile_path(self, serial_number: str) -> Path:
+        return self.path / f'{re.sub(r"[^A-Za-z0-9_.-]", "_", serial_number)}.json'
 
 
 if __name__ == '__main__':
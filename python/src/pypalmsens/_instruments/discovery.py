@@ -0,0 +1,298 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+import os
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Literal
+
+from pydantic import BaseModel, ValidationError
+from typing_extensions import override
+
+from .instrument import Instrument, discover_async
+from .shared import run_sync
+
+
+class _DiscoveryEntry(BaseModel):
+    """On-disk copy of the last discovered instruments."""
+
+    timestamp: datetime
+    instruments: dict[str, str]
+    """Interface by instrument id."""
+
+
+class DiscoveryCache:
+    """Cache the result of instrument discovery.
+
+    Discovery is only repeated if the cached result is older than `ttl`.
+    This avoids searching all interfaces every time instruments are needed,
+    for example:
+
+        cache = ps.DiscoveryCache(ttl=60)
+        instruments = cache.discover()
+
+    If `path` is given, the ids and interfaces of the discovered instruments
+    are also written to disk, see `last_known`. Device connections cannot be stored,
+    so a new process always discovers once.
+
+    Parameters
+    ----------
+    ttl : float
+        Time in seconds until the cached instruments expire.
+    path : str | Path, optional
+        JSON file to store the last known instruments.
+    **kwargs
+        These keyword arguments are passed to `discover_async()`, e.g. `ftdi=False`.
+    """
+
+    def __init__(self, ttl: float = 60.0, path: str | Path | None = None, **kwargs: Any):
+        self.ttl: float = ttl
+        self.path: Path | None = Path(path) if path else None
+        self.options: dict[str, Any] = kwargs
+
+        self._instruments: list[Instrument] | None = None
+        self._updated: float = 0.0
+
+        self._entry: _DiscoveryEntry | None = self._read_entry()
+
+    @override
+    def __repr__(self):
+        return f'{type(self).__name__}(ttl={self.ttl}, path={self.path!r}, age={self.age})'
+
+    @property
+    def age(self) -> float | None:
+        """Age of the cached instruments in seconds, None if empty."""
+        if self._instruments is None:
+            return None
+        return time.monotonic() - self._updated
+
+    @property
+    def last_known(self) -> dict[str, str]:
+        """Interface by id for the last discovered instruments, also from a previous run."""
+        return dict(self._entry.instruments) if self._entry else {}
+
+    @property
+    def last_updated(self) -> datetime | None:
+        """Time of the last discovery, also from a previous run."""
+        return self._entry.timestamp if self._entry else None
+
+    def invalidate(self) -> None:
+        """Discard the cached instruments."""
+        self._instruments = None
+
+    async def discover_async(self, refresh: bool = False) -> list[Instrument]:
+        """Return cached instruments, discover if the cache is empty or expired.
+
+        Parameters
+        ----------
+        refresh : bool
+            If True, always discover.
+
+        Returns
+        -------
+        discovered : list[Instrument]
+            List of dataclasses with discovered instruments.
+        """
+        age = self.age
+
+        if self._instruments is not None and age is not None and age < self.ttl and not refresh:
+            return list(self._instruments)
+
+        instruments = await discover_async(**self.options)
+
+        self._instruments = instruments
+        self._updated = time.monotonic()
+        self._write_entry(instruments)
+
+        return list(instruments)
+
+    def discover(self, refresh: bool = False) -> list[Instrument]:
+        """Return cached instruments, discover if the cache is empty or expired.
+
+        Parameters
+        ----------
+        refresh : bool
+            If True, always discover.
+
+        Returns
+        -------
+        discovered : list[Instrument]
+            List of dataclasses with discovered instruments.
+        """
+        return run_sync(self.discover_async(refresh=refresh))
+
+    def _read_entry(self) -> _DiscoveryEntry | None:
+        if not (self.path and self.path.exists()):
+            return None
+
+        try:
+            return _DiscoveryEntry.model_validate_json(self.path.read_bytes())
+        except ValidationError:
+            # Ignore a corrupt entry, it is overwritten after the next discovery
+            return None
+
+    def _write_entry(self, instruments: list[Instrument]) -> None:
+        self._entry = _DiscoveryEntry(
+            timestamp=datetime.now(),
+            instruments={instrument.id: instrument.interface for instrument in instruments},
+        )
+
+        if not self.path:
+            return
+
+        # Write to temporary file first so that readers never see a partial entry
+        tmp = self.path.with_name(self.path.name + '.tmp')
+        _ = tmp.write_text(self._entry.model_dump_json(indent=2))
+        os.replace(tmp, self.path)
+
+
+@dataclass(frozen=True, slots=True)
+class DiscoveryEvent:
+    """Instrument added or removed, see `InstrumentWatcher`."""
+
+    kind: Literal['added', 'removed']
+    """Type of change."""
+
+    instrument: Instrument
+    """Instrument that was added or removed."""
+
+
+class InstrumentWatcher:
+    """Poll for instruments in the background and report added and removed instruments.
+
+    Instruments are compared by id. The instruments found by the first poll
+    are reported as added. Iterate over the watcher to receive the events,
+    for example to keep a pool up to date:
+
+        async with ps.InstrumentWatcher(interval=2.0) as watcher:
+            async for event in watcher:
+                if event.kind == 'added':
+                    await pool.add(ps.InstrumentManagerAsync(event.instrument))
+
+    Alternatively, pass a callback. Coroutine functions are awaited.
+
+    Parameters
+    ----------
+    interval : float
+        Time between polls in seconds.
+    callback : Callable[[DiscoveryEvent], Any], optional
+        If specified, call this function for every event.
+    cache : DiscoveryCache, optional
+        Cache to discover with, it is refreshed on every poll.
+        By default, a new cache is created.
+    **kwargs
+        These keyword arguments are passed to `discover_async()`, e.g. `ftdi=False`.
+        Ignored if `cache` is given.
+    """
+
+    def __init__(
+        self,
+        interval: float = 2.0,
+        callback: Callable[[DiscoveryEvent], Any] | None = None,
+        cache: DiscoveryCache | None = None,
+        **kwargs: Any,
+    ):
+        self.interval: float = interval
+        self.callback: Callable[[DiscoveryEvent], Any] | None = callback
+        self.cache: DiscoveryCache = cache or DiscoveryCache(ttl=interval, **kwargs)
+
+        self.instruments: dict[str, Instrument] = {}
+        """Currently connected instruments by id."""
+
+        self._queue: asyncio.Queue[DiscoveryEvent | BaseException | None] = asyncio.Queue()
+        self._task: asyncio.Task[None] | None = None
+
+    @override
+    def __repr__(self):
+        return f'{type(self).__name__}(interval={self.interval}, running={self.is_running()})'
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    def is_running(self) -> bool:
+        """Return True if the watcher is polling."""
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        """Start polling in the background."""
+        if self.is_running():
+            return
+
+        self._task = asyncio.create_task(self._poll())
+
+    async def close(self) -> None:
+        """Stop polling and end iteration."""
+        if self._task is not None:
+            _ = self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        self._queue.put_nowait(None)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> DiscoveryEvent:
+        item = await self._queue.get()
+
+        if item is None:
+            raise StopAsyncIteration
+
+        if isinstance(item, BaseException):
+            raise item
+
+        return item
+
+    async def poll(self) -> list[DiscoveryEvent]:
+        """Discover once and return the changes since the previous poll.
+
+        Returns
+        -------
+        events : list[DiscoveryEvent]
+            Added and removed instruments.
+        """
+        discovered = {
+            instrument.id: instrument
+            for instrument in await self.cache.discover_async(refresh=True)
+        }
+
+        events = [
+            DiscoveryEvent(kind='removed', instrument=instrument)
+            for id, instrument in self.instruments.items()
+            if id not in discovered
+        ]
+        events.extend(
+            DiscoveryEvent(kind='added', instrument=instrument)
+            for id, instrument in discovered.items()
+            if id not in self.instruments
+        )
+
+        self.instruments = discovered
+
+        return events
+
+    async def _poll(self) -> None:
+        try:
+            while True:
+                for event in await self.poll():
+                    if self.callback:
+                        ret = self.callback(event)
+                        if inspect.isawaitable(ret):
+                            await ret
+                    else:
+                        self._queue.put_nowait(event)
+
+                await asyncio.sleep(self.interval)
+        except Exception as err:
+            # Raise the error in the iterating task
+            self._queue.put_nowait(err)
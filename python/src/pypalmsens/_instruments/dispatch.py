@@ -0,0 +1,358 @@
+from __future__ import annotations
+
+import asyncio
+import atexit
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from threading import Lock
+from typing import Any, Callable, Hashable, Literal
+
+AllowedExecutors = Literal['thread', 'process']
+"""Executors available by name for `run_in_executor()`."""
+
+_process_executor: ProcessPoolExecutor | None = None
+
+
+def _get_process_executor() -> ProcessPoolExecutor:
+    """Return process pool shared by all callbacks, created on first use."""
+    global _process_executor
+
+    if _process_executor is None:
+        _process_executor = ProcessPoolExecutor()
+        _ = atexit.register(_shutdown_process_executor)
+
+    return _process_executor
+
+
+def _shutdown_process_executor() -> None:
+    """Shut down the shared process pool, registered with `atexit` when it is created."""
+    global _process_executor
+
+    if _process_executor is not None:
+        _process_executor.shutdown(cancel_futures=True)
+        _process_executor = None
+
+
+@dataclass(frozen=True)
+class ExecutorCallback:
+    """Callback that runs on a worker executor instead of the event loop.
+
+    Use `run_in_executor()` to create one."""
+
+    func: Callable[..., Any]
+    """The wrapped callback."""
+
+    executor: Executor | AllowedExecutors = 'thread'
+    """Executor to run the callback on."""
+
+    def __call__(self, *args: Any) -> Any:
+        return self.func(*args)
+
+    def _get_executor(self) -> Executor | None:
+        """Return the executor instance, None means the default loop executor."""
+        if self.executor == 'thread':
+            return None
+        if self.executor == 'process':
+            return _get_process_executor()
+        return self.executor  # type: ignore
+
+    @property
+    def _in_process(self) -> bool:
+        """Return True if the callback runs in another process."""
+        return isinstance(self._get_executor(), ProcessPoolExecutor)
+
+
+def run_in_executor(
+    callback: Callable[..., Any],
+    /,
+    executor: Executor | AllowedExecutors = 'thread',
+) -> ExecutorCallback:
+    """Run callback on a worker executor instead of the event loop.
+
+    Heavy callbacks, like plotting or database inserts, delay every
+    other channel running on the same event loop. Wrap them with this function
+    to run them on a thread or process pool instead. Calls are queued per
+    callback and curve, so the callback receives the data of every curve in order.
+    Calls for different curves, or of different callbacks, may run concurrently
+    and in any order.
+
+    For example:
+
+        manager.measure(method, callback=ps.run_in_executor(plot, 'thread'))
+
+    Callbacks running in a process pool receive a pickled copy of the new data
+    (`DetachedCallbackData` or `DetachedCallbackDataEIS`), containing only the points
+    since the last call. The callback function itself must be picklable,
+    i.e. defined at the top level of a module.
+
+    Parameters
+    ----------
+    callback : Callable
+        Callback function to wrap.
+    executor : Executor | 'thread' | 'process'
+        Executor to run the callback on. Use 'thread' for the default thread pool
+        of the event loop, 'process' for a process pool shared by all callbacks,
+        or pass your own `concurrent.futures.Executor`.
+
+    Returns
+    -------
+    callback : ExecutorCallback
+        Wrapped callback, can be used anywhere a callback is accepted.
+    """
+    if isinstance(callback, ExecutorCallback):
+        callback = callback.func
+
+    return ExecutorCallback(func=callback, executor=executor)
+
+
+@dataclass(slots=True)
+class CallbackMetrics:
+    """Callback latency and queue statistics for a single channel.
+
+    Latency is measured from the moment the event is received from the instrument
+    until the callback has finished."""
+
+    n_calls: int = 0
+    """Number of completed callbacks."""
+
+    total_latency: float = 0.0
+    """Sum of all callback latencies in s."""
+
+    max_latency: float = 0.0
+    """Largest callback latency in s."""
+
+    queue_depth: int = 0
+    """Number of calls waiting for or running on an executor."""
+
+    max_queue_depth: int = 0
+    """Largest observed queue depth."""
+
+    n_dropped: int = 0
+    """Number of calls dropped because they arrived after the measurement had finished."""
+
+    @property
+    def mean_latency(self) -> float:
+        """Mean callback latency in s."""
+        if not self.n_calls:
+            return 0.0
+        return self.total_latency / self.n_calls
+
+    def reset(self) -> None:
+        """Reset all statistics, except the current queue depth."""
+        self.n_calls = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self.max_queue_depth = self.queue_depth
+        self.n_dropped = 0
+
+    def _record(self, latency: float) -> None:
+        self.n_calls += 1
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+
+
+class CallbackDispatcher:
+    """Schedule callbacks from .NET event threads.
+
+    Regular callbacks run on the event loop. Instances of `ExecutorCallback`
+    are queued per callback and key (e.g. the curve identifier) and run on
+    their executor one at a time. The order is only preserved for calls with
+    the same callback and key, different queues run concurrently.
+    After `join()`, the dispatcher is closed and late calls are dropped.
+
+    Parameters
+    ----------
+    loop : asyncio.AbstractEventLoop
+        Event loop to schedule the callbacks on.
+    metrics : CallbackMetrics
+        Collect statistics in this object.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, metrics: CallbackMetrics):
+        self.loop: asyncio.AbstractEventLoop = loop
+        self.metrics: CallbackMetrics = metrics
+
+        self._queues: dict[tuple[ExecutorCallback, Hashable], asyncio.Queue[Any]] = {}
+        self._workers: list[asyncio.Task[None]] = []
+        self._closed: bool = False
+
+    def call_soon_threadsafe(
+        self,
+        callback: Callable[..., Any],
+        *args: Any,
+        key: Hashable = None,
+    ) -> None:
+        """Schedule callback from any thread.
+
+        Parameters
+        ----------
+        callback : Callable
+            Callback to run.
+        *args
+            Arguments passed to the callback.
+        key : Hashable, optional
+            Calls with the same callback and key run in order.
+        """
+        _ = self.loop.call_soon_threadsafe(
+            partial(self.dispatch, callback, *args, key=key, received=time.perf_counter())
+        )
+
+    def dispatch(
+        self,
+        callback: Callable[..., Any],
+        *args: Any,
+        key: Hashable = None,
+        received: float | None = None,
+    ) -> None:
+        """Run callback on the event loop or hand it to the executor queue.
+
+        Must be called from the event loop thread.
+
+        Parameters
+        ----------
+        callback : Callable
+            Callback to run.
+        *args
+            Arguments passed to the callback.
+        key : Hashable, optional
+            Calls with the same callback and key run in order.
+        received : float, optional
+            Time (`time.perf_counter()`) the event was received, used for the latency.
+        """
+        if self._closed:
+            # The events of a measurement can arrive after it has finished
+            self.metrics.n_dropped += 1
+            return
+
+        if received is None:
+            received = time.perf_counter()
+
+        if not isinstance(callback, ExecutorCallback):
+            try:
+                callback(*args)
+            except Exception as exc:
+                # Report, but do not skip the other callbacks for this event
+                self._report(callback, exc)
+            finally:
+                self.metrics._record(time.perf_counter() - received)
+            return
+
+        if callback._in_process:
+            # Copy the data now, the .NET arrays keep growing while the call is queued
+            args = tuple(arg._detach() if hasattr(arg, '_detach') else arg for arg in args)
+
+        queue = self._queues.get((callback, key))
+
+        if queue is None:
+            queue = self._queues[callback, key] = asyncio.Queue()
+            self._workers.append(self.loop.create_task(self._worker(callback, queue)))
+
+        queue.put_nowait((received, args))
+
+        self.metrics.queue_depth += 1
+        self.metrics.max_queue_depth = max(
+            self.metrics.max_queue_depth, self.metrics.queue_depth
+        )
+
+    async def _worker(self, callback: ExecutorCallback, queue: asyncio.Queue[Any]) -> None:
+        """Run queued calls for a single callback one after the other."""
+        executor = callback._get_executor()
+
+        while True:
+            received, args = await queue.get()
+
+            try:
+                _ = await self.loop.run_in_executor(executor, callback.func, *args)
+            except Exception as exc:
+                self._report(callback.func, exc)
+            finally:
+                self.metrics.queue_depth -= 1
+                self.metrics._record(time.perf_counter() - received)
+                queue.task_done()
+
+    def _report(self, callback: Callable[..., Any], exc: Exception) -> None:
+        """Pass an exception raised by a callback to the exception handler of the loop."""
+        self.loop.call_exception_handler(
+            {
+                'message': f'Exception in callback {callback!r}',
+                'exception': exc,
+            }
+        )
+
+    async def join(self) -> None:
+        """Wait until all queued callbacks have finished, and close the dispatcher."""
+        # Run the calls already scheduled with `call_soon_threadsafe()`
+        await asyncio.sleep(0)
+        self._closed = True
+
+        for queue in self._queues.values():
+            await queue.join()
+
+        for worker in self._workers:
+            _ = worker.cancel()
+
+        self._queues.clear()
+        self._workers.clear()
+
+
+class EventCoalescer:
+    """Collect index ranges from .NET event threads and drain them in one loop wakeup.
+
+    Data events can fire many times per second for every curve.
+    Instead of waking up the event loop for every event, pending ranges are
+    merged per key, and a single drain is scheduled on the loop.
+
+    Parameters
+    ----------
+    loop : asyncio.AbstractEventLoop
+        Event loop to drain the ranges on.
+    drain : Callable
+        Called on the event loop with a mapping of key to `(start, stop, received)`,
+        where `received` is the time (`time.perf_counter()`) of the first event.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        drain: Callable[[dict[Hashable, tuple[int, int, float]]], None],
+    ):
+        self.loop: asyncio.AbstractEventLoop = loop
+        self._drain_callback = drain
+
+        self._lock = Lock()
+        self._pending: dict[Hashable, tuple[int, int, float]] = {}
+        self._scheduled: bool = False
+
+        self.n_events: int = 0
+        """Number of events received."""
+        self.n_drains: int = 0
+        """Number of times the event loop was woken up."""
+
+    def add(self, key: Hashable, start: int, stop: int) -> None:
+        """Add index range `[start, stop)` for key, can be called from any thread."""
+        with self._lock:
+            self.n_events += 1
+
+            if pending := self._pending.get(key):
+                self._pending[key] = (min(pending[0], start), max(pending[1], stop), pending[2])
+            else:
+                self._pending[key] = (start, stop, time.perf_counter())
+
+            if self._scheduled:
+                return
+
+            self._scheduled = True
+
+        _ = self.loop.call_soon_threadsafe(self.drain)
+
+    def drain(self) -> None:
+        """Dispatch all pending ranges, must be called from the event loop thread."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._scheduled = False
+
+        if pending:
+            self.n_drains += 1
+            self._drain_callback(pending)
@@ -0,0 +1,280 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Awaitable, Callable, Literal, Protocol
+
+from typing_extensions import override
+
+if TYPE_CHECKING:
+    from .instrument_manager_async import InstrumentManagerAsync
+    from .instrument_pool_async import InstrumentPoolAsync
+
+AllowedHealthEvents = Literal['quarantined', 'restored', 'reconnect_failed']
+
+
+class HealthCheck(Protocol):
+    def __call__(self, manager: InstrumentManagerAsync) -> Awaitable[object]: ...
+
+
+@dataclass(frozen=True, slots=True)
+class Backoff:
+    """Exponentially increasing delays between connection attempts."""
+
+    initial: float = 0.5
+    """Delay before the first retry in s."""
+
+    factor: float = 2.0
+    """Multiply the delay by this factor after every attempt."""
+
+    maximum: float = 30.0
+    """Maximum delay in s."""
+
+    jitter: float = 0.1
+    """Randomize the delay by this fraction, so that channels do not retry in lockstep."""
+
+    def delay(self, attempt: int) -> float:
+        """Return the delay in s before the given retry, starting at 0."""
+        delay = min(self.initial * self.factor**attempt, self.maximum)
+        return delay * (1 + random.uniform(-self.jitter, self.jitter))
+
+
+async def connect_with_backoff(
+    manager: InstrumentManagerAsync,
+    attempts: int | None,
+    backoff: Backoff,
+) -> None:
+    """Connect manager, retry with increasing delays.
+
+    Parameters
+    ----------
+    manager : InstrumentManagerAsync
+        Manager to connect.
+    attempts : int | None
+        Maximum number of attempts, None to retry until cancelled.
+    backoff : Backoff
+        Delays between the attempts.
+    """
+    attempt = 0
+
+    while True:
+        try:
+            await manager.connect()
+        except Exception:
+            attempt += 1
+            if attempts is not None and attempt >= attempts:
+                raise
+            await asyncio.sleep(backoff.delay(attempt - 1))
+        else:
+            return
+
+
+async def _read_current(manager: InstrumentManagerAsync) -> float:
+    return await manager.read_current()
+
+
+@dataclass(frozen=True, slots=True)
+class HealthEvent:
+    """Change of the health of a channel, see `PoolMonitor.events`."""
+
+    instrument: str
+    """Instrument ID of the channel."""
+
+    kind: AllowedHealthEvents
+    """'quarantined' if the channel failed, 'restored' after it reconnected,
+    'reconnect_failed' for every failed attempt in between."""
+
+    time: float
+    """Time of the event, `time.time()`."""
+
+    error: str | None = None
+    """Description of the error, if any."""
+
+
+class PoolMonitor:
+    """Check the channels of a pool and reconnect the channels that fail.
+
+    Every `interval` seconds, the monitor runs a health check on the idle
+    channels, by default it reads the current. A channel that fails the check,
+    or that lost the connection during a measurement (see `quarantine()`),
+    is quarantined: its connection is closed and it is reconnected in the background
+    with exponential backoff. The other channels keep running. After the
+    channel has reconnected and passed the health check, it is restored.
+
+    Use `InstrumentPoolAsync.enable_health_checks()` to start a monitor for a pool.
+    `JobScheduler` does not start jobs on quarantined channels and runs the jobs of
+    a dropped channel again on another channel.
+
+    Parameters
+    ----------
+    pool : InstrumentPoolAsync
+        Pool with the channels to monitor.
+    interval : float
+        Time between health checks in s.
+    backoff : Backoff, optional
+        Delays between reconnection attempts.
+    check : Callable, optional
+        Async function that is called with the manager and raises if the channel
+        is not healthy. By default, read the current.
+    timeout : float
+        Time in s after which a health check or disconnect counts as failed.
+    """
+
+    def __init__(
+        self,
+        pool: InstrumentPoolAsync,
+        *,
+        interval: float = 5.0,
+        backoff: Backoff | None = None,
+        check: HealthCheck | None = None,
+        timeout: float = 5.0,
+    ):
+        self.pool: InstrumentPoolAsync = pool
+        self.interval: float = interval
+        self.backoff: Backoff = backoff or Backoff()
+        self.check: HealthCheck = check or _read_current
+        self.timeout: float = timeout
+
+        self.events: list[HealthEvent] = []
+        """History of health events, oldest first."""
+
+        self._quarantined: dict[int, asyncio.Task[None]] = {}
+        self._listeners: list[Callable[[HealthEvent], None]] = []
+        self._task: asyncio.Task[None] | None = None
+
+    @override
+    def __repr__(self):
+        return (
+            f'{type(self).__name__}(quarantined={[m.instrument.id for m in self.quarantined]})'
+        )
+
+    async def __aenter__(self):
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    @property
+    def quarantined(self) -> list[InstrumentManagerAsync]:
+        """Managers that are waiting to be reconnected."""
+        return [manager for manager in self.pool if self.is_quarantined(manager)]
+
+    def is_quarantined(self, manager: InstrumentManagerAsync) -> bool:
+        """Return True if the manager is waiting to be reconnected."""
+        return id(manager) in self._quarantined
+
+    def add_listener(self, callback: Callable[[HealthEvent], None]) -> None:
+        """Call this function on every health event, on the event loop."""
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def start(self) -> None:
+        """Start the health checks on the running event loop."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def close(self) -> None:
+        """Stop the health checks and all reconnection attempts."""
+        tasks = [task for task in (self._task, *self._quarantined.values()) if task]
+
+        for task in tasks:
+            _ = task.cancel()
+
+        _ = await asyncio.gather(*tasks, return_exceptions=True)
+
+        self._task = None
+        self._quarantined.clear()
+
+    def quarantine(
+        self,
+        manager: InstrumentManagerAsync,
+        error: BaseException | None = None,
+    ) -> None:
+        """Take the channel out of service and reconnect it in the background.
+
+        Parameters
+        ----------
+        manager : InstrumentManagerAsync
+            Manager of the failed channel.
+        error : Exception, optional
+            Cause of the failure.
+        """
+        if self.is_quarantined(manager):
+            return
+
+        self._emit(manager, 'quarantined', error)
+
+        task = asyncio.get_running_loop().create_task(self._restore(manager))
+        self._quarantined[id(manager)] = task
+
+    async def check_now(self) -> None:
+        """Check all idle channels once, quarantine the channels that fail."""
+        for manager in list(self.pool):
+            if self.is_quarantined(manager):
+                continue
+
+            if manager.is_connected() and manager.is_measuring():
+                continue
+
+            try:
+                await self._check(manager)
+            except Exception as ex:
+                self.quarantine(manager, ex)
+
+    async def _check(self, manager: InstrumentManagerAsync) -> None:
+        manager.ensure_connection()
+        _ = await asyncio.wait_for(self.check(manager), self.timeout)
+
+    def _emit(
+        self,
+        manager: InstrumentManagerAsync,
+        kind: AllowedHealthEvents,
+        error: BaseException | None = None,
+    ) -> None:
+        event = HealthEvent(
+            instrument=manager.instrument.id,
+            kind=kind,
+            time=time.time(),
+            error=None if error is None else f'{type(error).__name__}: {error}',
+        )
+        self.events.append(event)
+
+        for listener in self._listeners:
+            listener(event)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.check_now()
+
+    async def _restore(self, manager: InstrumentManagerAsync) -> None:
+        """Reconnect the manager until it passes the health check."""
+        attempt = 0
+
+        try:
+            while True:
+                await self._drop(manager)
+                await asyncio.sleep(self.backoff.delay(attempt))
+                attempt += 1
+
+                try:
+                    await asyncio.wait_for(manager.connect(), self.timeout)
+                    await self._check(manager)
+                except Exception as ex:
+                    self._emit(manager, 'reconnect_failed', ex)
+                else:
+                    break
+        finally:
+            _ = self._quarantined.pop(id(manager), None)
+
+        self._emit(manager, 'restored')
+
+    async def _drop(self, manager: InstrumentManagerAsync) -> None:
+        """Close the connection, or forget it if the instrument does not respond."""
+        try:
+            await asyncio.wait_for(manager.disconnect(), self.timeout)
+        except Exception:
+            manager._discard_connection()
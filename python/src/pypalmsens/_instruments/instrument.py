@@ -4,14 +4,14 @@ import asyncio
 import sys
 import warnings
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, AsyncIterator
 
 import PalmSens
 import System
 from PalmSens.Comm import CommManager
 from typing_extensions import override
 
-from .shared import create_future
+from .shared import create_future, run_sync
 
 WINDOWS = sys.platform == 'win32'
 LINUX = not WINDOWS
@@ -142,6 +142,77 @@ class Instrument:
         return self.device.baudrate
 
 
+def _discovery_interfaces(
+    ftdi: bool = True,
+    usbcdc: bool = True,
+    winusb: bool = True,
+    bluetooth: bool = False,
+    serial: bool = True,
+) -> dict[str, Any]:
+    """Return device classes to discover instruments with by interface name."""
+    interfaces: dict[str, Any] = {}
+
+    if WINDOWS:
+        if ftdi:
+            interfaces['ftdi'] = PSDevices.FTDIDevice
+
+        if usbcdc:
+            interfaces['usbcdc'] = PSDevices.USBCDCDevice
+
+        if winusb:
+            interfaces['winusb'] = PSDevices.WinUSBDevice
+
+        if bluetooth:
+            interfaces['bluetooth'] = PSDevices.BluetoothDevice
+            interfaces['ble'] = PSDevices.BLEDevice
+
+    if LINUX:
+        if ftdi:
+            interfaces['ftdi'] = PSDevices.FTDIDevice
+
+        if serial:
+            interfaces['serial'] = PSDevices.SerialPortDevice
+
+    return interfaces
+
+
+async def _discover_interface(
+    name: str,
+    interface: Any,
+    timeout: float | None = None,
+    ignore_errors: bool = False,
+) -> list[Instrument]:
+    """Discover instruments on a single interface."""
+    try:
+        devices: list[PalmSens.Devices.Device] = await asyncio.wait_for(
+            create_future(interface.DiscoverDevicesAsync()),
+            timeout=timeout,
+        )
+    except asyncio.TimeoutError:
+        if not ignore_errors:
+            warnings.warn(
+                f'Discovery of {name} devices timed out after {timeout} s.',
+                stacklevel=3,
+            )
+        return []
+    except System.DllNotFoundException:
+        if ignore_errors:
+            return []
+
+        if name == 'ftdi':
+            msg = (
+                'Cannot discover FTDI devices (missing driver).'
+                '\nfor more information see: '
+                'https://dev.palmsens.com/python/latest/_attachments/installation/index.html#ftdisetup'
+                '\nSet `ftdi=False` to hide this message.'
+            )
+            warnings.warn(msg, stacklevel=3)
+            return []
+        raise
+
+    return [Instrument._from_device(device) for device in devices]
+
+
 async def discover_async(
     ftdi: bool = True,
     usbcdc: bool = True,
@@ -149,9 +220,12 @@ async def discover_async(
     bluetooth: bool = False,
     serial: bool = True,
     ignore_errors: bool = False,
+    timeout: float | None = None,
 ) -> list[Instrument]:
     """Discover instruments.
 
+    All interfaces are searched concurrently.
+
     For a list of device interfaces, see:
         https://dev.palmsens.com/python/latest/_attachments/installation/index.html#compatibility
 
@@ -169,63 +243,91 @@ async def discover_async(
         If True, discover serial devices
     ignore_errors : False
         Ignores errors in device discovery
+    timeout : float, optional
+        Timeout in seconds per interface. Interfaces that time out
+        are skipped with a warning, the other interfaces are returned.
 
     Returns
     -------
     discovered : list[Instrument]
         List of dataclasses with discovered instruments.
     """
-    interfaces: dict[str, Any] = {}
+    interfaces = _discovery_interfaces(
+        ftdi=ftdi, usbcdc=usbcdc, winusb=winusb, bluetooth=bluetooth, serial=serial
+    )
 
-    if WINDOWS:
-        if ftdi:
-            interfaces['ftdi'] = PSDevices.FTDIDevice
+    results = await asyncio.gather(
+        *(
+            _discover_interface(name, interface, timeout=timeout, ignore_errors=ignore_errors)
+            for name, interface in interfaces.items()
+        )
+    )
 
-        if usbcdc:
-            interfaces['usbcdc'] = PSDevices.USBCDCDevice
+    instruments = [instrument for result in results for instrument in result]
+    instruments.sort(key=lambda instrument: instrument.id)
 
-        if winusb:
-            interfaces['winusb'] = PSDevices.WinUSBDevice
+    return instruments
 
-        if bluetooth:
-            interfaces['bluetooth'] = PSDevices.BluetoothDevice
-            interfaces['ble'] = PSDevices.BLEDevice
 
-    if LINUX:
-        if ftdi:
-            interfaces['ftdi'] = PSDevices.FTDIDevice
+async def discover_iter_async(
+    ftdi: bool = True,
+    usbcdc: bool = True,
+    winusb: bool = True,
+    bluetooth: bool = False,
+    serial: bool = True,
+    ignore_errors: bool = False,
+    timeout: float | None = None,
+) -> AsyncIterator[Instrument]:
+    """Discover instruments, yield instruments as soon as they are found.
 
-        if serial:
-            interfaces['serial'] = PSDevices.SerialPortDevice
+    All interfaces are searched concurrently. The instruments of an interface
+    are yielded as soon as the discovery of that interface is complete, for example:
 
-    instruments: list[Instrument] = []
+        async for instrument in ps.discover_iter_async():
+            print(instrument)
 
-    for name, interface in interfaces.items():
-        try:
-            devices: list[PalmSens.Devices.Device] = await create_future(
-                interface.DiscoverDevicesAsync()
-            )
-        except System.DllNotFoundException:
-            if ignore_errors:
-                continue
-
-            if name == 'ftdi':
-                msg = (
-                    'Cannot discover FTDI devices (missing driver).'
-                    '\nfor more information see: '
-                    'https://dev.palmsens.com/python/latest/_attachments/installation/index.html#ftdisetup'
-                    '\nSet `ftdi=False` to hide this message.'
-                )
-                warnings.warn(msg, stacklevel=2)
-                continue
-            raise
-
-        for device in devices:
-            instruments.append(Instrument._from_device(device))
+    Parameters
+    ----------
+    ftdi : bool
+        If True, discover ftdi devices
+    usbcdc : bool
+        If True, discover usbcdc devices (Windows only)
+    winusb : bool
+        If True, discover winusb devices (Windows only)
+    bluetooth : bool
+        If True, discover bluetooth devices (Windows only)
+    serial : bool
+        If True, discover serial devices
+    ignore_errors : False
+        Ignores errors in device discovery
+    timeout : float, optional
+        Timeout in seconds per interface. Interfaces that time out
+        are skipped with a warning.
+
+    Yields
+    ------
+    instrument : Instrument
+        Discovered instrument.
+    """
+    interfaces = _discovery_interfaces(
+        ftdi=ftdi, usbcdc=usbcdc, winusb=winusb, bluetooth=bluetooth, serial=serial
+    )
 
-    instruments.sort(key=lambda instrument: instrument.id)
+    tasks = [
+        asyncio.ensure_future(
+            _discover_interface(name, interface, timeout=timeout, ignore_errors=ignore_errors)
+        )
+        for name, interface in interfaces.items()
+    ]
 
-    return instruments
+    try:
+        for next_result in asyncio.as_completed(tasks):
+            for instrument in sorted(await next_result, key=lambda instrument: instrument.id):
+                yield instrument
+    finally:
+        # Stop discovery if the caller stops iterating
+        for task in tasks:
+            _ = task.cancel()
 
 
 def discover(
@@ -235,9 +337,12 @@ def discover(
     bluetooth: bool = False,
     serial: bool = True,
     ignore_errors: bool = False,
+    timeout: float | None = None,
 ) -> list[Instrument]:
     """Discover instruments.
 
+    All interfaces are searched concurrently.
+
     For a list of device interfaces, see:
         https://dev.palmsens.com/python/latest/_attachments/installation/index.html#compatibility
 
@@ -255,13 +360,16 @@ def discover(
         If True, discover serial devices
     ignore_errors : False
         Ignores errors in device discovery
+    timeout : float, optional
+        Timeout in seconds per interface. Interfaces that time out
+        are skipped with a warning, the other interfaces are returned.
 
     Returns
     -------
     discovered : list[Instrument]
         List of dataclasses with discovered instruments.
     """
-    return asyncio.run(
+    return run_sync(
         discover_async(
             ftdi=ftdi,
             usbcdc=usbcdc,
@@ -269,5 +377,6 @@ def discover(
             bluetooth=bluetooth,
             serial=serial,
             ignore_errors=ignore_errors,
+            timeout=timeout,
         )
     )
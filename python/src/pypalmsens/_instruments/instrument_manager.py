@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-import asyncio
+import concurrent.futures
+import time
 import warnings
 from contextlib import contextmanager
 from pathlib import Path
 from time import sleep
-from typing import Callable, Generator
+from typing import Callable, Generator, Iterator, Sequence
 
 import clr
 import PalmSens
@@ -18,17 +19,32 @@ from .._converters import (
     pr_enum_to_string,
     pr_string_to_enum,
 )
+from .._data.stream import DataStream
+from .._methods.cache import psmethod_cache
 from .._types import (
     AllowedCurrentRanges,
     AllowedPotentialRanges,
     MethodTypeCompatible,
 )
 from ..data import Measurement
+from .broadcast import LivePublisher
 from .callback import Callback, CallbackEIS, Status
+from .capabilities import CapabilitiesStore
+from .dispatch import CallbackMetrics
 from .instrument import Instrument, discover
 from .instrument_manager_async import CapabilitiesMixin
+from .live_buffer import LiveBuffer
 from .measurement_manager_async import MeasurementManagerAsync
-from .shared import firmware_warning
+from .sampling import (
+    AllowedSampleQuantities,
+    Samples,
+    _check_quantities,
+    _n_samples,
+    sample_sync,
+)
+from .shared import CallingThreadExecutor, firmware_warning, run_nowait, run_sync
+from .timings import MeasurementTimings, TimingStats
+from .watchdog import Watchdog
 
 warnings.simplefilter('default')
 
@@ -72,7 +88,7 @@ def measure(
     method: MethodTypeCompatible,
     instrument: None | Instrument = None,
     callback: Callback | CallbackEIS | None = None,
-    stream: str | Path | None = None,
+    stream: DataStream | Path | str | None = None,
 ) -> Measurement:
     """Run measurement.
 
@@ -90,11 +106,12 @@ def measure(
         time it was called. Each point is an instance of `ps.data.CallbackData`
         for non-impedimetric or `ps.data.CallbackDataEIS`
         for impedimetric measurments.
-    stream: Path | str | None
+    stream: DataStream | Path | str | None
         If defined, stream data directly to this file in JSON Lines text format
         (https://jsonlines.org). This option is useful for long-term measurements.
         In case of a PC crash or power outage, the most recent measurement data will
         still be available.
+        Use `DataStream` to split the data into segments by size, rows, or time.
 
     Returns
     -------
@@ -112,6 +129,9 @@ def measure(
 class InstrumentManager(CapabilitiesMixin):
     """Instrument manager for PalmSens instruments.
 
+    Connections and measurements run on a shared event loop in a background
+    thread, use `measure_nowait()` to measure on several instruments at once.
+
     Parameters
     ----------
     instrument: Instrument
@@ -122,8 +142,27 @@ class InstrumentManager(CapabilitiesMixin):
         self.instrument: Instrument = instrument
         """Instrument being managed by this class."""
 
+        self.callback_metrics: CallbackMetrics = CallbackMetrics()
+        """Callback latency and queue statistics for measurements on this instrument."""
+
+        self.live_buffer: LiveBuffer | None = None
+        """Assign a `LiveBuffer` to keep the most recent data of every measurement."""
+
+        self.publisher: LivePublisher | None = None
+        """Assign a `LivePublisher` to broadcast the data of every measurement."""
+
+        self.capabilities_store: CapabilitiesStore | None = None
+        """Assign a `CapabilitiesStore` to save the capabilities every time the instrument connects."""
+
+        self.timing_stats: TimingStats | None = None
+        """Assign a `TimingStats` to record the stage timings of every measurement."""
+
+        self.watchdog: Watchdog | None = None
+        """Assign a `Watchdog` to abort measurements that take too long or stop sending data."""
+
         self._receive_message_callback: Callable[[str], None]
         self._comm: CommManager
+        self._capabilities = None
 
     @override
     def __repr__(self):
@@ -180,10 +219,12 @@ class InstrumentManager(CapabilitiesMixin):
         # Opening the comm manager in async sets some handlers in ClientConnection
         # that are sync or async specific. This affects the measurement,
         # receive status, and device state change events.
-        self._comm = asyncio.run(self.instrument._connect_async())
+        self._comm = run_sync(self.instrument._connect_async())
 
         firmware_warning(self._comm.Capabilities)
 
+        self._snapshot_capabilities()
+
     def status(self) -> Status:
         """Get status."""
         self.ensure_connection()
@@ -263,6 +304,78 @@ class InstrumentManager(CapabilitiesMixin):
 
         return potential
 
+    def sample(
+        self,
+        quantities: Sequence[AllowedSampleQuantities] | AllowedSampleQuantities = 'current',
+        rate: float = 10.0,
+        duration: float = 1.0,
+    ) -> Samples:
+        """Read current and/or potential at a fixed rate.
+
+        The instrument is locked once for all readings, which is much faster
+        than calling `read_current()` or `read_potential()` in a loop.
+        If the instrument cannot keep up, readings are taken as fast as possible.
+
+        Parameters
+        ----------
+        quantities : Sequence[str] | str
+            Quantities to read, 'current' (µA) and/or 'potential' (V).
+        rate : float
+            Readings per second.
+        duration : float
+            Sampling time in seconds.
+
+        Returns
+        -------
+        samples : Samples
+            Time and values of the readings as numpy arrays.
+        """
+        quantities = _check_quantities(quantities)
+        n = _n_samples(rate, duration)
+
+        with self._lock():
+            return sample_sync(self._comm, quantities, rate, n, start=time.perf_counter())
+
+    def sample_iter(
+        self,
+        quantities: Sequence[AllowedSampleQuantities] | AllowedSampleQuantities = 'current',
+        rate: float = 10.0,
+        block_size: int = 100,
+    ) -> Iterator[Samples]:
+        """Read current and/or potential continuously at a fixed rate.
+
+        Yields blocks of `block_size` readings. The instrument is locked while
+        a block is read.
+
+        Parameters
+        ----------
+        quantities : Sequence[str] | str
+            Quantities to read, 'current' (µA) and/or 'potential' (V).
+        rate : float
+            Readings per second.
+        block_size : int
+            Number of readings per block.
+
+        Yields
+        ------
+        samples : Samples
+            Time since the start of iteration and values of the readings.
+        """
+        quantities = _check_quantities(quantities)
+        _ = _n_samples(rate, block_size / rate)
+
+        start = time.perf_counter()
+        first = 0
+
+        while True:
+            with self._lock():
+                samples = sample_sync(
+                    self._comm, quantities, rate, block_size, start=start, first=first
+                )
+
+            first += block_size
+            yield samples
+
     def set_potential(self, potential: float):
         """Set the potential of the cell.
 
@@ -337,7 +450,7 @@ class InstrumentManager(CapabilitiesMixin):
         method: MethodTypeCompatible,
         *,
         callback: Callback | CallbackEIS | None = None,
-        stream: Path | str | None = None,
+        stream: DataStream | Path | str | None = None,
     ) -> Measurement:
         """Start measurement using given method parameters.
 
@@ -351,11 +464,14 @@ class InstrumentManager(CapabilitiesMixin):
             time it was called. Each point is an instance of `ps.data.CallbackData`
             for non-impedimetric or  `ps.data.CallbackDataEIS`
             for impedimetric measurments.
-        stream: Path | str | None
+            The callback is called on the thread that called `measure()`.
+            Use `ps.run_in_executor()` to run the callback on a thread or process pool.
+        stream: DataStream | Path | str | None
             If defined, stream data directly to this file in JSON Lines text format
             (https://jsonlines.org). This option is useful for long-term measurements.
             In case of a PC crash or power outage, the most recent measurement data will
             still be available.
+            Use `DataStream` to split the data into segments by size, rows, or time.
 
         Returns
         -------
@@ -363,16 +479,86 @@ class InstrumentManager(CapabilitiesMixin):
             Finished measurement.
         """
         self.ensure_connection()
-        self.validate_method(method)
 
-        # note that the comm manager must be opened async so it sets the
-        # correct async event handlers
-        measurement_manager = MeasurementManagerAsync(comm=self._comm)
+        executor = CallingThreadExecutor()
 
-        return asyncio.run(
-            measurement_manager.measure(method, callback=callback, stream=stream)
+        if callback is not None:
+            callback = executor.wrap(callback)
+
+        return run_sync(
+            self._measure(method, callback=callback, stream=stream), executor=executor
+        )
+
+    def measure_nowait(
+        self,
+        method: MethodTypeCompatible,
+        *,
+        callback: Callback | CallbackEIS | None = None,
+        stream: DataStream | Path | str | None = None,
+    ) -> concurrent.futures.Future[Measurement]:
+        """Start measurement in the background and return immediately.
+
+        Use this to measure on several instruments at once from synchronous code,
+        for example:
+
+            futures = [manager.measure_nowait(method) for manager in managers]
+            measurements = [future.result() for future in futures]
+
+        Parameters
+        ----------
+        method: MethodType
+            Method parameters for measurement
+        callback: Callback, optional
+            If specified, call this function on every new set of data points,
+            see `measure()`. The callback runs in the background thread.
+        stream: DataStream | Path | str | None
+            If defined, stream data directly to this file, see `measure()`.
+
+        Returns
+        -------
+        future : concurrent.futures.Future[Measurement]
+            Future with the finished measurement. Cancel the future to stop waiting
+            for the measurement, use `abort()` to stop the instrument.
+        """
+        self.ensure_connection()
+
+        return run_nowait(self._measure(method, callback=callback, stream=stream))
+
+    async def _measure(
+        self,
+        method: MethodTypeCompatible,
+        *,
+        callback: Callback | CallbackEIS | None,
+        stream: DataStream | Path | str | None,
+    ) -> Measurement:
+        timing_stats = self.timing_stats
+        timings = (
+            None if timing_stats is None else MeasurementTimings(called=time.perf_counter())
         )
 
+        try:
+            with psmethod_cache.lease(method) as psmethod:
+                self.validate_method(psmethod)
+
+                # note that the comm manager must be opened async so it sets the
+                # correct async event handlers
+                measurement_manager = MeasurementManagerAsync(
+                    comm=self._comm,
+                    callback_metrics=self.callback_metrics,
+                    live_buffer=self.live_buffer,
+                    publisher=self.publisher,
+                    source=self.instrument.id,
+                    timings=timings,
+                    watchdog=self.watchdog,
+                )
+
+                return await measurement_manager.measure(
+                    method, callback=callback, stream=stream, psmethod=psmethod
+                )
+        finally:
+            if timing_stats is not None and timings is not None:
+                timing_stats._add(timings)
+
     def wait_digital_trigger(self, wait_for_high: bool):
         """Wait for digital trigger.
 
@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import asyncio
 import sys
+import time
 import warnings
-from collections.abc import AsyncGenerator, Coroutine
+from collections.abc import AsyncGenerator, AsyncIterator, Coroutine, Sequence
 from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any, Callable, Protocol
@@ -20,6 +21,8 @@ from .._converters import (
     pr_enum_to_string,
     pr_string_to_enum,
 )
+from .._data.stream import DataStream
+from .._methods.cache import psmethod_cache
 from .._types import (
     AllowedCurrentRanges,
     AllowedMethods,
@@ -27,11 +30,30 @@ from .._types import (
     MethodTypeCompatible,
 )
 from ..data import Measurement
+from .broadcast import LivePublisher
 from .callback import Callback, CallbackEIS, CallbackStatus, Status
-from .capabilities import Capabilities, CapabilitiesInterface
+from .capabilities import (
+    Capabilities,
+    CapabilitiesStore,
+    estimated_duration,
+    validate_method,
+)
+from .dispatch import CallbackMetrics
 from .instrument import Instrument, discover_async
+from .live_buffer import LiveBuffer
 from .measurement_manager_async import MeasurementManagerAsync
-from .shared import MethodIncompatibleError, create_future, firmware_warning
+from .sampling import (
+    AllowedSampleQuantities,
+    Samples,
+    _check_quantities,
+    _n_samples,
+    sample_async,
+)
+from .shared import create_future, firmware_warning
+from .software_sync import _StartGate
+from .status_recorder import StatusRecorder
+from .timings import MeasurementTimings, TimingStats
+from .watchdog import Watchdog
 
 WINDOWS = sys.platform == 'win32'
 LINUX = not WINDOWS
@@ -112,6 +134,8 @@ async def measure_async(
 
 class HasCommProtocol(Protocol):
     _comm: CommManager
+    _capabilities: Capabilities | None
+    capabilities_store: CapabilitiesStore | None
 
     def ensure_connection(self) -> None: ...
 
@@ -121,19 +145,34 @@ class HasCapabilities(Protocol):
 
 
 class CapabilitiesMixin:
+    _capabilities: Capabilities | None = None
+
     @property
     def capabilities(self: HasCommProtocol) -> Capabilities:
         """Retrieve device capabilities and device info as a dataclass.
 
+        The capabilities are read once when the instrument connects.
+
         Returns
         -------
         capabilities: Capabilities
             Device capabilities and device info.
         """
         self.ensure_connection()
-        return Capabilities._from_comm(self._comm)
 
-    def supported_methods(self: HasCommProtocol) -> list[AllowedMethods]:
+        if self._capabilities is None:
+            self._capabilities = Capabilities._from_comm(self._comm)
+
+        return self._capabilities
+
+    def _snapshot_capabilities(self: HasCommProtocol) -> None:
+        """Read capabilities after connecting, and save them if a store is assigned."""
+        self._capabilities = Capabilities._from_comm(self._comm)
+
+        if self.capabilities_store is not None:
+            _ = self.capabilities_store.save(self._capabilities)
+
+    def supported_methods(self: HasCapabilities) -> list[AllowedMethods]:
         """List methods supported by this device.
 
         Returns
@@ -141,10 +180,9 @@ class CapabilitiesMixin:
         methods: list[AllowedMethods]
             List of supported methods.
         """
-        self.ensure_connection()
-        return CapabilitiesInterface(comm=self._comm).supported_methods
+        return list(self.capabilities.supported_methods)
 
-    def supported_current_ranges(self: HasCommProtocol) -> list[AllowedCurrentRanges]:
+    def supported_current_ranges(self: HasCapabilities) -> list[AllowedCurrentRanges]:
         """List current ranges supported by this device.
 
         Returns
@@ -152,10 +190,9 @@ class CapabilitiesMixin:
         current_ranges: list[AllowedCurrentRanges]
             List of supported current ranges.
         """
-        self.ensure_connection()
-        return CapabilitiesInterface(comm=self._comm).supported_current_ranges
+        return list(self.capabilities.supported_current_ranges)
 
-    def supported_applied_current_ranges(self: HasCommProtocol) -> list[AllowedCurrentRanges]:
+    def supported_applied_current_ranges(self: HasCapabilities) -> list[AllowedCurrentRanges]:
         """List applied current ranges supported by this device.
 
         Returns
@@ -163,10 +200,9 @@ class CapabilitiesMixin:
         current_ranges: list[AllowedCurrentRanges]
             List of supported current ranges.
         """
-        self.ensure_connection()
-        return CapabilitiesInterface(comm=self._comm).supported_applied_current_ranges
+        return list(self.capabilities.supported_applied_current_ranges)
 
-    def supported_bipot_current_ranges(self: HasCommProtocol) -> list[AllowedCurrentRanges]:
+    def supported_bipot_current_ranges(self: HasCapabilities) -> list[AllowedCurrentRanges]:
         """List bipot current ranges supported by this device.
 
         Returns
@@ -174,10 +210,9 @@ class CapabilitiesMixin:
         current_ranges: list[AllowedCurrentRanges]
             List of supported current ranges.
         """
-        self.ensure_connection()
-        return CapabilitiesInterface(comm=self._comm).supported_bipot_current_ranges
+        return list(self.capabilities.supported_bipot_current_ranges)
 
-    def supported_potential_ranges(self: HasCommProtocol) -> list[AllowedPotentialRanges]:
+    def supported_potential_ranges(self: HasCapabilities) -> list[AllowedPotentialRanges]:
         """List applied potential ranges supported by this device.
 
         Returns
@@ -185,19 +220,24 @@ class CapabilitiesMixin:
         potential_ranges: list[AllowedPotentialRanges]
             List of supported potential ranges.
         """
-        self.ensure_connection()
-        return CapabilitiesInterface(comm=self._comm).supported_potential_ranges
+        return list(self.capabilities.supported_potential_ranges)
 
     def get_estimated_duration(
         self: HasCommProtocol,
         method: PalmSens.Method | MethodTypeCompatible,
+        include_pretreatment: bool = False,
     ) -> float:
         """Get the estimated duration for this method.
 
+        To estimate without a connection, see `Capabilities.get_estimated_duration()`.
+
         Parameters
         -----------
         method : MethodType
             The method to get the estimated duration for.
+        include_pretreatment : bool
+            If True, add the estimated duration of the pretreatment phase and,
+            if versus OCP is enabled, the maximum OCP time.
 
         Returns
         -------
@@ -206,20 +246,18 @@ class CapabilitiesMixin:
         """
         self.ensure_connection()
 
-        if not isinstance(method, PalmSens.Method):
-            method = method._to_psmethod()
-
-        capabilities = self._comm.Capabilities
-
-        return method.GetMinimumEstimatedMeasurementDuration(capabilities)
+        return estimated_duration(
+            method, self._comm.Capabilities, include_pretreatment=include_pretreatment
+        )
 
     def validate_method(
         self: HasCommProtocol,
-        method: MethodTypeCompatible,
+        method: PalmSens.Method | MethodTypeCompatible,
     ):
         """Validate method.
 
         Raise ValueError if the method cannot be validated.
+        To validate without a connection, see `Capabilities.validate_method()`.
 
         Parameters
         -----------
@@ -228,14 +266,7 @@ class CapabilitiesMixin:
         """
         self.ensure_connection()
 
-        capabilities = self._comm.Capabilities
-
-        psmethod = method._to_psmethod()
-        errors = psmethod.Validate(capabilities)
-
-        if any(error.IsFatal for error in errors):
-            message = '\n'.join([error.Message for error in errors])
-            raise MethodIncompatibleError(f'Method not compatible:\n{message}')
+        validate_method(method, self._comm.Capabilities)
 
 
 class InstrumentManagerAsync(CapabilitiesMixin):
@@ -251,8 +282,28 @@ class InstrumentManagerAsync(CapabilitiesMixin):
         self.instrument: Instrument = instrument
         """Instrument being managed by this class."""
 
+        self.callback_metrics: CallbackMetrics = CallbackMetrics()
+        """Callback latency and queue statistics for measurements on this instrument."""
+
+        self.live_buffer: LiveBuffer | None = None
+        """Assign a `LiveBuffer` to keep the most recent data of every measurement."""
+
+        self.publisher: LivePublisher | None = None
+        """Assign a `LivePublisher` to broadcast the data of every measurement."""
+
+        self.capabilities_store: CapabilitiesStore | None = None
+        """Assign a `CapabilitiesStore` to save the capabilities every time the instrument connects."""
+
+        self.timing_stats: TimingStats | None = None
+        """Assign a `TimingStats` to record the stage timings of every measurement."""
+
+        self.watchdog: Watchdog | None = None
+        """Assign a `Watchdog` to abort measurements that take too long or stop sending data."""
+
         self._comm: CommManager
+        self._capabilities = None
         self._status_callback: CallbackStatus
+        self._status_recorder: StatusRecorder | None = None
         self._receive_message_callback: Callable[[str], None]
         self._loop: asyncio.AbstractEventLoop
 
@@ -311,6 +362,8 @@ class InstrumentManagerAsync(CapabilitiesMixin):
 
         firmware_warning(self._comm.Capabilities)
 
+        self._snapshot_capabilities()
+
     def status(self) -> Status:
         """Get status."""
         self.ensure_connection()
@@ -398,6 +451,83 @@ class InstrumentManagerAsync(CapabilitiesMixin):
 
         return potential
 
+    async def sample(
+        self,
+        quantities: Sequence[AllowedSampleQuantities] | AllowedSampleQuantities = 'current',
+        rate: float = 10.0,
+        duration: float = 1.0,
+    ) -> Samples:
+        """Read current and/or potential at a fixed rate.
+
+        The instrument is locked once for all readings, which is much faster
+        than calling `read_current()` or `read_potential()` in a loop.
+        If the instrument cannot keep up, readings are taken as fast as possible.
+
+        Parameters
+        ----------
+        quantities : Sequence[str] | str
+            Quantities to read, 'current' (µA) and/or 'potential' (V).
+        rate : float
+            Readings per second.
+        duration : float
+            Sampling time in seconds.
+
+        Returns
+        -------
+        samples : Samples
+            Time and values of the readings as numpy arrays.
+        """
+        quantities = _check_quantities(quantities)
+        n = _n_samples(rate, duration)
+
+        async with self._lock():
+            return await sample_async(
+                self._comm, quantities, rate, n, start=time.perf_counter()
+            )
+
+    async def sample_iter(
+        self,
+        quantities: Sequence[AllowedSampleQuantities] | AllowedSampleQuantities = 'current',
+        rate: float = 10.0,
+        block_size: int = 100,
+    ) -> AsyncIterator[Samples]:
+        """Read current and/or potential continuously at a fixed rate.
+
+        Yields blocks of `block_size` readings. The instrument is locked while
+        a block is read, other calls can run in between.
+
+            async for samples in manager.sample_iter('current', rate=50):
+                print(samples['current'].mean())
+
+        Parameters
+        ----------
+        quantities : Sequence[str] | str
+            Quantities to read, 'current' (µA) and/or 'potential' (V).
+        rate : float
+            Readings per second.
+        block_size : int
+            Number of readings per block.
+
+        Yields
+        ------
+        samples : Samples
+            Time since the start of iteration and values of the readings.
+        """
+        quantities = _check_quantities(quantities)
+        _ = _n_samples(rate, block_size / rate)
+
+        start = time.perf_counter()
+        first = 0
+
+        while True:
+            async with self._lock():
+                samples = await sample_async(
+                    self._comm, quantities, rate, block_size, start=start, first=first
+                )
+
+            first += block_size
+            yield samples
+
     async def set_potential(self, potential: float) -> None:
         """Set the potential of the cell.
 
@@ -476,6 +606,55 @@ class InstrumentManagerAsync(CapabilitiesMixin):
         _ = self._loop.call_soon_threadsafe(self._status_callback, status)
         return Task.CompletedTask
 
+    def record_status(self, recorder: StatusRecorder | None = None, /) -> StatusRecorder:
+        """Record idle status events into a columnar buffer.
+
+        Use this instead of `register_status_callback()` to log the potential and
+        current of an idle cell over a long time. The raw status fields are
+        written to numpy arrays without creating a `Status` object per event.
+
+        Recording continues until `stop_recording_status()` is called
+        or the instrument disconnects. Only one recorder is active at a time.
+
+        Parameters
+        ----------
+        recorder : StatusRecorder, optional
+            Recorder to write to, e.g. to set the decimation
+            or to continue an earlier recording. Defaults to a new recorder.
+
+        Returns
+        -------
+        recorder : StatusRecorder
+            The recorder that receives the status events.
+        """
+        if recorder is None:
+            recorder = StatusRecorder()
+
+        _ = self.stop_recording_status()
+
+        self._status_recorder = recorder
+        self._comm.ReceiveStatusAsync += recorder._status_handler
+        return recorder
+
+    def stop_recording_status(self) -> StatusRecorder | None:
+        """Stop recording idle status events.
+
+        Returns
+        -------
+        recorder : StatusRecorder | None
+            The recorder with the recorded status, None if not recording.
+        """
+        recorder = self._status_recorder
+
+        if recorder is None:
+            return None
+
+        if self.is_connected():
+            self._comm.ReceiveStatusAsync -= recorder._status_handler
+
+        self._status_recorder = None
+        return recorder
+
     def register_receive_message_callback(self, callback: Callable[[str], None], /):
         """Register callback when a message is received.
 
@@ -506,8 +685,9 @@ class InstrumentManagerAsync(CapabilitiesMixin):
         method: MethodTypeCompatible,
         *,
         callback: Callback | CallbackEIS | None = None,
-        stream: Path | str | None = None,
+        stream: DataStream | Path | str | None = None,
         sync_event: asyncio.Event | None = None,
+        start_gate: _StartGate | None = None,
     ):
         """Start measurement using given method parameters.
 
@@ -521,24 +701,56 @@ class InstrumentManagerAsync(CapabilitiesMixin):
             time it was called. Each point is an instance of `ps.data.CallbackData`
             for non-impedimetric or `ps.data.CallbackDataEIS`.
             for impedimetric measurments.
-        stream: Path | str | None
+            Use `ps.run_in_executor()` to run the callback on a thread or process pool.
+        stream: DataStream | Path | str | None
             If defined, stream data directly to this file in JSON Lines text format
             (https://jsonlines.org). This option is useful for long-term measurements.
             In case of a PC crash or power outage, the most recent measurement data will
             still be available.
+            Use `DataStream` to split the data into segments by size, rows, or time.
         sync_event: asyncio.Event
             Event for hardware synchronization. Do not use directly.
             Instead, initiate hardware sync via `InstrumentPoolAsync.measure()`.
+        start_gate: _StartGate
+            Gate for software synchronization. Do not use directly.
+            Instead, use `InstrumentPoolAsync.measure_synchronized()`.
         """
         self.ensure_connection()
-        self.validate_method(method)  # type: ignore
-
-        measurement_manager = MeasurementManagerAsync(comm=self._comm)
 
-        return await measurement_manager.measure(
-            method, callback=callback, stream=stream, sync_event=sync_event
+        # The begin timestamps are needed to measure the start skew
+        timing_stats = self.timing_stats
+        timings = (
+            None
+            if timing_stats is None and start_gate is None
+            else MeasurementTimings(called=time.perf_counter())
         )
 
+        try:
+            with psmethod_cache.lease(method) as psmethod:
+                self.validate_method(psmethod)
+
+                measurement_manager = MeasurementManagerAsync(
+                    comm=self._comm,
+                    callback_metrics=self.callback_metrics,
+                    live_buffer=self.live_buffer,
+                    publisher=self.publisher,
+                    source=self.instrument.id,
+                    timings=timings,
+                    watchdog=self.watchdog,
+                )
+
+                return await measurement_manager.measure(
+                    method,
+                    callback=callback,
+                    stream=stream,
+                    sync_event=sync_event,
+                    psmethod=psmethod,
+                    start_gate=start_gate,
+                )
+        finally:
+            if timing_stats is not None and timings is not None:
+                timing_stats._add(timings)
+
     def _initiate_hardware_sync_follower_channel(
         self,
         **kwargs,
@@ -698,11 +910,27 @@ class InstrumentManagerAsync(CapabilitiesMixin):
         async with self._lock():
             await create_future(self._comm.ClientConnection.SetMuxChannelAsync(channel))
 
+    def _discard_connection(self) -> None:
+        """Forget a broken connection without waiting for the instrument."""
+        if not self.is_connected():
+            return
+
+        _ = self.stop_recording_status()
+
+        try:
+            self._comm.Dispose()
+        except Exception:
+            pass
+
+        del self._comm
+
     async def disconnect(self):
         """Disconnect from the instrument."""
         if not self.is_connected():
             return
 
+        _ = self.stop_recording_status()
+
         await create_future(self._comm.DisconnectAsync())
         self._comm.Dispose()
         del self._comm
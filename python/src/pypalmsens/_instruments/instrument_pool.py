@@ -1,13 +1,20 @@
 from __future__ import annotations
 
-import asyncio
+import concurrent.futures
 from typing import TYPE_CHECKING, Any, Sequence
 
 from .._types import MethodType
 from .callback import Callback, CallbackEIS, Status
+from .dispatch import CallbackMetrics
+from .health import Backoff
 from .instrument import Instrument
 from .instrument_manager_async import InstrumentManagerAsync
 from .instrument_pool_async import InstrumentPoolAsync
+from .live_buffer import LiveBuffer
+from .shared import CallingThreadExecutor, run_nowait, run_sync
+from .software_sync import SyncResult
+from .timings import TimingStats
+from .watchdog import Watchdog
 
 if TYPE_CHECKING:
     from .._data.measurement import Measurement
@@ -16,7 +23,7 @@ if TYPE_CHECKING:
 class InstrumentPool:
     """Manages a set of instrument.
 
-    Most calls are run asynchronously in the background,
+    Most calls are run asynchronously on a shared event loop in a background thread,
     which means that measurements are running in parallel.
 
     This is a thin wrapper around the `InstrumentPoolAsync` class.
@@ -32,7 +39,6 @@ class InstrumentPool:
         devices_or_managers: Sequence[Instrument | InstrumentManagerAsync],
     ):
         self._async: InstrumentPoolAsync = InstrumentPoolAsync(devices_or_managers)
-        self._loop = asyncio.new_event_loop()
 
         self.managers: list[InstrumentManagerAsync] = self._async.managers
         """List of instruments managers in the pool."""
@@ -60,20 +66,24 @@ class InstrumentPool:
     def __getitem__(self, index: int) -> InstrumentManagerAsync:
         return self.managers[index]
 
-    def connect(self, attempts: int = 1) -> None:
+    def connect(self, attempts: int = 1, backoff: Backoff | None = None) -> None:
         """Connect all instrument managers in the pool.
 
+        Every manager is retried on its own, with increasing delays between the attempts.
+
         Parameters
         ----------
         attempts: int, optional
-            Number of attempts to establish connection.
+            Number of attempts to establish connection per manager.
             Use this if you experience connection issues via USB.
+        backoff: Backoff, optional
+            Delays between the attempts, by default starting at 0.5 s.
         """
-        self._loop.run_until_complete(self._async.connect(attempts=attempts))
+        run_sync(self._async.connect(attempts=attempts, backoff=backoff))
 
     def disconnect(self) -> None:
         """Disconnect all instrument managers in the pool."""
-        self._loop.run_until_complete(self._async.disconnect())
+        run_sync(self._async.disconnect())
 
     def is_connected(self) -> bool:
         """Return true if all managers in the pool are connected."""
@@ -91,7 +101,7 @@ class InstrumentPool:
         manager : InstrumentManagerAsync
             Instance of an instrument manager.
         """
-        self._loop.run_until_complete(self._async.remove(manager))
+        run_sync(self._async.remove(manager))
 
     def add(self, manager: InstrumentManagerAsync) -> None:
         """Open and add manager to the pool.
@@ -101,7 +111,7 @@ class InstrumentPool:
         manager : InstrumentManagerAsync
             Instance of an instrument manager.
         """
-        self._loop.run_until_complete(self._async.add(manager))
+        run_sync(self._async.add(manager))
 
     def status(self) -> list[Status]:
         """Return status for all managers in pool.
@@ -113,6 +123,93 @@ class InstrumentPool:
         """
         return [manager.status() for manager in self]
 
+    def callback_metrics(self) -> list[CallbackMetrics]:
+        """Return callback statistics for all managers in pool.
+
+        Returns
+        -------
+        list[CallbackMetrics]
+            List of callback latency and queue statistics, one per channel.
+        """
+        return [manager.callback_metrics for manager in self]
+
+    def enable_live_buffers(self, capacity: int = 100_000) -> list[LiveBuffer]:
+        """Assign a new live buffer to every manager in the pool.
+
+        Parameters
+        ----------
+        capacity : int
+            Maximum number of points to keep per channel.
+
+        Returns
+        -------
+        list[LiveBuffer]
+            List of live buffers, one per channel.
+        """
+        buffers = [LiveBuffer(capacity) for _ in self.managers]
+
+        for manager, buffer in zip(self.managers, buffers):
+            manager.live_buffer = buffer
+
+        return buffers
+
+    def live_buffers(self) -> list[LiveBuffer | None]:
+        """Return live buffers for all managers in pool.
+
+        Returns
+        -------
+        list[LiveBuffer | None]
+            List of live buffers, one per channel, None if not enabled.
+        """
+        return [manager.live_buffer for manager in self]
+
+    def enable_timings(self, maxlen: int = 10_000) -> TimingStats:
+        """Record the stage timings of all managers in the pool.
+
+        The timings of all channels are collected in a single `TimingStats`,
+        use `TimingStats.histograms()` for the percentiles of every stage.
+        The timings of every measurement are also available as `measurement.timings`.
+
+        Parameters
+        ----------
+        maxlen : int
+            Maximum number of measurements to keep.
+
+        Returns
+        -------
+        TimingStats
+            Timings shared by all channels.
+        """
+        stats = TimingStats(maxlen)
+
+        for manager in self.managers:
+            manager.timing_stats = stats
+
+        return stats
+
+    def enable_watchdog(self, watchdog: Watchdog | None = None) -> Watchdog:
+        """Abort measurements on all managers that take too long or stop sending data.
+
+        A stuck channel then raises a `MeasurementTimeoutError` instead of
+        stalling the measurement of the whole pool.
+
+        Parameters
+        ----------
+        watchdog : Watchdog, optional
+            Limits for all channels, by default `Watchdog()`.
+
+        Returns
+        -------
+        Watchdog
+            Watchdog shared by all channels.
+        """
+        watchdog = watchdog or Watchdog()
+
+        for manager in self.managers:
+            manager.watchdog = watchdog
+
+        return watchdog
+
     def measure(
         self,
         method: MethodType,
@@ -145,9 +242,80 @@ class InstrumentPool:
             The number of callbacks must match the number of channels.
 
             Specify a single callback to set the same function to all channels.
+
+            The callbacks are called on the thread that called `measure()`.
+        **kwargs
+            These keyword parameters are passed to the measure function.
+        """
+        executor = CallingThreadExecutor()
+
+        return run_sync(
+            self._async.measure(
+                method=method, callback=_wrap_callbacks(callback, executor), **kwargs
+            ),
+            executor=executor,
+        )
+
+    def measure_synchronized(
+        self,
+        method: MethodType,
+        callback: Sequence[Callback | CallbackEIS] | Callback | CallbackEIS | None = None,
+        **kwargs,
+    ) -> SyncResult:
+        """Start measurement on all managers in the pool together, without hardware sync.
+
+        All channels are prepared first, then the measurements are started back to back.
+        See `InstrumentPoolAsync.measure_synchronized()`.
+
+        Parameters
+        ----------
+        method : MethodType
+            Method parameters for measurement.
+        callback : list[Callback] | Callback | CallbackEIS | None
+            If specified, call these functions/this function on every new set of data points.
+            See `measure()`.
         **kwargs
             These keyword parameters are passed to the measure function.
+
+        Returns
+        -------
+        result : SyncResult
+            Measurements, in the order of the channels, and their start skew.
         """
-        return self._loop.run_until_complete(
-            self._async.measure(method=method, callback=callback, **kwargs)
+        executor = CallingThreadExecutor()
+
+        return run_sync(
+            self._async.measure_synchronized(
+                method=method, callback=_wrap_callbacks(callback, executor), **kwargs
+            ),
+            executor=executor,
         )
+
+    def measure_nowait(
+        self,
+        method: MethodType,
+        callback: Sequence[Callback | CallbackEIS] | Callback | CallbackEIS | None = None,
+        **kwargs,
+    ) -> concurrent.futures.Future[list[Measurement]]:
+        """Start measurement on all managers in the pool and return immediately.
+
+        See `measure()` for the parameters.
+
+        Returns
+        -------
+        future : concurrent.futures.Future[list[Measurement]]
+            Future with the finished measurements, one per channel.
+        """
+        return run_nowait(self._async.measure(method=method, callback=callback, **kwargs))
+
+
+def _wrap_callbacks(
+    callback: Sequence[Callback | CallbackEIS] | Callback | CallbackEIS | None,
+    executor: CallingThreadExecutor,
+) -> Sequence[Callback | CallbackEIS] | Callback | CallbackEIS | None:
+    """Wrap the callbacks to run them on the thread waiting for the measurement."""
+    if callback is None:
+        return None
+    if isinstance(callback, Sequence):
+        return [executor.wrap(item) for item in callback]
+    return executor.wrap(callback)
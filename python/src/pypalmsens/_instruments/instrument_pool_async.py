@@ -5,8 +5,14 @@ from typing import TYPE_CHECKING, Any, Awaitable, Protocol, Sequence
 
 from .._types import MethodType, MethodTypeCompatible
 from .callback import Callback, CallbackEIS, Status
+from .dispatch import CallbackMetrics
+from .health import Backoff, HealthCheck, PoolMonitor, connect_with_backoff
 from .instrument import Instrument
 from .instrument_manager_async import InstrumentManagerAsync
+from .live_buffer import LiveBuffer
+from .software_sync import SyncResult, _StartGate
+from .timings import TimingStats
+from .watchdog import Watchdog
 
 if TYPE_CHECKING:
     from .._data.measurement import Measurement
@@ -41,6 +47,9 @@ class InstrumentPoolAsync:
             else:
                 self.managers.append(item)
 
+        self.monitor: PoolMonitor | None = None
+        """Health checks of the channels, see `enable_health_checks()`."""
+
     def __repr__(self):
         ids = [manager.instrument.id for manager in self.managers]
         return f'{type(self).__name__}({ids}, connected={self.is_connected()})'
@@ -64,30 +73,37 @@ class InstrumentPoolAsync:
     def __getitem__(self, index: int) -> InstrumentManagerAsync:
         return self.managers[index]
 
-    async def connect(self, attempts: int = 1) -> None:
+    async def connect(self, attempts: int = 1, backoff: Backoff | None = None) -> None:
         """Connect all instrument managers in the pool.
 
+        Every manager is retried on its own, with increasing delays between the attempts.
+        Managers that are already connected are left as they are.
+
         Parameters
         ----------
         attempts: int, optional
-            Number of attempts to establish connection.
+            Number of attempts to establish connection per manager.
             Use this if you experience connection issues via USB.
+        backoff: Backoff, optional
+            Delays between the attempts, by default starting at 0.5 s.
         """
-        tasks = [manager.connect() for manager in self.managers]
-
-        try:
-            _ = await asyncio.gather(*tasks)
-        except Exception:
-            if attempts <= 1:
-                raise
-            await asyncio.sleep(0.5)
-        else:
-            return
+        backoff = backoff or Backoff()
 
-        await self.connect(attempts=attempts - 1)
+        results = await asyncio.gather(
+            *(connect_with_backoff(manager, attempts, backoff) for manager in self.managers),
+            return_exceptions=True,
+        )
+
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
 
     async def disconnect(self) -> None:
         """Disconnect all instrument managers in the pool."""
+        if self.monitor is not None:
+            await self.monitor.close()
+            self.monitor = None
+
         tasks = [manager.disconnect() for manager in self.managers]
         await asyncio.gather(*tasks)
 
@@ -131,6 +147,134 @@ class InstrumentPoolAsync:
         """
         return [manager.status() for manager in self]
 
+    def callback_metrics(self) -> list[CallbackMetrics]:
+        """Return callback statistics for all managers in pool.
+
+        Returns
+        -------
+        list[CallbackMetrics]
+            List of callback latency and queue statistics, one per channel.
+        """
+        return [manager.callback_metrics for manager in self]
+
+    def enable_live_buffers(self, capacity: int = 100_000) -> list[LiveBuffer]:
+        """Assign a new live buffer to every manager in the pool.
+
+        Parameters
+        ----------
+        capacity : int
+            Maximum number of points to keep per channel.
+
+        Returns
+        -------
+        list[LiveBuffer]
+            List of live buffers, one per channel.
+        """
+        buffers = [LiveBuffer(capacity) for _ in self.managers]
+
+        for manager, buffer in zip(self.managers, buffers):
+            manager.live_buffer = buffer
+
+        return buffers
+
+    def live_buffers(self) -> list[LiveBuffer | None]:
+        """Return live buffers for all managers in pool.
+
+        Returns
+        -------
+        list[LiveBuffer | None]
+            List of live buffers, one per channel, None if not enabled.
+        """
+        return [manager.live_buffer for manager in self]
+
+    def enable_timings(self, maxlen: int = 10_000) -> TimingStats:
+        """Record the stage timings of all managers in the pool.
+
+        The timings of all channels are collected in a single `TimingStats`,
+        use `TimingStats.histograms()` for the percentiles of every stage.
+        The timings of every measurement are also available as `measurement.timings`.
+
+        Parameters
+        ----------
+        maxlen : int
+            Maximum number of measurements to keep.
+
+        Returns
+        -------
+        TimingStats
+            Timings shared by all channels.
+        """
+        stats = TimingStats(maxlen)
+
+        for manager in self.managers:
+            manager.timing_stats = stats
+
+        return stats
+
+    def enable_watchdog(self, watchdog: Watchdog | None = None) -> Watchdog:
+        """Abort measurements on all managers that take too long or stop sending data.
+
+        A stuck channel then raises a `MeasurementTimeoutError` instead of
+        stalling the measurement of the whole pool.
+
+        Parameters
+        ----------
+        watchdog : Watchdog, optional
+            Limits for all channels, by default `Watchdog()`.
+
+        Returns
+        -------
+        Watchdog
+            Watchdog shared by all channels.
+        """
+        watchdog = watchdog or Watchdog()
+
+        for manager in self.managers:
+            manager.watchdog = watchdog
+
+        return watchdog
+
+    def enable_health_checks(
+        self,
+        interval: float = 5.0,
+        *,
+        backoff: Backoff | None = None,
+        check: HealthCheck | None = None,
+        timeout: float = 5.0,
+    ) -> PoolMonitor:
+        """Check the channels regularly and reconnect the channels that fail.
+
+        Failed channels are quarantined and reconnected in the background
+        with exponential backoff, while the other channels keep running.
+        Must be called from a running event loop. The checks stop on `disconnect()`.
+
+        Parameters
+        ----------
+        interval : float
+            Time between health checks in s.
+        backoff : Backoff, optional
+            Delays between reconnection attempts.
+        check : Callable, optional
+            Async function that is called with the manager and raises if the channel
+            is not healthy. By default, read the current.
+        timeout : float
+            Time in s after which a health check counts as failed.
+
+        Returns
+        -------
+        PoolMonitor
+            Monitor with the quarantined channels and the history of health events.
+        """
+        if self.monitor is not None:
+            raise RuntimeError('Health checks are already enabled for this pool.')
+
+        self.monitor = PoolMonitor(
+            self, interval=interval, backoff=backoff, check=check, timeout=timeout
+        )
+        self.monitor.start()
+
+        return self.monitor
+
     async def measure(
         self,
         method: MethodType,
@@ -168,14 +312,7 @@ class InstrumentPoolAsync:
         """
         tasks: list[Awaitable[Measurement]] = []
 
-        callbacks: Sequence[Callback | CallbackEIS | None]
-
-        if isinstance(callback, Sequence):
-            if len(callback) != len(self.managers):
-                raise IndexError('Number of callbacks does not match number of channels.')
-            callbacks = callback
-        else:
-            callbacks = [callback or None for _ in self.managers]
+        callbacks = self._callbacks(callback)
 
         if method._use_hardware_sync:
             return await self._measure_hw_sync(method, callbacks=callbacks)
@@ -259,6 +396,90 @@ class InstrumentPoolAsync:
         results = await asyncio.gather(*tasks)
         return results
 
+    async def measure_synchronized(
+        self,
+        method: MethodType,
+        callback: Sequence[Callback | CallbackEIS] | Callback | CallbackEIS | None = None,
+        **kwargs,
+    ) -> SyncResult:
+        """Start measurement on all managers in the pool together, without hardware sync.
+
+        Use this for separate instruments, hardware synchronization
+        (see `measure()`) only works within a single multichannel instrument.
+
+        All channels are prepared first: the method is converted and validated,
+        and the connection lock is acquired. Then `MeasureAsync` is called on
+        all channels back to back. The remaining start skew is measured from the
+        begin measurement events, see `SyncResult.skew`. Use `SyncResult.aligned()`
+        to compare the data on a common time axis.
+
+        Parameters
+        ----------
+        method : MethodType
+            Method parameters for measurement.
+        callback : list[Callback] | Callback | CallbackEIS | None
+            If specified, call these functions/this function on every new set of data points.
+            See `measure()`.
+        **kwargs
+            These keyword parameters are passed to the measure function.
+
+        Returns
+        -------
+        result : SyncResult
+            Measurements, in the order of the channels, and their start skew.
+        """
+        if method._use_hardware_sync:
+            raise ValueError('Use `measure()` for hardware synchronization.')
+
+        callbacks = self._callbacks(callback)
+        gate = _StartGate(len(self.managers))
+        tasks: list[asyncio.Future[Measurement]] = []
+
+        for manager, callback in zip(self.managers, callbacks):
+            task = asyncio.ensure_future(
+                manager.measure(method, callback=callback, start_gate=gate, **kwargs)
+            )
+            task.add_done_callback(gate._on_done)
+            tasks.append(task)
+
+        measurements = await asyncio.gather(*tasks)
+
+        if gate.released is None or gate.spread is None:
+            raise RuntimeError(
+                'Measurements finished, but the synchronized start never happened.'
+            )
+
+        begin_times = []
+
+        for manager, measurement in zip(self.managers, measurements):
+            timings = measurement.timings
+
+            if timings is None or timings.begin_event is None:
+                raise RuntimeError(
+                    f'No begin measurement event received from {manager.instrument.id}.'
+                )
+
+            begin_times.append(timings.begin_event)
+
+        return SyncResult(
+            measurements=measurements,
+            begin_times=begin_times,
+            released=gate.released,
+            release_spread=gate.spread,
+        )
+
+    def _callbacks(
+        self,
+        callback: Sequence[Callback | CallbackEIS] | Callback | CallbackEIS | None,
+    ) -> Sequence[Callback | CallbackEIS | None]:
+        """Return one callback per channel."""
+        if isinstance(callback, Sequence):
+            if len(callback) != len(self.managers):
+                raise IndexError('Number of callbacks does not match number of channels.')
+            return callback
+
+        return [callback or None for _ in self.managers]
+
     async def submit(self, func: SubmitCallable, **kwargs: Any) -> list[Any]:
         """Concurrently start measurement on all managers in the pool.
 
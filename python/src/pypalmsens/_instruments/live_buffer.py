@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from threading import Lock
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from .callback import CallbackData
+
+_X, _Y, _CURVE, _TIME = range(4)
+
+
+@dataclass(frozen=True, slots=True)
+class LiveSnapshot:
+    """Copy of the most recent points in a `LiveBuffer`, oldest first."""
+
+    x: np.ndarray
+    """X values."""
+
+    y: np.ndarray
+    """Y values."""
+
+    curve: np.ndarray
+    """Curve number for every point, counted since the buffer was created or reset."""
+
+    timestamp: np.ndarray
+    """Time (`time.time()`) at which every point was received."""
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+
+@dataclass(frozen=True, slots=True)
+class DecimatedSnapshot:
+    """Min/max decimated view of a `LiveBuffer`, for plotting.
+
+    Every bin contains the first x value and the
+    minimum and maximum y value of the points in the bin."""
+
+    x: np.ndarray
+    """X value at the start of every bin."""
+
+    y_min: np.ndarray
+    """Minimum y value in every bin."""
+
+    y_max: np.ndarray
+    """Maximum y value in every bin."""
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+
+class LiveBuffer:
+    """Fixed-capacity ring buffer with the most recent data of a channel.
+
+    Assign an instance to `InstrumentManager.live_buffer` or
+    `InstrumentManagerAsync.live_buffer` to have the measurement manager fill it
+    with the new data of every curve. Once full, the oldest points are overwritten.
+
+    The buffer can be read from any thread, e.g. by a dashboard polling the data.
+    Reads only copy the requested points, and the internal lock is held
+    only for the copy.
+
+    Parameters
+    ----------
+    capacity : int
+        Maximum number of points to keep.
+    """
+
+    def __init__(self, capacity: int = 100_000):
+        if capacity < 1:
+            raise ValueError('Capacity must be at least 1.')
+
+        self.capacity: int = capacity
+        """Maximum number of points to keep."""
+
+        self._data: np.ndarray = np.empty((capacity, 4), dtype=np.float64)
+        self._lock: Lock = Lock()
+        self._n_written: int = 0
+        self._curve: int = -1
+
+    def __repr__(self):
+        return f'{type(self).__name__}(capacity={self.capacity}, n_points={len(self)})'
+
+    def __len__(self) -> int:
+        return min(self._n_written, self.capacity)
+
+    @property
+    def n_written(self) -> int:
+        """Total number of points written since the last reset."""
+        return self._n_written
+
+    def reset(self) -> None:
+        """Remove all points."""
+        with self._lock:
+            self._n_written = 0
+            self._curve = -1
+
+    def append(
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        *,
+        timestamp: float | None = None,
+    ) -> None:
+        """Append points to the buffer.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            New x values.
+        y : np.ndarray
+            New y values, same length as `x`.
+        timestamp : float, optional
+            Time the points were received, defaults to `time.time()`.
+        """
+        n = len(x)
+
+        if n != len(y):
+            raise ValueError('x and y must have the same length.')
+
+        if n == 0:
+            return
+
+        if timestamp is None:
+            timestamp = time.time()
+
+        # Only the last `capacity` points survive
+        if n > self.capacity:
+            x = x[-self.capacity :]
+            y = y[-self.capacity :]
+            skipped = n - self.capacity
+        else:
+            skipped = 0
+
+        block = np.empty((len(x), 4), dtype=np.float64)
+        block[:, _X] = x
+        block[:, _Y] = y
+        block[:, _TIME] = timestamp
+
+        with self._lock:
+            block[:, _CURVE] = max(self._curve, 0)
+
+            start = (self._n_written + skipped) % self.capacity
+            first = min(len(block), self.capacity - start)
+
+            self._data[start : start + first] = block[:first]
+            self._data[: len(block) - first] = block[first:]
+
+            self._n_written += n
+
+    def _start_curve(self, *args) -> None:
+        """Mark the start of a new curve, called by the measurement manager."""
+        with self._lock:
+            self._curve += 1
+
+    def _append_data(self, data: CallbackData) -> None:
+        """Append new data of the curve, called by the measurement manager."""
+        # Copy x and y together, the arrays can grow between two separate copies
+        block = data.new_block()
+        self.append(block[:, 0], block[:, 1])
+
+    def _copy(self, n: int) -> np.ndarray:
+        """Return copy of the last `n` rows, oldest first. Must hold the lock."""
+        n = min(n, len(self))
+        stop = self._n_written % self.capacity
+
+        if n <= stop:
+            return self._data[stop - n : stop].copy()
+
+        return np.concatenate((self._data[self.capacity - (n - stop) :], self._data[:stop]))
+
+    def _count_since(self, timestamp: float) -> int:
+        """Return number of points received at or after `timestamp`. Must hold the lock."""
+        n = len(self)
+        stop = self._n_written % self.capacity
+
+        # The timestamps are sorted in write order, which is split into
+        # an older segment `[stop, capacity)` (if full) and a newer segment `[0, stop)`
+        newer = self._data[:stop, _TIME]
+        count = stop - int(np.searchsorted(newer, timestamp, side='left'))
+
+        if count == stop and n > stop:
+            older = self._data[stop:, _TIME]
+            count += len(older) - int(np.searchsorted(older, timestamp, side='left'))
+
+        return count
+
+    @staticmethod
+    def _snapshot(rows: np.ndarray) -> LiveSnapshot:
+        return LiveSnapshot(
+            x=rows[:, _X],
+            y=rows[:, _Y],
+            curve=rows[:, _CURVE].astype(np.int64),
+            timestamp=rows[:, _TIME],
+        )
+
+    def last(self, n: int | None = None) -> LiveSnapshot:
+        """Return the last `n` points.
+
+        Parameters
+        ----------
+        n : int, optional
+            Number of points, defaults to all points in the buffer.
+
+        Returns
+        -------
+        snapshot : LiveSnapshot
+            Copy of the points, oldest first.
+        """
+        with self._lock:
+            rows = self._copy(len(self) if n is None else n)
+
+        return self._snapshot(rows)
+
+    def last_seconds(self, seconds: float) -> LiveSnapshot:
+        """Return the points received in the last `seconds` before the newest point.
+
+        Parameters
+        ----------
+        seconds : float
+            Length of the time window in s.
+
+        Returns
+        -------
+        snapshot : LiveSnapshot
+            Copy of the points, oldest first.
+        """
+        with self._lock:
+            if not len(self):
+                rows = self._copy(0)
+            else:
+                newest = self._data[(self._n_written - 1) % self.capacity, _TIME]
+                rows = self._copy(self._count_since(newest - seconds))
+
+        return self._snapshot(rows)
+
+    def decimated(self, n_bins: int, n: int | None = None) -> DecimatedSnapshot:
+        """Return a min/max decimated view of the last `n` points.
+
+        The points are divided into `n_bins` bins of (almost) equal size.
+        Plotting the minimum and maximum of every bin preserves peaks and noise
+        that would be lost by plotting every k-th point.
+
+        Parameters
+        ----------
+        n_bins : int
+            Number of bins.
+        n : int, optional
+            Number of points, defaults to all points in the buffer.
+
+        Returns
+        -------
+        snapshot : DecimatedSnapshot
+            Decimated data, with at most `n_bins` bins.
+        """
+        snapshot = self.last(n)
+
+        if len(snapshot) <= n_bins:
+            return DecimatedSnapshot(x=snapshot.x, y_min=snapshot.y, y_max=snapshot.y)
+
+        edges = np.linspace(0, len(snapshot), n_bins, endpoint=False).astype(np.intp)
+
+        return DecimatedSnapshot(
+            x=snapshot.x[edges],
+            y_min=np.minimum.reduceat(snapshot.y, edges),
+            y_max=np.maximum.reduceat(snapshot.y, edges),
+        )
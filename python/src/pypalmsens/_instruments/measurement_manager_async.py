@@ -1,27 +1,52 @@
 from __future__ import annotations
 
 import asyncio
+import gzip
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
+from datetime import datetime
+from functools import partial
 from io import BytesIO
 from pathlib import Path
-from typing import Any, Callable, Generator
+from typing import Any, Awaitable, Callable, Generator, Literal, TypeVar
 
 import PalmSens
 import System
-from PalmSens import AsyncEventHandler, Plottables
+from PalmSens import Plottables
 from PalmSens.Comm import CommManager
-from pydantic import ConfigDict, Field, TypeAdapter, computed_field
+from pydantic import ConfigDict, Field, SkipValidation, TypeAdapter, computed_field
 from pydantic.dataclasses import dataclass
-from System import EventHandler
 from System.Threading.Tasks import Task
 
 from pypalmsens._methods.energy import BaseMethodScriptTechnique
 from pypalmsens._types import MethodTypeCompatible
 
 from .._data import DataSet
+from .._data.stream import (
+    DataStream,
+    StreamManifest,
+    StreamSegment,
+    _manifest_path,
+    _segment_path,
+)
 from ..data import Curve, DataArray, EISData, Measurement
+from .broadcast import LivePublisher
 from .callback import Callback, CallbackData, CallbackDataEIS, CallbackEIS, DataRow
-from .shared import create_future
+from .dispatch import CallbackDispatcher, CallbackMetrics, EventCoalescer, ExecutorCallback
+from .live_buffer import LiveBuffer
+from .shared import MeasurementTimeoutError, create_future
+from .software_sync import _StartGate
+from .timings import MeasurementTimings
+from .watchdog import Watchdog
+
+T = TypeVar('T')
+
+EventCallback = Callable[[Any, Any], Any]
+"""Handler for .NET events, called with the sender and the event args."""
 
 
 @dataclass
@@ -78,9 +103,27 @@ class Callbacks:
 class JSONWriter:
     filename: Path | str
     """File to write to."""
+    options: DataStream | None = None
+    """If set, write to numbered segments with a manifest, see `DataStream`."""
     _stream: BytesIO | None = None
     _adapter: TypeAdapter[DataRow] = TypeAdapter(DataRow)
 
+    # Segment bookkeeping, only used with `options`
+    _header: dict[Any, bytes] = Field(default_factory=dict)
+    _manifest: StreamManifest = Field(default_factory=StreamManifest)
+    _manifest_lock: SkipValidation[threading.Lock] = Field(default_factory=threading.Lock)
+    _compressor: ThreadPoolExecutor | None = None
+    _n_rows: int = 0
+    _n_bytes: int = 0
+    _segment_started: float = 0.0
+
+    @classmethod
+    def from_stream(cls, stream: DataStream | Path | str) -> JSONWriter:
+        """Create writer for the `stream` argument of `measure()`."""
+        if isinstance(stream, DataStream):
+            return cls(filename=stream.path, options=stream)
+        return cls(filename=stream)
+
     @computed_field
     @property
     def callbacks(self) -> Callbacks:
@@ -88,54 +131,161 @@ class JSONWriter:
             measurement_begin=[self._write_measurement_metadata_to_stream],
             curve_start=[self._write_curve_metadata_to_stream],
             curve_new_data=[self._write_data_to_stream],
+            curve_finished=[self._forget_curve_metadata],
             eis_data_start=[self._write_eis_metadata_to_stream],
             eis_data_new_data=[self._write_eis_data_to_stream],
             setup=[self._stream_open],
             teardown=[self._stream_close],
         )
 
-    def _write_curve_metadata_to_stream(self, curve: Curve):
+    def _write_line(self, line: bytes, *, row: bool = False):
         assert self._stream
-        _ = self._stream.write(curve.metadata_json())
+        _ = self._stream.write(line)
         _ = self._stream.write(b'\n')
 
-        self._stream.flush()
+        self._n_bytes += len(line) + 1
+        self._n_rows += row
 
-    def _write_measurement_metadata_to_stream(self, measurement: Measurement):
-        assert self._stream
-        _ = self._stream.write(measurement.metadata_json())
-        _ = self._stream.write(b'\n')
+    def _write_header(self, key: Any, line: bytes):
+        """Write metadata, and repeat it at the start of every new segment."""
+        if self.options is not None:
+            self._header[key] = line
 
+        self._write_line(line)
+        assert self._stream
         self._stream.flush()
 
+    def _write_curve_metadata_to_stream(self, curve: Curve):
+        self._write_header(('curve', curve._pscurve.GetHashCode()), curve.metadata_json())
+
+    def _forget_curve_metadata(self, curve: Curve):
+        _ = self._header.pop(('curve', curve._pscurve.GetHashCode()), None)
+
+    def _write_measurement_metadata_to_stream(self, measurement: Measurement):
+        self._write_header('measurement', measurement.metadata_json())
+
     def _write_data_to_stream(self, data: CallbackData):
         assert self._stream
         for row in data._streaming_rows():
-            _ = self._stream.write(self._adapter.dump_json(row))
-            _ = self._stream.write(b'\n')
+            self._write_line(self._adapter.dump_json(row), row=True)
 
         self._stream.flush()
+        self._check_rollover()
 
     def _write_eis_metadata_to_stream(self, eis_data: EISData):
-        assert self._stream
-        _ = self._stream.write(eis_data.metadata_json())
-        _ = self._stream.write(b'\n')
-        self._stream.flush()
+        # Only the current EIS data set receives new data
+        self._write_header('eis', eis_data.metadata_json())
 
     def _write_eis_data_to_stream(self, data: CallbackDataEIS):
         assert self._stream
         for row in data._streaming_rows():
-            _ = self._stream.write(self._adapter.dump_json(row))
-            _ = self._stream.write(b'\n')
+            self._write_line(self._adapter.dump_json(row), row=True)
+
         self._stream.flush()
+        self._check_rollover()
 
     def _stream_open(self):
-        self._stream = open(self.filename, 'wb')
+        if self.options is None:
+            self._stream = open(self.filename, 'wb')
+            return
+
+        if self.options.compress:
+            self._compressor = ThreadPoolExecutor(max_workers=1)
+
+        self._open_segment()
 
     def _stream_close(self):
         assert self._stream
+
+        if self.options is None:
+            self._stream.close()
+            return
+
+        self._close_segment()
+
+        with self._manifest_lock:
+            self._manifest.finished = True
+            self._write_manifest()
+
+        if self._compressor is not None:
+            self._compressor.shutdown(wait=True)
+
+    def _check_rollover(self):
+        """Start a new segment if the current segment exceeds one of the limits.
+
+        Called only after a complete batch, so that rows are never split."""
+        options = self.options
+
+        if options is None:
+            return
+
+        if (
+            (options.max_bytes is not None and self._n_bytes >= options.max_bytes)
+            or (options.max_rows is not None and self._n_rows >= options.max_rows)
+            or (
+                options.max_seconds is not None
+                and time.monotonic() - self._segment_started >= options.max_seconds
+            )
+        ):
+            self._close_segment()
+            self._open_segment()
+
+    def _open_segment(self):
+        with self._manifest_lock:
+            index = len(self._manifest.segments)
+            path = _segment_path(self.filename, index)
+
+            self._manifest.segments.append(
+                StreamSegment(index=index, filename=path.name, started=datetime.now())
+            )
+            self._write_manifest()
+
+        self._stream = open(path, 'wb')
+        self._n_rows = 0
+        self._n_bytes = 0
+        self._segment_started = time.monotonic()
+
+        for line in self._header.values():
+            self._write_line(line)
+
+        self._stream.flush()
+
+    def _close_segment(self):
+        assert self._stream
         self._stream.close()
 
+        with self._manifest_lock:
+            segment = self._manifest.segments[-1]
+            segment.n_rows = self._n_rows
+            segment.n_bytes = self._n_bytes
+            segment.closed = True
+            self._write_manifest()
+
+        if self._compressor is not None:
+            _ = self._compressor.submit(self._compress_segment, segment)
+
+    def _compress_segment(self, segment: StreamSegment):
+        """Compress a closed segment, runs on the compression thread."""
+        path = Path(self.filename).with_name(segment.filename)
+        compressed = path.with_name(path.name + '.gz')
+
+        with open(path, 'rb') as f_in, gzip.open(compressed, 'wb') as f_out:
+            shutil.copyfileobj(f_in, f_out)
+
+        with self._manifest_lock:
+            segment.filename = compressed.name
+            segment.compressed = True
+            self._write_manifest()
+
+        path.unlink()
+
+    def _write_manifest(self):
+        """Replace manifest atomically, requires the manifest lock."""
+        path = _manifest_path(self.filename)
+        tmp = path.with_name(path.name + '.tmp')
+        _ = tmp.write_text(self._manifest.model_dump_json(indent=2))
+        _ = os.replace(tmp, path)
+
 
 class MeasurementManagerAsync:
     """Measurement helper class that manages the instrument communication and handles events."""
@@ -146,10 +296,31 @@ class MeasurementManagerAsync:
         self,
         *,
         comm: CommManager,
+        callback_metrics: CallbackMetrics | None = None,
+        live_buffer: LiveBuffer | None = None,
+        publisher: LivePublisher | None = None,
+        source: str = '',
+        timings: MeasurementTimings | None = None,
+        watchdog: Watchdog | None = None,
     ):
         self.comm: CommManager = comm
         self.callback: Callback | CallbackEIS | None = None
 
+        self.callback_metrics: CallbackMetrics = callback_metrics or CallbackMetrics()
+        """Callback latency and queue statistics."""
+        self.live_buffer: LiveBuffer | None = live_buffer
+        """If set, fill this buffer with the new curve data."""
+        self.publisher: LivePublisher | None = publisher
+        """If set, publish the new data to subscribers."""
+        self.source: str = source
+        """Name of the channel used when publishing data."""
+        self.timings: MeasurementTimings | None = timings
+        """If set, record the timestamps of the measurement stages."""
+        self.watchdog: Watchdog | None = watchdog
+        """If set, abort the measurement if it takes too long or stops sending data."""
+        self.dispatcher: CallbackDispatcher
+        self.coalescer: EventCoalescer
+
         self.is_measuring: bool = False
         self.last_measurement: Measurement | None = None
 
@@ -161,35 +332,31 @@ class MeasurementManagerAsync:
         self.setup_handlers()
 
         self.eis_last_data_index: int = 0
+        self._eis_columns: dict[int, tuple[DataSet, list[DataArray]]] = {}
+        self._curve_arrays: dict[int, tuple[DataArray, DataArray]] = {}
 
-    def setup_handlers(self):
-        self.begin_measurement_handler: AsyncEventHandler = AsyncEventHandler[
-            CommManager.BeginMeasurementEventArgsAsync
-        ](self.begin_measurement_callback)
+        # Watchdog limits as `time.monotonic()` values, updated from the event threads
+        self._deadline: float | None = None
+        self._data_deadline: float | None = None
+        self._pretreatment_duration: float = 0.0
 
-        self.end_measurement_handler: AsyncEventHandler = AsyncEventHandler[
-            CommManager.EndMeasurementAsyncEventArgs
-        ](self.end_measurement_callback)
+    def setup_handlers(self):
+        # pythonnet converts the callbacks to the delegate type of the .NET event,
+        # and events of the simulated instrument call them directly
+        self.begin_measurement_handler: EventCallback = self.begin_measurement_callback
+        self.end_measurement_handler: EventCallback = self.end_measurement_callback
 
-        self.begin_receive_curve_handler: EventHandler = Plottables.CurveEventHandler(
-            self.begin_receive_curve_callback
-        )
-        self.curve_data_added_handler: EventHandler = Plottables.Curve.NewDataAddedEventHandler(
-            self.curve_data_added_callback
-        )
-        self.curve_finished_handler: EventHandler = EventHandler(self.curve_finished_callback)
+        self.begin_receive_curve_handler: EventCallback = self.begin_receive_curve_callback
+        self.curve_data_added_handler: EventCallback = self.curve_data_added_callback
+        self.curve_finished_handler: EventCallback = self.curve_finished_callback
 
-        self.begin_receive_eis_data_handler: EventHandler = Plottables.EISDataEventHandler(
+        self.begin_receive_eis_data_handler: EventCallback = (
             self.begin_receive_eis_data_callback
         )
-        self.eis_data_data_added_handler: EventHandler = Plottables.EISData.NewDataEventHandler(
-            self.eis_data_data_added_callback
-        )
-        self.eis_data_finished_handler: EventHandler = EventHandler(
-            self.eis_data_finished_callback
-        )
+        self.eis_data_data_added_handler: EventCallback = self.eis_data_data_added_callback
+        self.eis_data_finished_handler: EventCallback = self.eis_data_finished_callback
 
-        self.comm_error_handler: EventHandler = EventHandler(self.comm_error_callback)
+        self.comm_error_handler: EventCallback = self.comm_error_callback
 
     def setup(self):
         """Subscribe to events indicating the start and end of the measurement."""
@@ -198,10 +365,12 @@ class MeasurementManagerAsync:
         self.comm.EndMeasurementAsync += self.end_measurement_handler
         self.comm.Disconnected += self.comm_error_handler
 
-        if self.callbacks.eis_data_new_data:
+        watch_data = self._watch_data()
+
+        if self.callbacks.eis_data_new_data or watch_data:
             self.comm.BeginReceiveEISData += self.begin_receive_eis_data_handler
 
-        if self.callbacks.curve_new_data:
+        if self.callbacks.curve_new_data or watch_data:
             self.comm.BeginReceiveCurve += self.begin_receive_curve_handler
 
     def teardown(self):
@@ -210,10 +379,12 @@ class MeasurementManagerAsync:
         self.comm.EndMeasurementAsync -= self.end_measurement_handler
         self.comm.Disconnected -= self.comm_error_handler
 
-        if self.callbacks.eis_data_new_data:
+        watch_data = self._watch_data()
+
+        if self.callbacks.eis_data_new_data or watch_data:
             self.comm.BeginReceiveEISData -= self.begin_receive_eis_data_handler
 
-        if self.callbacks.curve_new_data:
+        if self.callbacks.curve_new_data or watch_data:
             self.comm.BeginReceiveCurve -= self.begin_receive_curve_handler
 
         self.is_measuring = False
@@ -229,12 +400,6 @@ class MeasurementManagerAsync:
 
             yield
 
-        except Exception:
-            if self.comm.ClientConnection.Semaphore.CurrentCount == 0:
-                _ = self.comm.ClientConnection.Semaphore.Release()
-
-            raise
-
         finally:
             self.teardown()
 
@@ -245,30 +410,149 @@ class MeasurementManagerAsync:
         self,
         method: PalmSens.Method,
         sync_event: asyncio.Event | None = None,
+        start_gate: _StartGate | None = None,
     ):
         """Helper function to handle the measurement.
 
         Obtaining a lock on the `ClientConnection` (via semaphore) is required when
-        communicating with the instrument."""
-        await create_future(self.comm.ClientConnection.Semaphore.WaitAsync())
+        communicating with the instrument. With a start gate, the lock is held
+        until all channels are prepared and `MeasureAsync` is called on all of them."""
+        timings = self.timings
+        semaphore = self.comm.ClientConnection.Semaphore
+
+        if timings is not None:
+            timings._mark('lock_requested')
+
+        await create_future(semaphore.WaitAsync())
+
+        if timings is not None:
+            timings._mark('lock_acquired')
+
+        started: Task | None = None
+
+        try:
+            try:
+                if start_gate is None:
+                    started = self.comm.MeasureAsync(method)
+                else:
+                    started = await start_gate.start(partial(self.comm.MeasureAsync, method))
+
+                if self.watchdog is not None:
+                    deadline, self._pretreatment_duration = self.watchdog._limits(
+                        method, self.comm.Capabilities
+                    )
+                    if deadline is not None:
+                        self._deadline = time.monotonic() + deadline
+
+                _ = await self._watch(create_future(started))
+            finally:
+                if started is None or started.IsCompleted:
+                    _ = semaphore.Release()
+                else:
+                    # Timed out while starting, keep the lock until the instrument has started
+                    started.GetAwaiter().OnCompleted(System.Action(semaphore.Release))
+
+            if timings is not None:
+                timings._mark('started')
+
+                # The begin event can arrive before the start task has completed
+                if timings.begin_event is not None and timings.started is not None:
+                    timings.started = min(timings.started, timings.begin_event)
+
+            _ = await self._watch(self.begin_measurement_event.wait())
+
+            if sync_event is not None:
+                sync_event.set()
+
+            _ = await self._watch(self.end_measurement_event.wait())
+
+        except MeasurementTimeoutError:
+            await self._abort()
+            raise
+
+    def _watch_data(self) -> bool:
+        """Return true if the data events are needed, also without callbacks.
 
-        _ = await create_future(self.comm.MeasureAsync(method))
+        The timings mark the first and last data, and the no-data watchdog
+        restarts its timer on every data event."""
+        return self.timings is not None or self._data_timeout() is not None
 
-        _ = self.comm.ClientConnection.Semaphore.Release()
+    def _data_timeout(self) -> float | None:
+        return None if self.watchdog is None else self.watchdog.data_timeout
 
-        _ = await self.begin_measurement_event.wait()
+    def _feed_watchdog(self) -> None:
+        """Restart the no-data timer, called on every data event."""
+        if (data_timeout := self._data_timeout()) is not None:
+            self._data_deadline = time.monotonic() + data_timeout
 
-        if sync_event is not None:
-            sync_event.set()
+    async def _watch(self, awaitable: Awaitable[T]) -> T:
+        """Await, or raise `MeasurementTimeoutError` if a watchdog limit passes first."""
+        if self.watchdog is None:
+            return await awaitable
 
-        _ = await self.end_measurement_event.wait()
+        task = asyncio.ensure_future(awaitable)
+
+        try:
+            while True:
+                # The no-data limit moves with every data event, check again after waiting
+                limits: list[tuple[float, Literal['deadline', 'no_data']]] = []
+
+                if self._deadline is not None:
+                    limits.append((self._deadline, 'deadline'))
+                if self._data_deadline is not None:
+                    limits.append((self._data_deadline, 'no_data'))
+
+                if not limits:
+                    return await task
+
+                limit, reason = min(limits)
+                remaining = limit - time.monotonic()
+
+                if remaining <= 0:
+                    raise MeasurementTimeoutError(
+                        (
+                            'Measurement took longer than the deadline'
+                            if reason == 'deadline'
+                            else 'No new data received within the data timeout'
+                        ),
+                        reason=reason,
+                        measurement=self.last_measurement,
+                    )
+
+                done, _ = await asyncio.wait((task,), timeout=remaining)
+
+                if done:
+                    return task.result()
+        finally:
+            _ = task.cancel()
+
+    async def _abort(self) -> None:
+        """Abort the measurement after a watchdog timeout."""
+        assert self.watchdog is not None
+
+        semaphore = self.comm.ClientConnection.Semaphore
+        timeout = self.watchdog.abort_timeout
+
+        # Do not wait forever for a connection that is stuck itself
+        if not await create_future(semaphore.WaitAsync(int(timeout * 1000))):
+            return
+
+        try:
+            await asyncio.wait_for(create_future(self.comm.AbortAsync()), timeout)
+        except Exception:
+            # The timeout error is raised regardless
+            pass
+        finally:
+            _ = semaphore.Release()
 
     async def measure(
         self,
         method: MethodTypeCompatible,
         callback: Callback | CallbackEIS | None = None,
         sync_event: asyncio.Event | None = None,
-        stream: Path | str | None = None,
+        stream: DataStream | Path | str | None = None,
+        psmethod: PalmSens.Method | None = None,
+        start_gate: _StartGate | None = None,
     ) -> Measurement:
         """Measure given method.
 
@@ -280,33 +564,82 @@ class MeasurementManagerAsync:
             Gets called every time new data is added
         sync_event: Event, optional
             Used to pass event for hardware synchronization
+        stream: DataStream | Path | str, optional
+            If defined, stream data to this file, or to segments, see `DataStream`
+        psmethod: PalmSens.Method, optional
+            Method converted by the caller, by default the method is converted here
+        start_gate: _StartGate, optional
+            Used to call `MeasureAsync` together with other channels
 
         Returns
         -------
         measurement : Measurement
         """
-        psmethod = method._to_psmethod()
+        if psmethod is None:
+            psmethod = method._to_psmethod()
 
         self.loop = asyncio.get_running_loop()
+        self.dispatcher = CallbackDispatcher(self.loop, self.callback_metrics)
+        self.coalescer = EventCoalescer(self.loop, self._dispatch_curve_data)
         self.begin_measurement_event = asyncio.Event()
         self.end_measurement_event = asyncio.Event()
 
+        self._deadline = None
+        self._data_deadline = None
+
         self.callbacks = Callbacks()
 
         if stream:
-            self.callbacks.append(JSONWriter(filename=stream).callbacks)
+            self.callbacks.append(JSONWriter.from_stream(stream).callbacks)
+
+        if self.live_buffer is not None:
+            self.callbacks.curve_start.append(self.live_buffer._start_curve)
+            self.callbacks.curve_new_data.append(self.live_buffer._append_data)
+
+        is_eis = method.id in ('eis', 'geis', 'fis', 'fgis')
 
         if callback:
-            if method.id in ('eis', 'geis', 'fis', 'fgis'):
+            if is_eis:
                 self.callbacks.eis_data_new_data.append(callback)  # type: ignore
             else:
                 self.callbacks.curve_new_data.append(callback)  # type: ignore
 
+        if self.publisher is not None:
+            publisher = self.publisher
+
+            if is_eis:
+                self.callbacks.eis_data_new_data.append(
+                    partial(publisher._publish_eis_data, self.source)
+                )
+            else:
+                self.callbacks.curve_new_data.append(
+                    partial(publisher._publish_curve_data, self.source)
+                )
+
+            self.callbacks.measurement_end.append(partial(publisher._publish_end, self.source))
+
         with self._measurement_context():
-            await self.await_measurement(method=psmethod, sync_event=sync_event)
+            try:
+                await self.await_measurement(
+                    method=psmethod, sync_event=sync_event, start_gate=start_gate
+                )
+            except MeasurementTimeoutError as ex:
+                if self.timings is not None and ex.measurement is not None:
+                    ex.measurement.timings = self.timings
+                raise
+            finally:
+                try:
+                    self.coalescer.drain()
+                finally:
+                    # Callbacks on executors may still be running
+                    await self.dispatcher.join()
 
         assert self.last_measurement
 
+        if self.timings is not None:
+            self.timings._mark('finished')
+            self.last_measurement.timings = self.timings
+
         if isinstance(method, BaseMethodScriptTechnique):
             self.last_measurement._psmeasurement.Title = method._name  # type: ignore
 
@@ -316,14 +649,24 @@ class MeasurementManagerAsync:
         self, sender: PalmSens.Comm.CommManager, args
     ) -> Task.CompletedTask:
         """Called when the measurement begins."""
+        if self.timings is not None:
+            self.timings._mark('begin_event')
+
         measurement = Measurement(psmeasurement=args.NewMeasurement)
 
         self.last_measurement = measurement
 
+        if (data_timeout := self._data_timeout()) is not None:
+            # The pretreatment runs before the first data are received
+            self._data_deadline = time.monotonic() + data_timeout + self._pretreatment_duration
+
         _ = self.loop.call_soon_threadsafe(self.begin_measurement_event.set)
 
         for callback in self.callbacks.measurement_begin:
-            callback(measurement)
+            if isinstance(callback, ExecutorCallback):
+                self.dispatcher.call_soon_threadsafe(callback, measurement)
+            else:
+                callback(measurement)
 
         return Task.CompletedTask
 
@@ -331,11 +674,13 @@ class MeasurementManagerAsync:
         self, comm: PalmSens.Comm.CommManager, args
     ) -> Task.CompletedTask:
         """Called when the measurement ends."""
+        if self.timings is not None:
+            self.timings._mark('end_event')
 
         _ = self.loop.call_soon_threadsafe(self.end_measurement_event.set)
 
         for callback in self.callbacks.measurement_end:
-            _ = self.loop.call_soon_threadsafe(callback)
+            self.dispatcher.call_soon_threadsafe(callback)
 
         return Task.CompletedTask
 
@@ -344,17 +689,38 @@ class MeasurementManagerAsync:
         pscurve: Plottables.Curve,
         args: PalmSens.Data.ArrayDataAddedEventArgs,
     ):
-        """Called when new data is added to the curve."""
+        """Called when new data is added to the curve.
 
-        data = CallbackData(
-            x_array=DataArray(psarray=pscurve.XAxisDataArray),
-            y_array=DataArray(psarray=pscurve.YAxisDataArray),
-            start=args.StartIndex,
-            id=pscurve.GetHashCode(),
-        )
+        The new index range is merged with other pending ranges for this curve,
+        the callbacks are called once per event loop iteration."""
+        if self.timings is not None:
+            self.timings._mark_data()
+
+        self._feed_watchdog()
+
+        start = args.StartIndex
+        self.coalescer.add(pscurve.GetHashCode(), start, start + args.Count)
 
-        for callback in self.callbacks.curve_new_data:
-            _ = self.loop.call_soon_threadsafe(callback, data)  # type: ignore
+    def _dispatch_curve_data(self, pending: dict[Any, tuple[int, int, float]]):
+        """Call new data callbacks once for the merged ranges of every curve."""
+        for curve_id, (start, stop, received) in pending.items():
+            x_array, y_array = self._curve_arrays[curve_id]
+
+            data = CallbackData(
+                x_array=x_array,
+                y_array=y_array,
+                start=start,
+                id=curve_id,
+                _stop=stop,
+            )
+
+            for callback in self.callbacks.curve_new_data:
+                self.dispatcher.dispatch(callback, data, key=curve_id, received=received)
+
+    def _finish_curve_data(self, curve_id: int) -> None:
+        """Dispatch the remaining data of a finished curve, then drop its arrays."""
+        self.coalescer.drain()
+        _ = self._curve_arrays.pop(curve_id, None)
 
     def curve_finished_callback(
         self,
@@ -365,10 +731,12 @@ class MeasurementManagerAsync:
         pscurve.NewDataAdded -= self.curve_data_added_handler
         pscurve.Finished -= self.curve_finished_handler
 
+        _ = self.loop.call_soon_threadsafe(self._finish_curve_data, pscurve.GetHashCode())
+
         curve = Curve(pscurve=pscurve)
 
         for callback in self.callbacks.curve_finished:
-            _ = self.loop.call_soon_threadsafe(callback, curve)  # type: ignore
+            self.dispatcher.call_soon_threadsafe(callback, curve, key=pscurve.GetHashCode())
 
     def begin_receive_curve_callback(
         self,
@@ -377,13 +745,20 @@ class MeasurementManagerAsync:
     ):
         """Subscribe to curve finished / new data added events."""
         pscurve = args.GetCurve()
+
+        # Create the wrappers once, instead of for every data event
+        self._curve_arrays[pscurve.GetHashCode()] = (
+            DataArray(psarray=pscurve.XAxisDataArray),
+            DataArray(psarray=pscurve.YAxisDataArray),
+        )
+
         pscurve.NewDataAdded += self.curve_data_added_handler
         pscurve.Finished += self.curve_finished_handler
 
         curve = Curve(pscurve=pscurve)
 
         for callback in self.callbacks.curve_start:
-            _ = self.loop.call_soon_threadsafe(callback, curve)  # type: ignore
+            self.dispatcher.call_soon_threadsafe(callback, curve, key=pscurve.GetHashCode())
 
     def eis_data_data_added_callback(self, eis_data: Plottables.EISData, args):
         """Called when a new EIS data points is obtained. Requires a callback."""
@@ -403,17 +778,34 @@ class MeasurementManagerAsync:
         if count == self.eis_last_data_index:
             return
 
+        if self.timings is not None:
+            self.timings._mark_data()
+
+        self._feed_watchdog()
+
+        eis_id = eis_data.GetHashCode()
+
+        # Wrapping the dataset and selecting the non-derived columns is expensive,
+        # so do this only once per EIS data set
+        if eis_id not in self._eis_columns:
+            dataset = DataSet(psdataset=eis_data.EISDataSet)
+            columns = [array for array in dataset.values() if not array.is_derived]
+            self._eis_columns[eis_id] = (dataset, columns)
+
+        dataset, columns = self._eis_columns[eis_id]
+
         data = CallbackDataEIS(
-            data=DataSet(psdataset=eis_data.EISDataSet),
+            data=dataset,
             start=self.eis_last_data_index,
             index=count - 1,
-            id=eis_data.GetHashCode(),
+            id=eis_id,
+            _columns=columns,
         )
 
         self.eis_last_data_index = count
 
         for callback in self.callbacks.eis_data_new_data:
-            _ = self.loop.call_soon_threadsafe(callback, data)  # type: ignore
+            self.dispatcher.call_soon_threadsafe(callback, data, key=data.id)
 
     def eis_data_finished_callback(
         self,
@@ -425,7 +817,7 @@ class MeasurementManagerAsync:
         eis_data.Finished -= self.eis_data_finished_handler
 
         for callback in self.callbacks.eis_data_end:
-            _ = self.loop.call_soon_threadsafe(callback)  # type: ignore
+            self.dispatcher.call_soon_threadsafe(callback, key=eis_data.GetHashCode())
 
     def begin_receive_eis_data_callback(
         self,
@@ -437,17 +829,18 @@ class MeasurementManagerAsync:
         eis_data.Finished += self.eis_data_finished_handler
 
         self.eis_last_data_index = 0
+        _ = self._eis_columns.pop(eis_data.GetHashCode(), None)
 
         data = EISData(pseis=eis_data)
 
         for callback in self.callbacks.eis_data_start:
-            _ = self.loop.call_soon_threadsafe(callback, data)  # type: ignore
+            self.dispatcher.call_soon_threadsafe(callback, data, key=eis_data.GetHashCode())
 
     def comm_error_callback(self, sender: PalmSens.Comm.CommManager, args: System.EventArgs):
         """Called when a communication error occurs."""
 
         for callback in self.callbacks.comm_error:
-            _ = self.loop.call_soon_threadsafe(callback)
+            self.dispatcher.call_soon_threadsafe(callback)
 
         def teardown_and_raise():
             self.begin_measurement_event.set()
@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator, Sequence
+
+import numpy as np
+from typing_extensions import override
+
+from .._methods.cache import psmethod_cache
+from .._types import MethodTypeCompatible
+
+if TYPE_CHECKING:
+    from .._data.measurement import Measurement
+    from .callback import Callback, CallbackEIS
+    from .instrument_manager_async import InstrumentManagerAsync
+
+
+@dataclass(frozen=True, slots=True)
+class MuxChannelResult:
+    """Result of a single multiplexer channel, see `MuxSweep.run()`."""
+
+    channel: int
+    """Multiplexer channel."""
+
+    measurement: Measurement
+    """Finished measurement."""
+
+    arrays: dict[str, np.ndarray]
+    """Values of every array in the dataset of the measurement, keyed by name."""
+
+    switch_time: float
+    """Time spent switching to this channel in s."""
+
+    measure_time: float
+    """Time spent measuring this channel in s."""
+
+
+@dataclass(frozen=True, slots=True)
+class MuxSweepResult:
+    """Results of a multiplexer sweep, in the order of the channels."""
+
+    results: list[MuxChannelResult]
+    """Result of every channel."""
+
+    total_time: float
+    """Total duration of the sweep in s."""
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def __iter__(self) -> Iterator[MuxChannelResult]:
+        yield from self.results
+
+    def __getitem__(self, channel: int) -> MuxChannelResult:
+        """Return result by multiplexer channel."""
+        for result in self.results:
+            if result.channel == channel:
+                return result
+        raise KeyError(channel)
+
+    @property
+    def channels(self) -> list[int]:
+        """Multiplexer channels in the order they were measured."""
+        return [result.channel for result in self.results]
+
+    @property
+    def measurements(self) -> list[Measurement]:
+        """Measurements in the order of the channels."""
+        return [result.measurement for result in self.results]
+
+    @property
+    def switch_time(self) -> float:
+        """Total time spent switching channels in s."""
+        return sum(result.switch_time for result in self.results)
+
+    @property
+    def measure_time(self) -> float:
+        """Total time spent measuring in s."""
+        return sum(result.measure_time for result in self.results)
+
+    @property
+    def overhead_time(self) -> float:
+        """Time spent neither switching nor measuring in s.
+
+        This is the preparation and export work that could not be
+        overlapped with a running measurement."""
+        return max(self.total_time - self.switch_time - self.measure_time, 0.0)
+
+
+@dataclass(frozen=True, slots=True)
+class _Prepared:
+    method: MethodTypeCompatible
+    stream: Path | None
+
+
+class MuxSweep:
+    """Measure a list of multiplexer channels one after the other.
+
+    For every channel, the sweep switches the multiplexer and runs the method.
+    The preparation of the next channel (method conversion, validation and
+    creating the stream directory) and the export of the previous channel to
+    numpy run in a worker thread while the current channel is measuring,
+    so that only the switching itself is added to the measurement time.
+
+    The multiplexer must be initialized with `initialize_multiplexer()` first,
+    and the methods must not use the multiplexer settings of the method itself.
+
+        async with await ps.connect_async() as manager:
+            await manager.initialize_multiplexer(2)
+            sweep = ps.MuxSweep(manager, method, channels=range(8))
+            result = await sweep.run()
+
+    Parameters
+    ----------
+    manager : InstrumentManagerAsync
+        Connected manager of the instrument with the multiplexer.
+    method : MethodType | Sequence[MethodType]
+        Method parameters for all channels, or one method per channel.
+    channels : Sequence[int]
+        Multiplexer channels to measure, in order.
+    stream : str | Path, optional
+        Stream the data of every channel to a file, see `measure(stream=...)`.
+        The path is formatted with the channel number,
+        for example `sweep_{channel}.jsonl`.
+    """
+
+    def __init__(
+        self,
+        manager: InstrumentManagerAsync,
+        method: MethodTypeCompatible | Sequence[MethodTypeCompatible],
+        channels: Sequence[int],
+        *,
+        stream: str | Path | None = None,
+    ):
+        self.manager: InstrumentManagerAsync = manager
+        self.channels: list[int] = list(channels)
+        """Multiplexer channels to measure, in order."""
+
+        if isinstance(method, Sequence):
+            self.methods: list[MethodTypeCompatible] = list(method)
+            """Method parameters for every channel."""
+        else:
+            self.methods = [method] * len(self.channels)
+
+        if len(self.methods) != len(self.channels):
+            raise ValueError(
+                f'Got {len(self.methods)} methods for {len(self.channels)} channels.'
+            )
+
+        self.stream: str | Path | None = stream
+
+    @override
+    def __repr__(self):
+        return f'{type(self).__name__}({self.manager.instrument.id}, channels={self.channels})'
+
+    def _prepare(self, index: int) -> _Prepared:
+        """Prepare the measurement of a channel, runs in a worker thread."""
+        method = self.methods[index]
+
+        # Leasing converts the method, the measurement reuses it from the cache
+        with psmethod_cache.lease(method) as psmethod:
+            self.manager.capabilities.validate_method(psmethod)
+
+        if self.stream is None:
+            return _Prepared(method=method, stream=None)
+
+        path = Path(str(self.stream).format(channel=self.channels[index]))
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        return _Prepared(method=method, stream=path)
+
+    async def run(
+        self,
+        callback: Callback | CallbackEIS | None = None,
+    ) -> MuxSweepResult:
+        """Measure all channels.
+
+        Parameters
+        ----------
+        callback : Callback | CallbackEIS, optional
+            If specified, call this function on every new set of data points,
+            see `InstrumentManagerAsync.measure()`.
+
+        Returns
+        -------
+        result : MuxSweepResult
+            Per-channel measurements, numpy arrays and timings.
+        """
+        self.manager.ensure_connection()
+
+        start = time.perf_counter()
+
+        n = len(self.channels)
+        timings: list[tuple[float, float]] = []
+        measurements: list[Measurement] = []
+        exports: list[asyncio.Task[dict[str, np.ndarray]]] = []
+
+        preparing = asyncio.create_task(asyncio.to_thread(self._prepare, 0)) if n else None
+
+        try:
+            for index, channel in enumerate(self.channels):
+                assert preparing is not None
+                prepared = await preparing
+
+                t0 = time.perf_counter()
+                await self.manager.set_multiplexer_channel(channel)
+                t1 = time.perf_counter()
+
+                measuring = asyncio.create_task(
+                    self.manager.measure(
+                        prepared.method, callback=callback, stream=prepared.stream
+                    )
+                )
+
+                if index + 1 < n:
+                    preparing = asyncio.create_task(asyncio.to_thread(self._prepare, index + 1))
+
+                measurement = await measuring
+                t2 = time.perf_counter()
+
+                timings.append((t1 - t0, t2 - t1))
+                measurements.append(measurement)
+                exports.append(asyncio.create_task(asyncio.to_thread(_to_arrays, measurement)))
+
+            arrays = await asyncio.gather(*exports)
+        except BaseException:
+            for task in (preparing, *exports):
+                if task is not None:
+                    _ = task.cancel()
+            raise
+
+        results = [
+            MuxChannelResult(
+                channel=channel,
+                measurement=measurement,
+                arrays=channel_arrays,
+                switch_time=switch_time,
+                measure_time=measure_time,
+            )
+            for channel, measurement, channel_arrays, (switch_time, measure_time) in zip(
+                self.channels, measurements, arrays, timings
+            )
+        ]
+
+        return MuxSweepResult(results=results, total_time=time.perf_counter() - start)
+
+
+def _to_arrays(measurement: Measurement) -> dict[str, np.ndarray]:
+    """Return the arrays of the measurement as numpy arrays."""
+    return {name: array.to_numpy() for name, array in measurement.dataset.items()}
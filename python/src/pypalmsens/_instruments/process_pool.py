@@ -0,0 +1,637 @@
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import shutil
+import sys
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
+from multiprocessing.connection import Connection
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Sequence, cast
+
+import numpy as np
+from typing_extensions import override
+
+from .._types import MethodType
+from .callback import (
+    CallbackData,
+    DetachedCallback,
+    DetachedCallbackData,
+    DetachedCallbackEIS,
+)
+from .instrument import Instrument
+from .simulated import SimulatedInstrument
+
+if TYPE_CHECKING:
+    from .._data.measurement import Measurement
+    from .instrument_pool_async import SubmitCallable
+
+_N_WRITTEN, _N_STARTED = range(2)
+_CURVE, _INDEX, _X, _Y = range(4)
+
+
+class SharedRingBuffer:
+    """Ring buffer of float rows in shared memory, with one writer and one reader.
+
+    The writer and the reader can be in different processes. The buffer is
+    pickled by name, so passing it to a worker process attaches to the same memory.
+    If the reader falls behind by more than `capacity` rows, the oldest rows
+    are lost and counted in `n_dropped`.
+
+    The header holds two counters, like a seqlock: the number of rows the
+    writer has started to write, raised before the write, and the number of rows
+    written, raised after it. The reader checks both after copying, so rows
+    overwritten during the copy are detected, also if that write is in progress.
+
+    Parameters
+    ----------
+    capacity : int
+        Number of rows.
+    n_columns : int
+        Number of columns.
+    """
+
+    def __init__(self, capacity: int, n_columns: int):
+        self._setup(capacity, n_columns, name=None)
+
+    def _setup(self, capacity: int, n_columns: int, name: str | None) -> None:
+        """Create the shared memory, or attach to the memory with this name."""
+        self.capacity: int = capacity
+        self.n_columns: int = n_columns
+        self.n_dropped: int = 0
+        """Number of rows overwritten before they were read."""
+
+        size = 16 + 8 * capacity * n_columns
+
+        if name is None:
+            self._shm: SharedMemory = SharedMemory(create=True, size=size)
+            self._owner: bool = True
+        else:
+            self._shm = _attach(name)
+            self._owner = False
+
+        self._header: np.ndarray = np.ndarray((2,), dtype=np.int64, buffer=self._shm.buf)
+        self._data: np.ndarray = np.ndarray(
+            (capacity, n_columns), dtype=np.float64, buffer=self._shm.buf, offset=16
+        )
+
+        if self._owner:
+            self._header[:] = 0
+
+        self._read: int = 0
+
+    def __repr__(self):
+        return f'{type(self).__name__}(capacity={self.capacity}, n_columns={self.n_columns})'
+
+    def __getstate__(self) -> tuple[int, int, str]:
+        return self.capacity, self.n_columns, self._shm.name
+
+    def __setstate__(self, state: tuple[int, int, str]) -> None:
+        capacity, n_columns, name = state
+        self._setup(capacity, n_columns, name=name)
+
+    @property
+    def n_written(self) -> int:
+        """Total number of rows written."""
+        return int(self._header[_N_WRITTEN])
+
+    def write(self, rows: np.ndarray) -> None:
+        """Append rows with shape `(n, n_columns)`, called by the writer."""
+        n = len(rows)
+
+        if n > self.capacity:
+            rows = rows[-self.capacity :]
+
+        written = self.n_written
+        start = (written + n - len(rows)) % self.capacity
+        first = min(len(rows), self.capacity - start)
+
+        # Announce the rows before overwriting the oldest ones
+        self._header[_N_STARTED] = written + n
+
+        self._data[start : start + first] = rows[:first]
+        self._data[: len(rows) - first] = rows[first:]
+
+        # Publish the rows only after they are written
+        self._header[_N_WRITTEN] = written + n
+
+    def read(self) -> np.ndarray:
+        """Return copy of the rows written since the last read, called by the reader."""
+        written = self.n_written
+        start = max(self._read, written - self.capacity)
+        self.n_dropped += start - self._read
+
+        indices = np.arange(start, written) % self.capacity
+        rows = self._data[indices]
+
+        # Rows that the writer started to overwrite before the end of the copy are invalid
+        started = max(int(self._header[_N_STARTED]), self.n_written)
+        lost = started - self.capacity - start
+
+        if lost > 0:
+            rows = rows[lost:]
+            self.n_dropped += min(lost, written - start)
+
+        self._read = written
+        return rows
+
+    def close(self) -> None:
+        """Release the memory, and remove it if this is the creating process."""
+        del self._header, self._data
+        self._shm.close()
+
+        if self._owner:
+            self._shm.unlink()
+
+
+def _attach(name: str) -> SharedMemory:
+    """Attach to existing shared memory, only the creating process removes it."""
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name, track=False)
+
+    # Spawned workers share the resource tracker of the parent,
+    # which already tracks this name
+    return SharedMemory(name=name)
+
+
+@dataclass(frozen=True, slots=True)
+class _InstrumentSpec:
+    """Picklable description of an instrument, resolved again in the worker."""
+
+    id: str
+    simulated: dict[str, Any] | None = None
+
+    @classmethod
+    def from_instrument(cls, instrument: Instrument) -> _InstrumentSpec:
+        if not isinstance(instrument, SimulatedInstrument):
+            return cls(id=instrument.id)
+
+        if instrument.replay is not None:
+            raise ValueError('Replaying simulated instruments cannot run in a worker process.')
+
+        settings = {
+            field.name: getattr(instrument, field.name)
+            for field in fields(instrument)
+            if field.init and field.name not in ('device', 'replay')
+        }
+        return cls(id=instrument.id, simulated=settings)
+
+    async def resolve(self) -> Instrument:
+        if self.simulated is not None:
+            return SimulatedInstrument(**self.simulated)
+
+        from .instrument import discover_async
+
+        for instrument in await discover_async(ignore_errors=True):
+            if instrument.id == self.id:
+                return instrument
+
+        raise ConnectionError(f'Instrument {self.id!r} not found by worker process.')
+
+
+class _RingSink:
+    """Callback in the worker that writes the new curve data to the ring buffer."""
+
+    def __init__(self, ring: SharedRingBuffer):
+        self.ring: SharedRingBuffer = ring
+        self._curves: dict[int, int] = {}
+
+    def __call__(self, data: CallbackData) -> None:
+        block = data.new_block()
+        curve = self._curves.setdefault(data.id, len(self._curves))
+
+        rows = np.empty((len(block), 4))
+        rows[:, _CURVE] = curve
+        rows[:, _INDEX] = np.arange(data.start, data.start + len(block))
+        rows[:, _X] = block[:, 0]
+        rows[:, _Y] = block[:, 1]
+
+        self.ring.write(rows)
+
+
+def _worker_main(spec: _InstrumentSpec, conn: Connection, ring: SharedRingBuffer) -> None:
+    """Entry point of the worker process.
+
+    Unpickling the arguments imports pypalmsens, which loads
+    its own copy of the .NET libraries in this process."""
+    try:
+        asyncio.run(_worker(spec, conn, ring))
+    finally:
+        ring.close()
+        conn.close()
+
+
+async def _worker(spec: _InstrumentSpec, conn: Connection, ring: SharedRingBuffer) -> None:
+    from .._io import save_session_file
+    from .instrument_manager_async import InstrumentManagerAsync
+
+    try:
+        manager = InstrumentManagerAsync(await spec.resolve())
+        await manager.connect()
+    except Exception as e:
+        conn.send(('error', _picklable(e)))
+        return
+
+    conn.send(('ok', None))
+
+    try:
+        while True:
+            command, payload = await asyncio.to_thread(conn.recv)
+
+            if command == 'close':
+                break
+
+            try:
+                if command == 'measure':
+                    path, kwargs = payload
+                    callback = _RingSink(ring) if kwargs.pop('_stream_data') else None
+                    measurement = await manager.measure(callback=callback, **kwargs)
+                    save_session_file(path, [measurement])
+                    result = None
+                else:
+                    func, kwargs = payload
+                    result = await func(manager, **kwargs)
+            except Exception as e:
+                conn.send(('error', _picklable(e)))
+            else:
+                conn.send(('ok', result))
+    finally:
+        await manager.disconnect()
+
+
+def _picklable(error: Exception) -> Exception:
+    """Return error that can be sent to the parent, .NET exceptions cannot be pickled."""
+    if type(error).__module__.split('.')[0] in ('builtins', 'pypalmsens'):
+        return error
+    return RuntimeError(f'{type(error).__name__}: {error}')
+
+
+class _Worker:
+    """Parent side of a worker process."""
+
+    def __init__(self, instrument: Instrument, capacity: int):
+        self.instrument: Instrument = instrument
+        self.ring: SharedRingBuffer = SharedRingBuffer(capacity, 4)
+        self.lock: asyncio.Lock = asyncio.Lock()
+
+        self._spec: _InstrumentSpec = _InstrumentSpec.from_instrument(instrument)
+        self._conn: Connection
+        self._process: multiprocessing.process.BaseProcess | None = None
+
+    def start(self) -> None:
+        context = multiprocessing.get_context('spawn')
+        self._conn, child_conn = context.Pipe()
+
+        self._process = context.Process(
+            target=_worker_main,
+            args=(self._spec, child_conn, self.ring),
+            name=f'pypalmsens-{self.instrument.id}',
+            daemon=True,
+        )
+        self._process.start()
+        child_conn.close()
+
+    def is_alive(self) -> bool:
+        return self._process is not None and self._process.is_alive()
+
+    async def receive(self, executor: ThreadPoolExecutor) -> Any:
+        loop = asyncio.get_running_loop()
+
+        try:
+            status, result = await loop.run_in_executor(executor, self._conn.recv)
+        except EOFError:
+            raise ConnectionError(
+                f'Worker process of {self.instrument.id!r} exited unexpectedly.'
+            ) from None
+
+        if status == 'error':
+            raise result
+
+        return result
+
+    def send(self, command: str, payload: Any) -> None:
+        self._conn.send((command, payload))
+
+    async def request(self, executor: ThreadPoolExecutor, command: str, payload: Any) -> Any:
+        await self.lock.acquire()
+        receiving = None
+
+        try:
+            self.send(command, payload)
+            receiving = asyncio.ensure_future(self.receive(executor))
+
+            # Cancelling must not cancel the receiving task, see `release()`
+            return await asyncio.shield(receiving)
+        finally:
+            self.release(receiving)
+
+    def release(self, receiving: asyncio.Future[Any] | None) -> None:
+        """Release the lock, once the reply of the current request has been read.
+
+        If the request was cancelled, the executor thread is still waiting
+        for the reply. The lock is held until the reply arrives, otherwise
+        the next request would read the reply to this one."""
+        if receiving is None or receiving.done():
+            self.lock.release()
+        else:
+            receiving.add_done_callback(self._drained)
+
+    def _drained(self, receiving: asyncio.Future[Any]) -> None:
+        if not receiving.cancelled():
+            # Discard the reply, also if it is an error
+            _ = receiving.exception()
+
+        self.lock.release()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        if self._process is None:
+            return
+
+        if self._process.is_alive():
+            try:
+                self._conn.send(('close', None))
+            except OSError:
+                pass
+
+            self._process.join(timeout)
+
+            if self._process.is_alive():
+                self._process.terminate()
+                self._process.join()
+
+        self._conn.close()
+        self._process = None
+
+
+class _CurveReader:
+    """Parent side of the ring buffer, calls the callback with the new data per curve."""
+
+    def __init__(self, ring: SharedRingBuffer, callback: DetachedCallback):
+        self.ring: SharedRingBuffer = ring
+        self.callback: DetachedCallback = callback
+
+    def poll(self) -> None:
+        rows = self.ring.read()
+
+        if not len(rows):
+            return
+
+        # Split into runs of the same curve, in order of arrival
+        edges = np.flatnonzero(np.diff(rows[:, _CURVE])) + 1
+
+        for run in np.split(rows, edges):
+            self.callback(
+                DetachedCallbackData(
+                    x=run[:, _X].copy(),
+                    y=run[:, _Y].copy(),
+                    start=int(run[0, _INDEX]),
+                    id=int(run[0, _CURVE]),
+                )
+            )
+
+
+class InstrumentProcessPoolAsync:
+    """Run every instrument of a pool in its own worker process.
+
+    In `InstrumentPoolAsync`, all channels share one Python interpreter and one
+    .NET runtime, so the callbacks of all channels compete for one core.
+    Here, every instrument is connected and measured in a separate process
+    with its own interpreter and its own copy of the .NET libraries.
+    This scales with the number of cores when many channels measure at high
+    data rates.
+
+    The new curve data of every channel are streamed back to this process
+    through a ring buffer in shared memory, and passed to the callback
+    as `DetachedCallbackData`. The finished measurements are sent back as session files.
+
+    The API follows `InstrumentPoolAsync`, with some restrictions:
+
+    - callbacks are called for curves only, not for EIS data
+    - functions passed to `submit()` and their results must be picklable,
+      e.g. functions defined at module level
+    - hardware synchronization is not supported
+    - instruments are found again by id in the worker, except simulated instruments
+
+        async with ps.InstrumentProcessPoolAsync(instruments) as pool:
+            measurements = await pool.measure(method, callback=callback)
+
+    Parameters
+    ----------
+    instruments : Sequence[Instrument]
+        Instruments, one worker process is started per instrument.
+    capacity : int
+        Number of points per channel in the ring buffer. If the callbacks
+        cannot keep up, the oldest points are skipped.
+    poll_interval : float
+        Time in s between reads of the ring buffers during a measurement.
+    """
+
+    def __init__(
+        self,
+        instruments: Sequence[Instrument],
+        *,
+        capacity: int = 100_000,
+        poll_interval: float = 0.02,
+    ):
+        self.instruments: list[Instrument] = list(instruments)
+        """Instruments in the pool."""
+
+        self.capacity: int = capacity
+        self.poll_interval: float = poll_interval
+
+        self._workers: list[_Worker] = []
+        self._executor: ThreadPoolExecutor | None = None
+        self._tmpdir: Path | None = None
+        self._counter: int = 0
+        self._counter_lock: threading.Lock = threading.Lock()
+
+    @override
+    def __repr__(self):
+        ids = [instrument.id for instrument in self.instruments]
+        return f'{type(self).__name__}({ids}, connected={self.is_connected()})'
+
+    def __len__(self):
+        return len(self.instruments)
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        return await self.disconnect()
+
+    def is_connected(self) -> bool:
+        """Return true if all worker processes are running."""
+        return bool(self._workers) and all(worker.is_alive() for worker in self._workers)
+
+    def n_dropped(self) -> list[int]:
+        """Return the number of points per channel that were skipped
+        because the callback could not keep up."""
+        return [worker.ring.n_dropped for worker in self._workers]
+
+    async def connect(self) -> None:
+        """Start a worker process per instrument and connect to the instruments."""
+        if self._workers:
+            return
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(len(self.instruments), 1), thread_name_prefix='pypalmsens-pool'
+        )
+        self._tmpdir = Path(tempfile.mkdtemp(prefix='pypalmsens-'))
+        self._workers = [_Worker(instrument, self.capacity) for instrument in self.instruments]
+
+        try:
+            for worker in self._workers:
+                worker.start()
+
+            _ = await asyncio.gather(
+                *(worker.receive(self._executor) for worker in self._workers)
+            )
+        except BaseException:
+            await self.disconnect()
+            raise
+
+    async def disconnect(self) -> None:
+        """Disconnect the instruments and stop the worker processes."""
+        workers, self._workers = self._workers, []
+
+        _ = await asyncio.gather(*(asyncio.to_thread(worker.stop) for worker in workers))
+
+        for worker in workers:
+            worker.ring.close()
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+        if self._tmpdir is not None:
+            shutil.rmtree(self._tmpdir, ignore_errors=True)
+            self._tmpdir = None
+
+    def _ensure_connected(self) -> ThreadPoolExecutor:
+        if self._executor is None or not self._workers:
+            raise ConnectionError('Pool is not connected, call `connect()` first.')
+        return self._executor
+
+    def _session_path(self) -> Path:
+        assert self._tmpdir is not None
+
+        with self._counter_lock:
+            self._counter += 1
+            return self._tmpdir / f'{self._counter}.pssession'
+
+    async def _measure_one(
+        self,
+        worker: _Worker,
+        method: MethodType,
+        callback: DetachedCallback | DetachedCallbackEIS | None,
+        **kwargs: Any,
+    ) -> Measurement:
+        from .._io import load_session_file
+
+        executor = self._ensure_connected()
+        path = self._session_path()
+        reader = None
+
+        # Only curve data are streamed back, so the callback takes curve data
+        if callback is not None and method.id not in ('eis', 'geis', 'fis', 'fgis'):
+            reader = _CurveReader(worker.ring, cast(DetachedCallback, callback))
+
+        kwargs = {'method': method, '_stream_data': reader is not None, **kwargs}
+
+        await worker.lock.acquire()
+        receiving = None
+
+        try:
+            _ = worker.ring.read()  # skip data of earlier measurements
+            worker.send('measure', (str(path), kwargs))
+
+            receiving = asyncio.ensure_future(worker.receive(executor))
+
+            while not receiving.done():
+                _ = await asyncio.wait((receiving,), timeout=self.poll_interval)
+
+                if reader is not None:
+                    reader.poll()
+
+            await receiving
+        finally:
+            # If cancelled, the worker finishes the measurement and still replies
+            worker.release(receiving)
+
+        try:
+            return load_session_file(path)[0]
+        finally:
+            path.unlink(missing_ok=True)
+
+    async def measure(
+        self,
+        method: MethodType,
+        callback: Sequence[DetachedCallback | DetachedCallbackEIS]
+        | DetachedCallback
+        | DetachedCallbackEIS
+        | None = None,
+        **kwargs,
+    ) -> list[Measurement]:
+        """Concurrently run measurement on all instruments in the pool.
+
+        Parameters
+        ----------
+        method : MethodType
+            Method parameters for measurement.
+        callback : list[Callback] | Callback | None
+            If specified, call these functions/this function on every new set of data points.
+            The callbacks run in this process and receive `DetachedCallbackData`.
+
+            Specify a sequence of callbacks to set a different function for every channel.
+            The number of callbacks must match the number of channels.
+
+            Specify a single callback to set the same function to all channels.
+        **kwargs
+            These keyword parameters are passed to the measure function in the worker.
+
+        Returns
+        -------
+        measurements : list[Measurement]
+            Finished measurements, one per channel.
+        """
+        if method._use_hardware_sync:
+            raise ValueError('Hardware synchronization is not supported by worker processes.')
+
+        callbacks: Sequence[DetachedCallback | DetachedCallbackEIS | None]
+
+        if isinstance(callback, Sequence):
+            if len(callback) != len(self._workers):
+                raise IndexError('Number of callbacks does not match number of channels.')
+            callbacks = callback
+        else:
+            callbacks = [callback or None for _ in self._workers]
+
+        return await asyncio.gather(
+            *(
+                self._measure_one(worker, method, callback, **kwargs)
+                for worker, callback in zip(self._workers, callbacks)
+            )
+        )
+
+    async def submit(self, func: SubmitCallable, **kwargs: Any) -> list[Any]:
+        """Concurrently run a function on all instruments in the pool.
+
+        Parameters
+        ----------
+        func : Callable
+            This async function gets called in every worker process with the
+            `InstrumentManagerAsync` of the worker as the argument.
+            The function and its result must be picklable.
+        **kwargs
+            These keyword arguments are passed on to the submitted function.
+        """
+        executor = self._ensure_connected()
+
+        return await asyncio.gather(
+            *(worker.request(executor, 'submit', (func, kwargs)) for worker in self._workers)
+        )
@@ -0,0 +1,809 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+import json
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, cast
+from urllib.parse import quote, unquote, urlsplit
+
+from pydantic import BaseModel, ValidationError
+from typing_extensions import override
+
+from .._methods.base import BaseTechnique
+from .broadcast import Address, LivePublisher, LiveSubscriber
+from .callback import (
+    DetachedCallback,
+    DetachedCallbackData,
+    DetachedCallbackDataEIS,
+    DetachedCallbackEIS,
+)
+from .instrument import discover_async
+from .instrument_manager_async import InstrumentManagerAsync
+from .shared import MethodIncompatibleError
+
+if TYPE_CHECKING:
+    from .._data.measurement import Measurement
+    from .._types import MethodTypeCompatible
+    from .instrument import Instrument
+    from .instrument_pool_async import InstrumentPoolAsync
+
+_CALLS: frozenset[str] = frozenset(
+    (
+        'abort',
+        'get_current_range',
+        'get_instrument_serial',
+        'get_potential_range',
+        'initialize_multiplexer',
+        'is_cell_on',
+        'is_connected',
+        'is_measuring',
+        'read_current',
+        'read_potential',
+        'set_cell',
+        'set_current_range',
+        'set_multiplexer_channel',
+        'set_potential',
+        'set_potential_range',
+    )
+)
+"""Manager methods that can be called remotely, with JSON arguments and result."""
+
+_ERRORS: dict[str, type[Exception]] = {
+    error.__name__: error
+    for error in (
+        ConnectionError,
+        KeyError,
+        MethodIncompatibleError,
+        TimeoutError,
+        TypeError,
+        ValueError,
+    )
+}
+"""Errors raised again as the same type by the client."""
+
+_MAX_REQUEST_SIZE: int = 1 << 20
+"""Maximum size of a request body in bytes."""
+
+_REASONS: dict[int, str] = {
+    200: 'OK',
+    400: 'Bad Request',
+    404: 'Not Found',
+    409: 'Conflict',
+    413: 'Content Too Large',
+    500: 'Internal Server Error',
+}
+
+
+class RemoteError(RuntimeError):
+    """Error raised by the server that has no matching local exception type."""
+
+
+class _HTTPError(Exception):
+    def __init__(self, status: int, error: Exception):
+        self.status: int = status
+        self.error: Exception = error
+
+
+def _message(error: Exception) -> str:
+    # str() of a KeyError is the repr of the key
+    if isinstance(error, KeyError) and len(error.args) == 1:
+        return str(error.args[0])
+    return str(error)
+
+
+def _instrument_info(instrument: Instrument) -> dict[str, Any]:
+    return {
+        'id': instrument.id,
+        'name': instrument.name,
+        'channel': instrument.channel,
+        'interface': instrument.interface,
+    }
+
+
+def _status_info(manager: InstrumentManagerAsync) -> dict[str, Any]:
+    status = manager.status()
+    return {
+        'device_state': status.device_state,
+        'pretreatment_phase': status.pretreatment_phase,
+        'potential': status.potential,
+        'current': status.current,
+        'current_we2': status.current_we2,
+        'aux_input': status.aux_input,
+        'noise': status.noise,
+    }
+
+
+def _session_bytes(measurement: Measurement) -> bytes:
+    """Serialize measurement as session file content."""
+    from .._io import save_session_file
+
+    with tempfile.TemporaryDirectory(prefix='pypalmsens-') as tmpdir:
+        path = Path(tmpdir) / 'measurement.pssession'
+        save_session_file(path, [measurement])
+        return path.read_bytes()
+
+
+def _session_measurement(content: bytes) -> Measurement:
+    """Load measurement from session file content."""
+    from .._io import load_session_file
+
+    with tempfile.TemporaryDirectory(prefix='pypalmsens-') as tmpdir:
+        path = Path(tmpdir) / 'measurement.pssession'
+        _ = path.write_bytes(content)
+        return load_session_file(path)[0]
+
+
+async def _read_head(reader: asyncio.StreamReader) -> tuple[str, dict[str, str]]:
+    """Read the start line and headers of a request or response."""
+    start_line = (await reader.readline()).decode('latin-1').strip()
+    headers = {}
+
+    while line := (await reader.readline()).decode('latin-1').strip():
+        name, _, value = line.partition(':')
+        headers[name.strip().lower()] = value.strip()
+
+    return start_line, headers
+
+
+async def _read_body(
+    reader: asyncio.StreamReader,
+    headers: dict[str, str],
+    limit: int | None = None,
+) -> bytes:
+    """Read the body, raise `_HTTPError` if it is larger than `limit` bytes."""
+    try:
+        length = int(headers.get('content-length', 0))
+    except ValueError as ex:
+        raise _HTTPError(400, ValueError(f'Invalid Content-Length: {ex}'))
+
+    if length < 0:
+        raise _HTTPError(400, ValueError(f'Invalid Content-Length: {length}'))
+
+    if limit is not None and length > limit:
+        raise _HTTPError(
+            413,
+            ValueError(f'Request body of {length} bytes exceeds the limit of {limit} bytes'),
+        )
+
+    return await reader.readexactly(length)
+
+
+def _head(status: int, content_type: str, length: int | None = None) -> bytes:
+    lines = [
+        f'HTTP/1.1 {status} {_REASONS[status]}',
+        f'Content-Type: {content_type}',
+        'Connection: close',
+    ]
+    if length is not None:
+        lines.append(f'Content-Length: {length}')
+    return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1')
+
+
+async def _open(address: Address) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    if isinstance(address, tuple):
+        host, port = address
+        return await asyncio.open_connection(host, port)
+    return await asyncio.open_unix_connection(str(address))
+
+
+async def _send_request(
+    address: Address,
+    method: str,
+    path: str,
+    body: bytes = b'',
+) -> tuple[asyncio.StreamReader, asyncio.StreamWriter, int, dict[str, str]]:
+    """Send request, return the connection, status and headers of the response."""
+    reader, writer = await _open(address)
+
+    head = (
+        f'{method} {path} HTTP/1.1\r\n'
+        'Host: pypalmsens\r\n'
+        'Content-Type: application/json\r\n'
+        f'Content-Length: {len(body)}\r\n'
+        'Connection: close\r\n\r\n'
+    )
+    writer.write(head.encode('latin-1') + body)
+    await writer.drain()
+
+    status_line, headers = await _read_head(reader)
+    status = int(status_line.split()[1])
+
+    return reader, writer, status, headers
+
+
+def _raise_for_status(status: int, body: bytes) -> None:
+    if status == 200:
+        return
+
+    info = json.loads(body)
+    error = _ERRORS.get(info['error'], RemoteError)
+    raise error(info['message'])
+
+
+class InstrumentServer:
+    """Share the instruments of a pool with other processes on this computer.
+
+    Only one process can open the connection to an instrument.
+    The server owns the connections and lets several clients
+    control the instruments, run measurements and receive live data through
+    a small HTTP/JSON interface. Use `InstrumentClient` to connect from Python.
+
+        pool = ps.InstrumentPoolAsync(ps.discover())
+
+        async with pool, ps.InstrumentServer(pool, ('127.0.0.1', 8765)) as server:
+            await server.serve_forever()
+
+    Endpoints, instrument IDs are URL encoded:
+
+    - `GET /instruments`: instruments in the pool
+    - `GET /discover`: instruments found by `discover_async()`
+    - `POST /instruments/{id}/connect`: connect, adds discovered instruments to the pool
+    - `POST /instruments/{id}/disconnect`: disconnect
+    - `GET /instruments/{id}/status`: status of an idle instrument
+    - `POST /instruments/{id}/measure`: measure the method in the body,
+      `method.model_dump(mode='json')`, returns the measurement as session file
+    - `POST /instruments/{id}/call/{name}`: call a manager method, e.g. `read_current`,
+      with `{"args": [...]}`, returns `{"result": ...}`
+    - `GET /instruments/{id}/stream`: binary stream of new data, see `LiveBatch`
+
+    Errors are returned as `{"error": type, "message": str}`, invalid method
+    parameters with status 400. Request bodies are limited to 1 MiB.
+
+    The stream uses the frames of `LivePublisher`. Managers without a publisher
+    publish to the server while it is running.
+
+    Parameters
+    ----------
+    pool : InstrumentPoolAsync
+        Pool with the instruments to share.
+    address : str | Path | tuple[str, int]
+        Path to a Unix domain socket, or `(host, port)` for TCP.
+        Use port 0 to pick a free port, see `address` after `start()`.
+    max_queue : int
+        Maximum number of batches queued per stream, see `LivePublisher`.
+    """
+
+    def __init__(
+        self,
+        pool: InstrumentPoolAsync,
+        address: Address = ('127.0.0.1', 0),
+        *,
+        max_queue: int = 1024,
+    ):
+        self.pool: InstrumentPoolAsync = pool
+        self._address: Address = address
+
+        self._publisher: LivePublisher = LivePublisher(max_queue=max_queue)
+        self._published: list[InstrumentManagerAsync] = []
+        self._measuring: set[str] = set()
+        self._server: asyncio.Server | None = None
+
+    @override
+    def __repr__(self):
+        return f'{type(self).__name__}({self.pool!r}, address={self.address!r})'
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    @property
+    def address(self) -> Address:
+        """Address clients connect to."""
+        if self._server is not None and isinstance(self._address, tuple):
+            return self._server.sockets[0].getsockname()[:2]
+        return self._address
+
+    async def start(self) -> None:
+        """Start accepting clients on the running event loop."""
+        # Streams subscribe within this process, the publisher needs no socket of its own
+        self._publisher._loop = asyncio.get_running_loop()
+
+        for manager in self.pool:
+            self._attach(manager)
+
+        if isinstance(self._address, tuple):
+            host, port = self._address
+            self._server = await asyncio.start_server(self._handle, host, port)
+        else:
+            self._server = await asyncio.start_unix_server(self._handle, str(self._address))
+
+    async def serve_forever(self) -> None:
+        """Serve clients until cancelled."""
+        if self._server is None:
+            await self.start()
+
+        assert self._server is not None
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """Stop the server and end all streams.
+
+        The instruments stay connected."""
+        await self._publisher.close()
+
+        for manager in self._published:
+            if manager.publisher is self._publisher:
+                manager.publisher = None
+        self._published.clear()
+
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    def _attach(self, manager: InstrumentManagerAsync) -> None:
+        if manager.publisher is None:
+            manager.publisher = self._publisher
+            self._published.append(manager)
+
+    def _manager(self, instrument_id: str) -> InstrumentManagerAsync:
+        for manager in self.pool:
+            if manager.instrument.id == instrument_id:
+                return manager
+        raise _HTTPError(404, KeyError(f'No instrument with id {instrument_id!r} in the pool'))
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve a single request, the connection is closed afterwards."""
+        try:
+            request_line, headers = await _read_head(reader)
+            method, target, _ = request_line.split(' ', 2)
+
+            parts = [unquote(part) for part in urlsplit(target).path.strip('/').split('/')]
+
+            try:
+                body = await _read_body(reader, headers, _MAX_REQUEST_SIZE)
+
+                if (method, len(parts), parts[0], parts[-1]) == (
+                    'GET',
+                    3,
+                    'instruments',
+                    'stream',
+                ):
+                    await self._stream(self._manager(parts[1]), reader, writer)
+                    return
+
+                content_type, content = await self._route(method, parts, body)
+                status = 200
+            except _HTTPError as http_error:
+                status, error = http_error.status, http_error.error
+            except Exception as ex:
+                status, error = 500, ex
+
+            if status != 200:
+                content_type = 'application/json'
+                content = json.dumps(
+                    {'error': type(error).__name__, 'message': _message(error)}
+                )
+
+            if isinstance(content, str):
+                content = content.encode()
+
+            writer.write(_head(status, content_type, len(content)) + content)
+            await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _route(
+        self, method: str, parts: list[str], body: bytes
+    ) -> tuple[str, bytes | str]:
+        """Return content type and content of the response."""
+        # Leave out the instrument ID, e.g. ('POST', 'instruments', 'connect')
+        endpoint = (method,) if len(parts) == 2 else (method, *parts[:1], *parts[2:])
+        result: Any = None
+
+        if endpoint == ('GET', 'instruments'):
+            result = [
+                {**_instrument_info(manager.instrument), 'connected': manager.is_connected()}
+                for manager in self.pool
+            ]
+        elif endpoint == ('GET', 'discover'):
+            result = [_instrument_info(instrument) for instrument in await discover_async()]
+        elif endpoint == ('POST', 'instruments', 'connect'):
+            await self._connect(parts[1])
+        elif endpoint == ('POST', 'instruments', 'disconnect'):
+            await self._manager(parts[1]).disconnect()
+        elif endpoint == ('GET', 'instruments', 'status'):
+            result = _status_info(self._manager(parts[1]))
+        elif endpoint == ('POST', 'instruments', 'measure'):
+            content = await self._measure(self._manager(parts[1]), json.loads(body))
+            return 'application/octet-stream', content
+        elif endpoint[:3] == ('POST', 'instruments', 'call') and len(parts) == 4:
+            if parts[3] not in _CALLS:
+                raise _HTTPError(404, KeyError(f'Cannot call {parts[3]!r}'))
+            args = json.loads(body).get('args', []) if body else []
+            result = getattr(self._manager(parts[1]), parts[3])(*args)
+            if inspect.isawaitable(result):
+                result = await result
+        else:
+            raise _HTTPError(404, KeyError(f'No endpoint {method} /{"/".join(parts)}'))
+
+        return 'application/json', json.dumps({'result': result})
+
+    async def _connect(self, instrument_id: str) -> None:
+        try:
+            manager = self._manager(instrument_id)
+        except _HTTPError:
+            for instrument in await discover_async():
+                if instrument.id == instrument_id:
+                    manager = InstrumentManagerAsync(instrument)
+                    self._attach(manager)
+                    await self.pool.add(manager)
+                    return
+            raise
+
+        await manager.connect()
+
+    async def _measure(self, manager: InstrumentManagerAsync, params: dict[str, Any]) -> bytes:
+        instrument_id = manager.instrument.id
+
+        if instrument_id in self._measuring:
+            raise _HTTPError(409, RuntimeError(f'{instrument_id} is already measuring'))
+
+        try:
+            cls = BaseTechnique._registry[params['id']]
+        except KeyError:
+            raise _HTTPError(400, ValueError(f'Unknown method id {params.get("id")!r}'))
+
+        try:
+            method = cls.from_dict(params)
+        except ValidationError as ex:
+            raise _HTTPError(400, ValueError(str(ex)))
+
+        self._measuring.add(instrument_id)
+        try:
+            measurement = await manager.measure(method)
+        finally:
+            self._measuring.discard(instrument_id)
+
+        return await asyncio.to_thread(_session_bytes, measurement)
+
+    async def _stream(
+        self,
+        manager: InstrumentManagerAsync,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        """Send new data of the instrument until the client disconnects."""
+        publisher = manager.publisher or self._publisher
+        source = manager.instrument.id
+        subscription = publisher.subscribe()
+
+        # Headers are sent after subscribing, so no data is missed once they arrive
+        writer.write(_head(200, 'application/octet-stream'))
+        await writer.drain()
+
+        async def forward():
+            async for batch in subscription:
+                if batch.source == source:
+                    writer.write(batch._encode())
+                    await writer.drain()
+
+        forwarding = asyncio.create_task(forward())
+        disconnected = asyncio.create_task(reader.read())
+
+        try:
+            _ = await asyncio.wait((forwarding, disconnected), return_when='FIRST_COMPLETED')
+        finally:
+            publisher.unsubscribe(subscription)
+            _ = forwarding.cancel()
+            _ = disconnected.cancel()
+
+
+class _StreamSubscriber(LiveSubscriber):
+    """Receive the batches of the stream endpoint of an `InstrumentServer`."""
+
+    def __init__(self, address: Address, path: str):
+        super().__init__(address)
+        self.path: str = path
+
+    @override
+    async def connect(self) -> None:
+        reader, writer, status, _ = await _send_request(self.address, 'GET', self.path)
+
+        if status != 200:
+            body = await reader.read()
+            writer.close()
+            _raise_for_status(status, body)
+
+        self._reader, self._writer = reader, writer
+
+
+class InstrumentClient:
+    """Client of an `InstrumentServer`.
+
+        async with ps.InstrumentClient(('127.0.0.1', 8765)) as client:
+            manager = await client.connect(instrument_id)
+            measurement = await manager.measure(method)
+
+    Errors raised by the server are raised again as the same type if it is a
+    common exception type (e.g. `ValueError`, `KeyError`), else as `RemoteError`.
+
+    Parameters
+    ----------
+    address : str | Path | tuple[str, int]
+        Address of the server, see `InstrumentServer.address`.
+    """
+
+    def __init__(self, address: Address):
+        self.address: Address = address
+
+    @override
+    def __repr__(self):
+        return f'{type(self).__name__}(address={self.address!r})'
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        pass
+
+    async def _request(self, method: str, path: str, body: Any = None) -> bytes:
+        """Send request, return the body of the response."""
+        content = b'' if body is None else json.dumps(body).encode()
+
+        reader, writer, status, headers = await _send_request(
+            self.address, method, path, content
+        )
+
+        try:
+            response = await _read_body(reader, headers)
+        finally:
+            writer.close()
+
+        _raise_for_status(status, response)
+        return response
+
+    async def _json(self, method: str, path: str, body: Any = None) -> Any:
+        return json.loads(await self._request(method, path, body))['result']
+
+    async def instruments(self) -> list[dict[str, Any]]:
+        """Return the instruments in the pool of the server.
+
+        Returns
+        -------
+        instruments : list[dict[str, Any]]
+            Id, name, channel, interface and connection state of every instrument.
+        """
+        return await self._json('GET', '/instruments')
+
+    async def discover(self) -> list[dict[str, Any]]:
+        """Discover the instruments connected to the server.
+
+        Returns
+        -------
+        instruments : list[dict[str, Any]]
+            Id, name, channel and interface of every instrument.
+        """
+        return await self._json('GET', '/discover')
+
+    def manager(self, instrument_id: str) -> RemoteInstrumentManager:
+        """Return the manager of an instrument on the server without connecting.
+
+        Parameters
+        ----------
+        instrument_id : str
+            Instrument ID, see `instruments()`.
+        """
+        return RemoteInstrumentManager(self, instrument_id)
+
+    async def connect(self, instrument_id: str) -> RemoteInstrumentManager:
+        """Connect an instrument on the server.
+
+        Instruments that are not in the pool are discovered and added.
+
+        Parameters
+        ----------
+        instrument_id : str
+            Instrument ID, see `instruments()` or `discover()`.
+
+        Returns
+        -------
+        manager : RemoteInstrumentManager
+            Manager of the remote instrument.
+        """
+        manager = self.manager(instrument_id)
+        await manager.connect()
+        return manager
+
+
+class RemoteInstrumentManager:
+    """Control an instrument of an `InstrumentServer`.
+
+    The methods mirror `InstrumentManagerAsync`, but every call goes to the server.
+    Use `InstrumentClient.connect()` to create one.
+    """
+
+    def __init__(self, client: InstrumentClient, instrument_id: str):
+        self.client: InstrumentClient = client
+        self.instrument_id: str = instrument_id
+        self._path: str = f'/instruments/{quote(instrument_id, safe="")}'
+
+    @override
+    def __repr__(self):
+        return f'{type(self).__name__}({self.instrument_id!r}, address={self.client.address!r})'
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.disconnect()
+
+    async def _call(self, name: str, *args: Any) -> Any:
+        return await self.client._json('POST', f'{self._path}/call/{name}', {'args': args})
+
+    async def connect(self) -> None:
+        """Connect to the instrument."""
+        _ = await self.client._request('POST', f'{self._path}/connect')
+
+    async def disconnect(self) -> None:
+        """Disconnect from the instrument, for all clients."""
+        _ = await self.client._request('POST', f'{self._path}/disconnect')
+
+    async def status(self) -> dict[str, Any]:
+        """Get status.
+
+        Returns
+        -------
+        status : dict[str, Any]
+            Values of `Status`, e.g. `device_state`, `potential` and `current`.
+        """
+        return await self.client._json('GET', f'{self._path}/status')
+
+    async def is_connected(self) -> bool:
+        """Return True if the instrument is connected."""
+        return await self._call('is_connected')
+
+    async def is_measuring(self) -> bool:
+        """Return True if the instrument is measuring."""
+        return await self._call('is_measuring')
+
+    async def measure(
+        self,
+        method: MethodTypeCompatible,
+        *,
+        callback: DetachedCallback | DetachedCallbackEIS | None = None,
+    ) -> Measurement:
+        """Start measurement using given method parameters.
+
+        Parameters
+        ----------
+        method: MethodType
+            Method parameters for measurement.
+        callback: DetachedCallback | DetachedCallbackEIS, optional
+            If specified, call this function on every new set of data points,
+            see `InstrumentManagerAsync.measure()`. The data are received
+            through the stream endpoint, the callback receives
+            `DetachedCallbackData` or `DetachedCallbackDataEIS` with only the new points.
+
+        Returns
+        -------
+        measurement : Measurement
+            Finished measurement.
+        """
+        if not isinstance(method, BaseModel):
+            raise TypeError(f'Cannot send {type(method).__name__}, use method parameters')
+
+        params = method.model_dump(mode='json')
+
+        if callback is None:
+            content = await self.client._request('POST', f'{self._path}/measure', params)
+            return await asyncio.to_thread(_session_measurement, content)
+
+        subscriber = self.stream()
+        await subscriber.connect()
+        receiving = asyncio.create_task(_dispatch(subscriber, callback))
+
+        try:
+            content = await self.client._request('POST', f'{self._path}/measure', params)
+            # The end of the measurement is published before the response is sent
+            await receiving
+        finally:
+            _ = receiving.cancel()
+            await subscriber.close()
+
+        return await asyncio.to_thread(_session_measurement, content)
+
+    def stream(self) -> LiveSubscriber:
+        """Return a subscriber for the new data of this instrument.
+
+        Iterate over the subscriber to receive the batches, for example:
+
+            async with manager.stream() as subscriber:
+                async for batch in subscriber:
+                    print(batch.kind, batch['y'].mean())
+
+        Returns
+        -------
+        subscriber : LiveSubscriber
+            Subscriber, call `connect()` or use as context manager.
+        """
+        return _StreamSubscriber(self.client.address, f'{self._path}/stream')
+
+    async def abort(self) -> None:
+        """Abort measurement."""
+        await self._call('abort')
+
+    async def read_current(self) -> float:
+        """Read the current in µA."""
+        return await self._call('read_current')
+
+    async def read_potential(self) -> float:
+        """Read the potential in V."""
+        return await self._call('read_potential')
+
+    async def set_cell(self, cell_on: bool) -> None:
+        """Turn the cell on or off."""
+        await self._call('set_cell', cell_on)
+
+    async def is_cell_on(self) -> bool:
+        """Return True if the cell is on."""
+        return await self._call('is_cell_on')
+
+    async def set_potential(self, potential: float) -> None:
+        """Set the potential of the cell in V."""
+        await self._call('set_potential', potential)
+
+    async def get_current_range(self) -> str:
+        """Get the current range for the cell."""
+        return await self._call('get_current_range')
+
+    async def set_current_range(self, current_range: str) -> None:
+        """Set the current range for the cell, see `AllowedCurrentRanges`."""
+        await self._call('set_current_range', current_range)
+
+    async def get_potential_range(self) -> str:
+        """Get the potential range for the cell."""
+        return await self._call('get_potential_range')
+
+    async def set_potential_range(self, potential_range: str) -> None:
+        """Set the potential range for the cell, see `AllowedPotentialRanges`."""
+        await self._call('set_potential_range', potential_range)
+
+    async def get_instrument_serial(self) -> str:
+        """Return instrument serial number."""
+        return await self._call('get_instrument_serial')
+
+    async def initialize_multiplexer(self, mux_model: int) -> int:
+        """Initialize the multiplexer, returns the number of available channels."""
+        return await self._call('initialize_multiplexer', mux_model)
+
+    async def set_multiplexer_channel(self, channel: int) -> None:
+        """Set the multiplexer channel."""
+        await self._call('set_multiplexer_channel', channel)
+
+
+async def _dispatch(
+    subscriber: LiveSubscriber, callback: DetachedCallback | DetachedCallbackEIS
+) -> None:
+    """Call the callback with the batches of a single measurement."""
+    # The kind of the batches follows from the method, and so does the callback
+    async for batch in subscriber:
+        if batch.kind == 'end':
+            return
+
+        if batch.kind == 'curve':
+            cast(DetachedCallback, callback)(
+                DetachedCallbackData(
+                    x=batch['x'],
+                    y=batch['y'],
+                    start=batch.start,
+                    id=batch.id,
+                )
+            )
+        else:
+            cast(DetachedCallbackEIS, callback)(
+                DetachedCallbackDataEIS(
+                    columns={name: batch[name] for name in batch.names},
+                    start=batch.start,
+                    index=batch.start + len(batch) - 1,
+                    id=batch.id,
+                )
+            )
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Literal, Sequence
+
+import numpy as np
+
+from .shared import create_future
+
+if TYPE_CHECKING:
+    from PalmSens.Comm import CommManager
+
+    from .simulated import SimulatedComm
+
+AllowedSampleQuantities = Literal['current', 'potential']
+"""Quantities that can be sampled, current in µA and potential in V."""
+
+_ASYNC_READERS: dict[str, str] = {
+    'current': 'GetCurrentAsync',
+    'potential': 'GetPotentialAsync',
+}
+_SYNC_READERS: dict[str, str] = {
+    'current': 'get_Current',
+    'potential': 'get_Potential',
+}
+
+
+@dataclass(frozen=True, slots=True)
+class Samples:
+    """Readings from `InstrumentManager.sample()`."""
+
+    quantities: tuple[AllowedSampleQuantities, ...]
+    """Sampled quantities, in order of the columns."""
+
+    time: np.ndarray
+    """Time of every reading in seconds since sampling started."""
+
+    values: np.ndarray
+    """Array with shape `(n_samples, n_quantities)`, current in µA and potential in V."""
+
+    def __len__(self) -> int:
+        return len(self.time)
+
+    def __getitem__(self, quantity: AllowedSampleQuantities) -> np.ndarray:
+        """Return column by quantity."""
+        return self.values[:, self.quantities.index(quantity)]
+
+
+def _check_quantities(
+    quantities: Sequence[AllowedSampleQuantities] | AllowedSampleQuantities,
+) -> tuple[AllowedSampleQuantities, ...]:
+    if isinstance(quantities, str):
+        quantities = (quantities,)
+
+    for quantity in quantities:
+        if quantity not in _ASYNC_READERS:
+            raise ValueError(
+                f'Cannot sample {quantity!r}, choose from: {", ".join(_ASYNC_READERS)}.'
+            )
+
+    return tuple(quantities)
+
+
+def _n_samples(rate: float, duration: float) -> int:
+    if rate <= 0:
+        raise ValueError('Sample rate must be positive.')
+    return max(1, round(rate * duration))
+
+
+async def sample_async(
+    comm: CommManager | SimulatedComm,
+    quantities: tuple[AllowedSampleQuantities, ...],
+    rate: float,
+    n: int,
+    start: float,
+    first: int = 0,
+) -> Samples:
+    """Take `n` readings on a fixed time grid, the caller must hold the lock.
+
+    Readings are due at `start + (first + i) / rate`. Readings that are
+    late are taken immediately.
+    """
+    readers: list[Callable[[], Any]] = [getattr(comm, _ASYNC_READERS[q]) for q in quantities]
+
+    t = np.empty(n)
+    values = np.empty((n, len(readers)))
+
+    for i in range(n):
+        delay = start + (first + i) / rate - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        t[i] = time.perf_counter() - start
+
+        for j, reader in enumerate(readers):
+            values[i, j] = await create_future(reader())
+
+    return Samples(quantities=quantities, time=t, values=values)
+
+
+def sample_sync(
+    comm: CommManager | SimulatedComm,
+    quantities: tuple[AllowedSampleQuantities, ...],
+    rate: float,
+    n: int,
+    start: float,
+    first: int = 0,
+) -> Samples:
+    """Blocking version of `sample_async()`."""
+    readers: list[Callable[[], float]] = [getattr(comm, _SYNC_READERS[q]) for q in quantities]
+
+    t = np.empty(n)
+    values = np.empty((n, len(readers)))
+
+    for i in range(n):
+        delay = start + (first + i) / rate - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+
+        t[i] = time.perf_counter() - start
+
+        for j, reader in enumerate(readers):
+            values[i, j] = reader()
+
+    return Samples(quantities=quantities, time=t, values=values)
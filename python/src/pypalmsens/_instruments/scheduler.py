@@ -0,0 +1,813 @@
+from __future__ import annotations
+
+import asyncio
+import bisect
+import itertools
+import statistics
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Collection, Sequence
+
+from typing_extensions import override
+
+from .._types import AllowedCurrentRanges, AllowedPotentialRanges, MethodTypeCompatible
+from .capabilities import Capabilities
+from .shared import MeasurementTimeoutError, MethodIncompatibleError
+
+if TYPE_CHECKING:
+    from .._data.measurement import Measurement
+    from .health import HealthEvent, PoolMonitor
+    from .instrument import Instrument
+    from .instrument_manager_async import InstrumentManagerAsync
+    from .instrument_pool_async import InstrumentPoolAsync
+
+
+@dataclass(frozen=True, slots=True)
+class JobConstraints:
+    """Requirements for the channel that runs a job, see `JobScheduler.submit()`."""
+
+    instruments: Collection[str] | None = None
+    """Run only on these instruments, by id or name."""
+
+    channels: Collection[int] | None = None
+    """Run only on these channels of a multichannel instrument."""
+
+    current_ranges: Collection[AllowedCurrentRanges] = ()
+    """Current ranges the channel must support."""
+
+    potential_ranges: Collection[AllowedPotentialRanges] = ()
+    """Potential ranges the channel must support."""
+
+    impedance: bool = False
+    """If True, the channel must support impedance measurements."""
+
+    bipot: bool = False
+    """If True, the channel must have a bipotentiostat."""
+
+    def _allows(self, instrument: Instrument, capabilities: Capabilities) -> bool:
+        """Return True if the instrument meets the constraints."""
+        if self.instruments is not None and not (
+            instrument.id in self.instruments or instrument.name in self.instruments
+        ):
+            return False
+
+        if self.channels is not None and instrument.channel not in self.channels:
+            return False
+
+        if self.impedance and not capabilities.supports_impedance:
+            return False
+
+        if self.bipot and not capabilities.has_bipot:
+            return False
+
+        return set(self.current_ranges) <= set(capabilities.supported_current_ranges) and set(
+            self.potential_ranges
+        ) <= set(capabilities.supported_potential_ranges)
+
+
+@dataclass(eq=False)
+class Job:
+    """Measurement job, see `JobScheduler.submit()`."""
+
+    method: MethodTypeCompatible
+    """Method parameters for the measurement."""
+
+    constraints: JobConstraints
+    """Requirements for the channel."""
+
+    priority: int
+    """Jobs with a higher priority start first."""
+
+    future: asyncio.Future[Measurement] = field(repr=False)
+    """Future with the measurement."""
+
+    submitted: float = field(repr=False)
+    """Time the job was submitted, see `time.monotonic()`."""
+
+    started: float | None = field(default=None, repr=False)
+    """Time the job started."""
+
+    finished: float | None = field(default=None, repr=False)
+    """Time the job finished."""
+
+    manager: InstrumentManagerAsync | None = field(default=None, repr=False)
+    """Manager of the channel that runs the job."""
+
+    kwargs: dict[str, Any] = field(default_factory=dict, repr=False)
+    """Keyword arguments for `InstrumentManagerAsync.measure()`."""
+
+    estimated_duration: float | None = field(default=None, repr=False)
+    """Predicted run time in seconds, only for planned jobs, see `JobScheduler.plan()`."""
+
+    attempts: int = field(default=0, repr=False)
+    """Number of times the job was started, more than one if its channel dropped."""
+
+    _planned: InstrumentManagerAsync | None = field(default=None, repr=False)
+    """Manager the job is planned on, the job only runs on this manager."""
+
+    _compatible: dict[int, bool] = field(default_factory=dict, repr=False)
+    """Compatibility by manager id."""
+
+    _retry_timer: asyncio.TimerHandle | None = field(default=None, repr=False)
+    """Fails the job if it does not start again in time after its channel dropped."""
+
+    @property
+    def wait_time(self) -> float | None:
+        """Time in seconds from submission to start, None if not started."""
+        if self.started is None:
+            return None
+        return self.started - self.submitted
+
+    @property
+    def run_time(self) -> float | None:
+        """Time in seconds from start to finish, None if not finished."""
+        if self.started is None or self.finished is None:
+            return None
+        return self.finished - self.started
+
+
+@dataclass(frozen=True, slots=True)
+class ChannelStats:
+    """Usage of a channel, see `SchedulerStats`."""
+
+    instrument: str
+    """Instrument id."""
+
+    n_jobs: int
+    """Number of jobs run."""
+
+    busy_time: float
+    """Total time spent running jobs in seconds."""
+
+    utilization: float
+    """Fraction of time spent running jobs since the scheduler was created."""
+
+
+@dataclass(frozen=True, slots=True)
+class SchedulerStats:
+    """Queue and channel statistics, see `JobScheduler.stats()`."""
+
+    n_pending: int
+    """Number of jobs waiting for a channel."""
+
+    n_running: int
+    """Number of running jobs."""
+
+    n_done: int
+    """Number of successfully finished jobs."""
+
+    n_failed: int
+    """Number of failed or cancelled jobs."""
+
+    mean_wait_time: float
+    """Mean time in seconds between submission and start of the started jobs."""
+
+    max_wait_time: float
+    """Maximum time in seconds between submission and start of the started jobs."""
+
+    channels: list[ChannelStats]
+    """Usage per channel."""
+
+
+@dataclass(frozen=True, slots=True)
+class PlannedJob:
+    """Job assigned to a channel, see `JobPlan`."""
+
+    index: int
+    """Position of the method in the planned batch."""
+
+    method: MethodTypeCompatible
+    """Method parameters for the measurement."""
+
+    instrument: str
+    """Id of the instrument that runs the job."""
+
+    start: float
+    """Predicted start in seconds from the start of the plan."""
+
+    duration: float
+    """Predicted run time in seconds."""
+
+    manager: InstrumentManagerAsync = field(repr=False)
+    """Manager of the channel that runs the job."""
+
+    @property
+    def end(self) -> float:
+        """Predicted end in seconds from the start of the plan."""
+        return self.start + self.duration
+
+
+@dataclass(frozen=True, slots=True)
+class DurationRecord:
+    """Predicted against actual run time of a planned job, see `DurationReport`."""
+
+    method_id: str
+    """Method id, e.g. `cv`."""
+
+    instrument: str
+    """Id of the instrument that ran the job."""
+
+    predicted: float
+    """Predicted run time in seconds."""
+
+    actual: float
+    """Measured run time in seconds."""
+
+    @property
+    def ratio(self) -> float:
+        """Actual over predicted run time."""
+        return self.actual / self.predicted if self.predicted > 0 else float('nan')
+
+
+@dataclass(frozen=True, slots=True)
+class DurationReport:
+    """Predicted against actual durations of a plan, see `JobPlan.report()`."""
+
+    records: list[DurationRecord]
+    """Run times of the finished jobs."""
+
+    predicted_makespan: float
+    """Predicted time in seconds until the last job finishes."""
+
+    actual_makespan: float
+    """Time in seconds from the first start to the last finish."""
+
+    @property
+    def scale(self) -> float:
+        """Median ratio of actual over predicted run time.
+
+        Pass this as `scale` to `JobScheduler.plan()` to calibrate the estimates.
+        """
+        ratios = [record.ratio for record in self.records if record.predicted > 0]
+        return statistics.median(ratios) if ratios else 1.0
+
+
+@dataclass(eq=False)
+class JobPlan:
+    """Assignment of a batch of jobs to channels, see `JobScheduler.plan()`."""
+
+    entries: list[PlannedJob]
+    """Planned jobs, in order of the batch."""
+
+    makespan: float
+    """Predicted time in seconds until the last job finishes."""
+
+    jobs: list[Job] = field(default_factory=list, repr=False)
+    """Submitted jobs, in order of the batch, see `JobScheduler.submit_plan()`."""
+
+    def channels(self) -> dict[str, list[PlannedJob]]:
+        """Return the planned jobs by instrument id, in order of start."""
+        channels: dict[str, list[PlannedJob]] = {}
+        for entry in sorted(self.entries, key=lambda entry: entry.start):
+            channels.setdefault(entry.instrument, []).append(entry)
+        return channels
+
+    def report(self) -> DurationReport:
+        """Compare the predicted with the actual run times of the finished jobs.
+
+        Returns
+        -------
+        report : DurationReport
+        """
+        records = []
+        started = []
+        finished = []
+
+        for entry, job in zip(self.entries, self.jobs):
+            if job.started is None or job.finished is None or not job.future.done():
+                continue
+
+            started.append(job.started)
+            finished.append(job.finished)
+
+            if job.future.cancelled() or job.future.exception():
+                continue
+
+            records.append(
+                DurationRecord(
+                    method_id=entry.method.id,
+                    instrument=entry.instrument,
+                    predicted=entry.duration,
+                    actual=job.finished - job.started,
+                )
+            )
+
+        return DurationReport(
+            records=records,
+            predicted_makespan=self.makespan,
+            actual_makespan=max(finished) - min(started) if started else 0.0,
+        )
+
+
+class JobScheduler:
+    """Run a queue of measurement jobs on the channels of a pool.
+
+    Each job runs on the next free channel that is compatible with the
+    method and the constraints of the job. Compatibility is checked with
+    the supported methods, the capability lists, and `validate_method()`.
+    Waiting jobs with a higher priority start first. Jobs that fit none of
+    the channels in the pool fail with a `MethodIncompatibleError`.
+    To distribute a batch of jobs by their estimated duration, see `plan()`.
+
+    If the channel of a running job drops (a `ConnectionError`, a lost connection,
+    or a `MeasurementTimeoutError` from the watchdog), the job is queued again
+    and runs on another compatible channel, at most `max_attempts` times.
+    The dropped channel is not used again. With health checks enabled
+    (see `InstrumentPoolAsync.enable_health_checks()`), it is quarantined,
+    and it takes jobs again after it has been restored. A job that waits for
+    a channel longer than `retry_timeout` after a drop fails with the error of the drop.
+
+        async with ps.InstrumentPoolAsync(instruments) as pool:
+            async with ps.JobScheduler(pool) as scheduler:
+                future = scheduler.submit(method, priority=1)
+                measurement = await future
+
+    Parameters
+    ----------
+    pool : InstrumentPoolAsync
+        Pool with connected managers.
+    max_attempts : int
+        Maximum number of times a job is started if its channel drops.
+    retry_timeout : float, optional
+        Maximum time in seconds a job waits for a channel after its channel dropped.
+        If None, wait until a channel is restored.
+    """
+
+    def __init__(
+        self,
+        pool: InstrumentPoolAsync,
+        *,
+        max_attempts: int = 3,
+        retry_timeout: float | None = 300.0,
+    ):
+        self.pool: InstrumentPoolAsync = pool
+        self.max_attempts: int = max_attempts
+        self.retry_timeout: float | None = retry_timeout
+        self.jobs: list[Job] = []
+        """All submitted jobs."""
+
+        self._pending: list[tuple[int, int, Job]] = []
+        self._counter: itertools.count[int] = itertools.count()
+        self._running: dict[int, Job] = {}
+        self._dropped: set[int] = set()
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._monitor: PoolMonitor | None = None
+
+        self._capabilities: dict[int, Capabilities] = {}
+        self._busy_time: dict[str, float] = {}
+        self._n_jobs: dict[str, int] = {}
+        self._created: float = time.monotonic()
+
+    @override
+    def __repr__(self):
+        return (
+            f'{type(self).__name__}(pending={len(self._pending)}, running={len(self._running)})'
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            await self.join()
+        else:
+            await self.close()
+
+    def submit(
+        self,
+        method: MethodTypeCompatible,
+        *,
+        constraints: JobConstraints | None = None,
+        priority: int = 0,
+        **kwargs: Any,
+    ) -> asyncio.Future[Measurement]:
+        """Add a measurement job to the queue.
+
+        Parameters
+        ----------
+        method : MethodType
+            Method parameters for the measurement.
+        constraints : JobConstraints, optional
+            Requirements for the channel.
+        priority : int
+            Jobs with a higher priority start first.
+        **kwargs
+            These keyword arguments are passed to `InstrumentManagerAsync.measure()`,
+            e.g. `callback`.
+
+        Returns
+        -------
+        future : asyncio.Future[Measurement]
+            Future with the finished measurement.
+        """
+        job = Job(
+            method=method,
+            constraints=constraints or JobConstraints(),
+            priority=priority,
+            future=asyncio.get_running_loop().create_future(),
+            submitted=time.monotonic(),
+            kwargs=kwargs,
+        )
+        self.jobs.append(job)
+
+        if not any(self._is_compatible(job, manager) for manager in self.pool.managers):
+            job.future.set_exception(
+                MethodIncompatibleError(
+                    f'No channel in the pool is compatible with {job.method.id!r} job.'
+                )
+            )
+            return job.future
+
+        self._enqueue(job)
+        self._dispatch()
+
+        return job.future
+
+    def plan(
+        self,
+        methods: Sequence[MethodTypeCompatible],
+        *,
+        constraints: JobConstraints | None = None,
+        scale: float = 1.0,
+    ) -> JobPlan:
+        """Assign a batch of methods to channels so that all jobs finish as early as possible.
+
+        The run time of every method is estimated per compatible channel with
+        `get_estimated_duration(include_pretreatment=True)`. The longest jobs
+        are assigned first, each to the channel where it finishes earliest
+        (longest-processing-time-first).
+
+        Parameters
+        ----------
+        methods : Sequence[MethodType]
+            Method parameters for the measurements.
+        constraints : JobConstraints, optional
+            Requirements for the channels.
+        scale : float
+            Multiply the estimates by this factor, see `DurationReport.scale`.
+
+        Returns
+        -------
+        plan : JobPlan
+            Planned jobs, run them with `submit_plan()`.
+        """
+        constraints = constraints or JobConstraints()
+        managers = list(self.pool.managers)
+        loop = asyncio.get_running_loop()
+
+        estimates: list[dict[int, float]] = []
+
+        for method in methods:
+            # Only used to check compatibility, it is not submitted
+            job = Job(
+                method=method,
+                constraints=constraints,
+                priority=0,
+                future=loop.create_future(),
+                submitted=time.monotonic(),
+            )
+            compatible = [m for m in managers if self._is_compatible(job, m)]
+
+            if not compatible:
+                raise MethodIncompatibleError(
+                    f'No channel in the pool is compatible with {method.id!r} job.'
+                )
+
+            estimates.append(
+                {
+                    _key(manager): scale
+                    * manager.get_estimated_duration(method, include_pretreatment=True)
+                    for manager in compatible
+                }
+            )
+
+        by_key = {_key(manager): manager for manager in managers}
+        load = dict.fromkeys(by_key, 0.0)
+        entries: list[PlannedJob | None] = [None] * len(estimates)
+
+        longest_first = sorted(
+            range(len(estimates)), key=lambda i: max(estimates[i].values()), reverse=True
+        )
+
+        for i in longest_first:
+            durations = estimates[i]
+            key = min(durations, key=lambda key: load[key] + durations[key])
+            manager = by_key[key]
+
+            entries[i] = PlannedJob(
+                index=i,
+                method=methods[i],
+                instrument=manager.instrument.id,
+                start=load[key],
+                duration=durations[key],
+                manager=manager,
+            )
+            load[key] += durations[key]
+
+        return JobPlan(
+            entries=[entry for entry in entries if entry is not None],
+            makespan=max(load.values(), default=0.0),
+        )
+
+    def submit_plan(self, plan: JobPlan, **kwargs: Any) -> list[asyncio.Future[Measurement]]:
+        """Add the jobs of a plan to the queue.
+
+        Every job only runs on its planned channel. The jobs on a channel
+        start in the planned order.
+
+        Parameters
+        ----------
+        plan : JobPlan
+            Plan from `plan()`.
+        **kwargs
+            These keyword arguments are passed to `InstrumentManagerAsync.measure()`,
+            e.g. `callback`.
+
+        Returns
+        -------
+        futures : list[asyncio.Future[Measurement]]
+            Futures with the finished measurements, in order of the batch.
+        """
+        loop = asyncio.get_running_loop()
+        jobs = {}
+
+        for entry in sorted(plan.entries, key=lambda entry: entry.start):
+            job = Job(
+                method=entry.method,
+                constraints=JobConstraints(),
+                priority=0,
+                future=loop.create_future(),
+                submitted=time.monotonic(),
+                kwargs=kwargs,
+                estimated_duration=entry.duration,
+                _planned=entry.manager,
+            )
+            self.jobs.append(job)
+            self._enqueue(job)
+            jobs[entry.index] = job
+
+        plan.jobs = [jobs[entry.index] for entry in plan.entries]
+
+        self._dispatch()
+
+        return [job.future for job in plan.jobs]
+
+    async def join(self) -> None:
+        """Wait until all submitted jobs are finished."""
+        _ = await asyncio.gather(*(job.future for job in self.jobs), return_exceptions=True)
+
+    async def close(self) -> None:
+        """Cancel waiting and running jobs."""
+        for _, _, job in self._pending:
+            _cancel_timer(job)
+            _ = job.future.cancel()
+        self._pending.clear()
+
+        for task in self._tasks:
+            _ = task.cancel()
+
+        _ = await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def stats(self) -> SchedulerStats:
+        """Return queue wait times and channel utilization.
+
+        Returns
+        -------
+        stats : SchedulerStats
+        """
+        wait_times = [job.wait_time for job in self.jobs if job.wait_time is not None]
+        elapsed = time.monotonic() - self._created
+        now = time.monotonic()
+
+        channels = []
+        for manager in self.pool.managers:
+            instrument_id = manager.instrument.id
+            busy_time = self._busy_time.get(instrument_id, 0.0)
+
+            job = self._running.get(_key(manager))
+            if job is not None and job.started is not None:
+                busy_time += now - job.started
+
+            channels.append(
+                ChannelStats(
+                    instrument=instrument_id,
+                    n_jobs=self._n_jobs.get(instrument_id, 0),
+                    busy_time=busy_time,
+                    utilization=busy_time / elapsed if elapsed > 0 else 0.0,
+                )
+            )
+
+        finished = [job for job in self.jobs if job.future.done()]
+        n_failed = sum(
+            1 for job in finished if job.future.cancelled() or job.future.exception()
+        )
+
+        return SchedulerStats(
+            n_pending=len(self._pending),
+            n_running=len(self._running),
+            n_done=len(finished) - n_failed,
+            n_failed=n_failed,
+            mean_wait_time=sum(wait_times) / len(wait_times) if wait_times else 0.0,
+            max_wait_time=max(wait_times, default=0.0),
+            channels=channels,
+        )
+
+    def _enqueue(self, job: Job) -> None:
+        bisect.insort(self._pending, (-job.priority, next(self._counter), job))
+
+    def _is_compatible(self, job: Job, manager: InstrumentManagerAsync) -> bool:
+        """Return True if the job can run on this manager, the result is cached per job."""
+        key = _key(manager)
+
+        if job._planned is not None:
+            return job._planned is manager and manager.is_connected()
+
+        # Do not cache, the manager may reconnect
+        if not manager.is_connected():
+            return False
+
+        if key not in job._compatible:
+            job._compatible[key] = self._check_compatible(job, manager)
+
+        return job._compatible[key]
+
+    def _check_compatible(self, job: Job, manager: InstrumentManagerAsync) -> bool:
+        key = _key(manager)
+        if key not in self._capabilities:
+            self._capabilities[key] = manager.capabilities
+
+        capabilities = self._capabilities[key]
+
+        if not job.constraints._allows(manager.instrument, capabilities):
+            return False
+
+        # MethodSCRIPT is not in the list of supported methods
+        if job.method.id != 'ms' and job.method.id not in capabilities.supported_methods:
+            return False
+
+        try:
+            manager.validate_method(job.method)
+        except MethodIncompatibleError:
+            return False
+
+        return True
+
+    def _is_available(self, manager: InstrumentManagerAsync) -> bool:
+        """Return True if the channel can take jobs, regardless of whether it is busy."""
+        monitor = self._watch_monitor()
+
+        if monitor is not None and monitor.is_quarantined(manager):
+            return False
+
+        return _key(manager) not in self._dropped and manager.is_connected()
+
+    def _watch_monitor(self) -> PoolMonitor | None:
+        """Return the monitor of the pool, listen to its events the first time it is seen."""
+        monitor = self.pool.monitor
+
+        if monitor is not None and monitor is not self._monitor:
+            monitor.add_listener(self._on_health_event)
+            self._monitor = monitor
+
+        return monitor
+
+    def _on_health_event(self, event: HealthEvent) -> None:
+        if event.kind != 'restored':
+            return
+
+        for manager in self.pool.managers:
+            if manager.instrument.id == event.instrument:
+                self._dropped.discard(_key(manager))
+
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Start waiting jobs on free compatible channels."""
+        idle = [
+            manager
+            for manager in self.pool.managers
+            if _key(manager) not in self._running and self._is_available(manager)
+        ]
+
+        if not idle:
+            return
+
+        pending = []
+
+        for entry in self._pending:
+            job = entry[2]
+
+            if job.future.done():
+                # Cancelled while waiting
+                continue
+
+            manager = next((m for m in idle if self._is_compatible(job, m)), None)
+
+            if manager is None:
+                pending.append(entry)
+                continue
+
+            idle.remove(manager)
+            self._start(job, manager)
+
+        self._pending = pending
+
+    def _start(self, job: Job, manager: InstrumentManagerAsync) -> None:
+        _cancel_timer(job)
+        job.started = time.monotonic()
+        job.finished = None
+        job.manager = manager
+        job.attempts += 1
+        self._running[_key(manager)] = job
+
+        task = asyncio.create_task(self._run(job, manager))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, job: Job, manager: InstrumentManagerAsync) -> None:
+        try:
+            measurement = await manager.measure(job.method, **job.kwargs)
+        except asyncio.CancelledError:
+            _ = job.future.cancel()
+            raise
+        except Exception as err:
+            if _has_dropped(manager, err):
+                self._drop(manager, err)
+
+                if self._can_retry(job):
+                    self._requeue(job, err)
+                    return
+
+            if not job.future.done():
+                job.future.set_exception(err)
+        else:
+            if not job.future.done():
+                job.future.set_result(measurement)
+        finally:
+            job.finished = time.monotonic()
+
+            instrument_id = manager.instrument.id
+            self._busy_time[instrument_id] = self._busy_time.get(instrument_id, 0.0) + (
+                job.run_time or 0.0
+            )
+            self._n_jobs[instrument_id] = self._n_jobs.get(instrument_id, 0) + 1
+
+            del self._running[_key(manager)]
+            self._dispatch()
+
+    def _drop(self, manager: InstrumentManagerAsync, error: Exception) -> None:
+        """Stop using the channel, until health checks restore it."""
+        self._dropped.add(_key(manager))
+
+        if self.pool.monitor is not None:
+            self.pool.monitor.quarantine(manager, error)
+
+    def _requeue(self, job: Job, error: Exception) -> None:
+        """Queue the job again, it fails with `error` if it does not start in time."""
+        if self.retry_timeout is not None:
+            job._retry_timer = asyncio.get_running_loop().call_later(
+                self.retry_timeout, self._expire, job, error
+            )
+
+        self._enqueue(job)
+
+    def _expire(self, job: Job, error: Exception) -> None:
+        """Fail a job that is still waiting for a channel after a drop."""
+        job._retry_timer = None
+        self._pending = [entry for entry in self._pending if entry[2] is not job]
+
+        if not job.future.done():
+            job.future.set_exception(error)
+
+    def _can_retry(self, job: Job) -> bool:
+        """Return True if the job may run again after its channel dropped."""
+        if job.future.done() or job.attempts >= self.max_attempts:
+            return False
+
+        # Quarantined channels come back (within `retry_timeout`), else another channel
+        # must take the job
+        if self.pool.monitor is not None:
+            return True
+
+        return any(
+            self._is_available(manager) and self._is_compatible(job, manager)
+            for manager in self.pool.managers
+        )
+
+
+def _has_dropped(manager: InstrumentManagerAsync, error: Exception) -> bool:
+    """Return True if the measurement failed because the channel is gone or stuck."""
+    return (
+        isinstance(error, (ConnectionError, MeasurementTimeoutError))
+        or not manager.is_connected()
+    )
+
+
+def _cancel_timer(job: Job) -> None:
+    if job._retry_timer is not None:
+        job._retry_timer.cancel()
+        job._retry_timer = None
+
+
+def _key(manager: InstrumentManagerAsync) -> int:
+    return id(manager)
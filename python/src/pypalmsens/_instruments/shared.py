@@ -1,26 +1,157 @@
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
+import queue
+import threading
 import warnings
 from functools import partial
 from math import floor
-from typing import TYPE_CHECKING, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, Literal, TypeVar
 
 import System
 from PalmSens.Comm import enumDeviceType
+from typing_extensions import override
 
 from .. import __sdk_version__
+from .dispatch import ExecutorCallback, run_in_executor
 
 if TYPE_CHECKING:
     from PalmSens.Devices import DeviceCapabilities
 
+    from .._data.measurement import Measurement
+
 
 T = TypeVar('T')
+C = TypeVar('C', bound=Callable[..., Any])
 
 
 class MethodIncompatibleError(ValueError): ...
 
 
+class MeasurementTimeoutError(TimeoutError):
+    """Measurement aborted by the watchdog, see `Watchdog`."""
+
+    def __init__(
+        self,
+        message: str,
+        *,
+        reason: Literal['deadline', 'no_data'],
+        measurement: Measurement | None = None,
+    ):
+        super().__init__(message)
+
+        self.reason: Literal['deadline', 'no_data'] = reason
+        """'deadline' if the measurement took too long,
+        'no_data' if no new data were received."""
+
+        self.measurement: Measurement | None = measurement
+        """Data measured until the abort, None if the measurement did not begin."""
+
+
+_background_loop: asyncio.AbstractEventLoop | None = None
+_background_lock = threading.Lock()
+
+
+def background_loop() -> asyncio.AbstractEventLoop:
+    """Return the event loop that runs the synchronous API.
+
+    The loop runs forever in a daemon thread, it is started on first use.
+    """
+    global _background_loop
+
+    with _background_lock:
+        if _background_loop is None or _background_loop.is_closed():
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever, name='pypalmsens-loop', daemon=True
+            )
+            thread.start()
+            _background_loop = loop
+
+    return _background_loop
+
+
+def run_nowait(coro: Coroutine[Any, Any, T]) -> concurrent.futures.Future[T]:
+    """Schedule coroutine on the background loop and return a future with the result."""
+    return asyncio.run_coroutine_threadsafe(coro, background_loop())
+
+
+class CallingThreadExecutor(concurrent.futures.Executor):
+    """Executor that runs calls on the thread waiting in `run_sync()`.
+
+    The synchronous API runs on the background loop. Its callbacks are wrapped
+    with `wrap()`, so that they are called on the thread that called the API.
+    """
+
+    def __init__(self):
+        self._calls: queue.SimpleQueue[
+            tuple[concurrent.futures.Future[Any], Callable[[], Any]] | None
+        ] = queue.SimpleQueue()
+
+    @override
+    def submit(self, fn, /, *args, **kwargs):
+        future: concurrent.futures.Future[Any] = concurrent.futures.Future()
+        self._calls.put((future, partial(fn, *args, **kwargs)))
+        return future
+
+    def wrap(self, callback: C) -> C:
+        """Return callback running on this executor, executor callbacks are kept."""
+        if isinstance(callback, ExecutorCallback):
+            return callback
+        return run_in_executor(callback, self)  # type: ignore
+
+    def _run_until(self, done: concurrent.futures.Future[Any]) -> None:
+        """Run the submitted calls until `done` has finished."""
+        done.add_done_callback(lambda _: self._calls.put(None))
+
+        while (call := self._calls.get()) is not None:
+            future, func = call
+
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            try:
+                result = func()
+            except BaseException as exc:
+                future.set_exception(exc)
+
+                if not isinstance(exc, Exception):
+                    raise
+            else:
+                future.set_result(result)
+
+
+def run_sync(coro: Coroutine[Any, Any, T], executor: CallingThreadExecutor | None = None) -> T:
+    """Run coroutine on the background loop and wait for the result.
+
+    If given, run the calls submitted to `executor` on this thread while waiting."""
+    loop = background_loop()
+
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+
+    if running is loop:
+        coro.close()
+        raise RuntimeError(
+            'The synchronous API cannot be used in a callback, use the async API instead.'
+        )
+
+    future = asyncio.run_coroutine_threadsafe(coro, loop)
+
+    try:
+        if executor is not None:
+            executor._run_until(future)
+
+        return future.result()
+    except BaseException:
+        # E.g. KeyboardInterrupt, stop the coroutine on the background loop
+        _ = future.cancel()
+        raise
+
+
 def create_future(clr_task: System.Task[T]) -> asyncio.Future[T]:
     loop = asyncio.get_running_loop()
     future = loop.create_future()
@@ -35,11 +166,25 @@ def on_completion(
     loop: asyncio.AbstractEventLoop,
     task: System.Task[T],
 ) -> None:
+    if future.cancelled() or loop.is_closed():
+        # Awaiting the future was cancelled, e.g. after a timeout
+        return
+
     if task.IsFaulted:
         clr_error = task.Exception.GetBaseException()
-        _ = loop.call_soon_threadsafe(future.set_exception, clr_error)
+        _ = loop.call_soon_threadsafe(_set_exception, future, clr_error)
     else:
-        _ = loop.call_soon_threadsafe(future.set_result, task.GetAwaiter().GetResult())
+        _ = loop.call_soon_threadsafe(_set_result, future, task.GetAwaiter().GetResult())
+
+
+def _set_result(future: asyncio.Future[T], result: T) -> None:
+    if not future.done():
+        future.set_result(result)
+
+
+def _set_exception(future: asyncio.Future[T], exception: BaseException) -> None:
+    if not future.done():
+        future.set_exception(exception)
 
 
 def firmware_warning(capabilities: DeviceCapabilities, /) -> None:
@@ -0,0 +1,614 @@
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import suppress
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterator, Literal
+
+import numpy as np
+import PalmSens
+import System
+from PalmSens.Comm import CommManager
+from PalmSens.Data import DataArray as PSDataArray
+from PalmSens.Data import DataArrayTime, IDataValue
+from PalmSens.Devices import EmStat4HRCapabilities
+from PalmSens.Techniques import ImpedimetricMethodBase
+from PalmSens.Techniques.Impedance import enumFrequencyType, enumScanType
+from System.Threading import SemaphoreSlim
+from System.Threading.Tasks import Task
+from typing_extensions import override
+
+from .._data.data_array import DataArray
+from .._data.measurement import Measurement
+from .._data.stream import _extend_psarray, _to_psarray
+from .._data.types import array_enum_to_str
+from .._io import load_session_file
+from .capabilities import get_license_mask, set_license_mask
+from .instrument import Instrument
+
+_BATCH_INTERVAL = 0.05
+"""Measurement time covered by one batch of new data, in seconds."""
+
+# Bits of the license mask of `DeviceCapabilities`
+_LICENSE_EIS = 1 << 13
+_LICENSE_GEIS = 1 << 14
+
+
+class _Event:
+    """Python stand-in for a .NET event, supports `+=` and `-=`."""
+
+    def __init__(self):
+        self._handlers: list[Callable[..., Any]] = []
+
+    def __iadd__(self, handler: Callable[..., Any]) -> _Event:
+        self._handlers.append(handler)
+        return self
+
+    def __isub__(self, handler: Callable[..., Any]) -> _Event:
+        with suppress(ValueError):
+            self._handlers.remove(handler)
+        return self
+
+    def __call__(self, sender: Any, args: Any) -> None:
+        for handler in tuple(self._handlers):
+            _ = handler(sender, args)
+
+
+class _PlottableProxy:
+    """Wraps a .NET curve or EIS data set, but raises its events from Python."""
+
+    def __init__(self, psobject: Any):
+        self._psobject: Any = psobject
+        self.NewDataAdded: _Event = _Event()
+        self.Finished: _Event = _Event()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._psobject, name)
+
+
+@dataclass(frozen=True, slots=True)
+class _BeginMeasurementArgs:
+    NewMeasurement: PalmSens.Measurement
+
+
+@dataclass(frozen=True, slots=True)
+class _CurveEventArgs:
+    curve: _PlottableProxy
+
+    def GetCurve(self) -> _PlottableProxy:
+        return self.curve
+
+
+@dataclass(frozen=True, slots=True)
+class _ArrayDataAddedArgs:
+    StartIndex: int
+    Count: int
+
+
+@dataclass(frozen=True, slots=True)
+class _Column:
+    """Column of a curve or EIS data set to emit."""
+
+    template: PSDataArray
+    """Empty .NET data array, copied for every measurement."""
+    values: np.ndarray | list[IDataValue]
+    """Generated values, or the .NET data values of a recorded array."""
+
+    @classmethod
+    def generate(cls, quantity: str, unit: str, values: np.ndarray) -> _Column:
+        if quantity == 'Time':
+            return cls(DataArrayTime(quantity), values)
+        return cls(_to_psarray(quantity, unit, np.empty(0)), values)
+
+    @classmethod
+    def record(cls, psarray: PSDataArray) -> _Column:
+        return cls(psarray.Clone(False), list(psarray))
+
+    def new_psarray(self) -> PSDataArray:
+        # Clone() returns a plain data array, but EIS data sets look up the time by type
+        if array_enum_to_str(self.template.ArrayType) == 'Time':
+            return DataArrayTime(self.template.Description)
+        return self.template.Clone(False)
+
+    def extend(self, psarray: PSDataArray, start: int, stop: int) -> None:
+        if isinstance(self.values, np.ndarray):
+            _extend_psarray(psarray, self.values[start:stop])
+        else:
+            psarray.AddRange(System.Array[IDataValue](self.values[start:stop]))
+
+
+@dataclass(frozen=True, slots=True)
+class _Source:
+    """Data to emit for one curve or EIS data set."""
+
+    kind: Literal['curve', 'eis']
+    title: str
+    columns: list[_Column]
+    """Columns to emit, for curves the x and y column."""
+    t: np.ndarray
+    """Time of every point since the start of the measurement in seconds."""
+    eis_types: tuple[enumScanType, enumFrequencyType] = (
+        enumScanType.Fixed,
+        enumFrequencyType.Scan,
+    )
+    """Scan and frequency type for EIS data."""
+
+
+class _SimulatedDevice:
+    """Hardware sync trigger shared by the channels of a simulated multichannel device."""
+
+    def __init__(self):
+        self._condition: threading.Condition = threading.Condition()
+        self._generation: int = 0
+
+    def arm(self) -> int:
+        """Return the current trigger generation, call before waiting."""
+        with self._condition:
+            return self._generation
+
+    def trigger(self) -> None:
+        """Start all channels waiting for the trigger."""
+        with self._condition:
+            self._generation += 1
+            self._condition.notify_all()
+
+    def wait(self, generation: int, timeout: float | None = None) -> bool:
+        """Wait until triggered after `arm()` returned `generation`."""
+        with self._condition:
+            return self._condition.wait_for(lambda: self._generation != generation, timeout)
+
+
+@dataclass(repr=False)
+class SimulatedInstrument(Instrument):
+    """Simulated instrument to run the measurement pipeline without hardware.
+
+    Use it wherever an `Instrument` is expected, for example
+    in `connect()` or `InstrumentPoolAsync`. Measurements emit curves,
+    or EIS data for impedance methods, through the same sequence of events as
+    a real instrument: measurement begin, curve start, new data, curve finished
+    and measurement end. The data are generated in a background thread and
+    the result is a regular `Measurement`.
+
+    Curves contain a sine of 1 µA with a period of 10 s versus time with
+    Gaussian noise. EIS data follow a Randles circuit.
+
+    Use `SimulatedInstrument.multichannel()` to simulate the channels of a
+    multichannel instrument, including hardware synchronization.
+
+    Direct control (e.g. `set_potential()` or `status()`) is not supported.
+    """
+
+    id: str = field(default='Simulated', repr=False)
+    """Device ID of the instrument, use `NameCH001` for a channel of a multichannel device."""
+    interface: str = 'simulated'
+    """Type of the connection."""
+    device: Any = field(default_factory=_SimulatedDevice, repr=False)
+    """Shared state of the channels, see `multichannel()`."""
+
+    rate: float = 100.0
+    """Number of points per second of measurement time."""
+    speed: float = 1.0
+    """Playback speed, e.g. 10 for ten times faster than real time.
+
+    Use `math.inf` to emit the data as fast as possible.
+    The batches of new data keep the same size."""
+    noise: float = 0.01
+    """Standard deviation of the Gaussian noise, in µA for curves
+    and relative to the impedance for EIS data."""
+    n_points: int = 200
+    """Number of points per curve, or number of frequencies for EIS."""
+    n_curves: int = 1
+    """Number of curves per measurement."""
+    seed: int | None = None
+    """Seed for the noise, for reproducible data."""
+    replay: Measurement | None = field(default=None, repr=False)
+    """Recorded measurement to replay instead of generating data, see `from_session()`."""
+
+    @classmethod
+    def multichannel(
+        cls,
+        n_channels: int,
+        name: str = 'Simulated',
+        **kwargs: Any,
+    ) -> list[SimulatedInstrument]:
+        """Create the channels of a simulated multichannel instrument.
+
+        The channels share a hardware sync trigger. Channel 1 starts
+        all other channels if the method uses hardware synchronization.
+
+        Parameters
+        ----------
+        n_channels : int
+            Number of channels.
+        name : str
+            Name of the instrument.
+        **kwargs
+            Other settings passed to every channel, e.g. `rate` or `noise`.
+
+        Returns
+        -------
+        instruments : list[SimulatedInstrument]
+            One instrument per channel.
+        """
+        device = _SimulatedDevice()
+
+        return [
+            cls(id=f'{name}CH{channel:03d}', device=device, **kwargs)
+            for channel in range(1, n_channels + 1)
+        ]
+
+    @classmethod
+    def from_session(
+        cls,
+        path: str | Path,
+        index: int = 0,
+        **kwargs: Any,
+    ) -> SimulatedInstrument:
+        """Create a simulated instrument that replays a recorded measurement.
+
+        Every measurement replays the curves or EIS data of the recorded
+        measurement, regardless of the method. Use `speed` to replay at
+        real time (1.0), faster (e.g. 10.0), or as fast as possible (`math.inf`).
+
+        Points of curves versus time and EIS data are emitted at their recorded
+        time. Points of other curves, e.g. versus potential, are emitted at
+        `rate` points per second.
+
+        Parameters
+        ----------
+        path : str | Path
+            Path to session file (.pssession).
+        index : int
+            Index of the measurement in the session file.
+        **kwargs
+            Other settings, e.g. `speed` or `rate`.
+
+        Returns
+        -------
+        instrument : SimulatedInstrument
+        """
+        measurement = load_session_file(path)[index]
+        return cls(replay=measurement, **kwargs)
+
+    @override
+    async def _connect_async(self) -> SimulatedComm:  # type: ignore
+        return SimulatedComm(self)
+
+    def _sources(self, psmethod: PalmSens.Method) -> list[_Source]:
+        """Generate the data for a measurement."""
+        if self.replay is not None:
+            return self._recorded_sources(self.replay)
+
+        rng = np.random.default_rng(self.seed)
+        index = np.arange(self.n_points)
+
+        if isinstance(psmethod, ImpedimetricMethodBase):
+            frequency = np.logspace(5, -1, self.n_points)
+            omega = 2 * np.pi * frequency
+
+            # Randles circuit, Rs = 100 Ω, Rct = 1 kΩ, Cdl = 1 µF
+            z = 100 + 1000 / (1 + 1j * omega * 1000 * 1e-6)
+            z *= 1 + self.noise * rng.standard_normal(self.n_points)
+
+            t = index / self.rate
+            return [
+                _Source(
+                    kind='eis',
+                    title='Simulated EIS',
+                    columns=[
+                        _Column.generate('Time', 's', t),
+                        _Column.generate('Frequency', 'Hz', frequency),
+                        _Column.generate('ZRe', 'Ω', z.real),
+                        _Column.generate('ZIm', 'Ω', z.imag),
+                        _Column.generate('Z', 'Ω', np.abs(z)),
+                        _Column.generate('Phase', '°', -np.angle(z, deg=True)),
+                        _Column.generate('Iac', 'µA', 0.01 / np.abs(z) * 1e6),
+                    ],
+                    t=t,
+                )
+            ]
+
+        sources = []
+
+        for i in range(self.n_curves):
+            t = (index + i * self.n_points) / self.rate
+            current = np.sin(2 * np.pi * t / 10) + self.noise * rng.standard_normal(
+                self.n_points
+            )
+
+            sources.append(
+                _Source(
+                    kind='curve',
+                    title=f'Simulated {i + 1}',
+                    columns=[
+                        _Column.generate('Time', 's', t),
+                        _Column.generate('Current', 'µA', current),
+                    ],
+                    t=t,
+                )
+            )
+
+        return sources
+
+    def _recorded_time(self, arrays: list[DataArray], offset: float) -> np.ndarray:
+        """Return the time of every point of a recorded curve or EIS data set."""
+        n_points = len(arrays[0])
+
+        for array in arrays:
+            if array.type == 'Time':
+                t = np.nan_to_num(array.to_numpy())
+                t = np.maximum.accumulate(t - t[0]) if n_points else t
+                return offset + t
+
+        return offset + np.arange(n_points) / self.rate
+
+    def _recorded_sources(self, measurement: Measurement) -> list[_Source]:
+        """Return the curves and EIS data of a recorded measurement."""
+        sources = []
+        offset = 0.0
+
+        for eis_data in measurement.eis_data:
+            arrays = [array for array in eis_data.dataset.values() if not array.is_derived]
+            t = self._recorded_time(arrays, offset)
+            pseis = eis_data._pseis
+
+            sources.append(
+                _Source(
+                    kind='eis',
+                    title=eis_data.title,
+                    columns=[_Column.record(array._psarray) for array in arrays],
+                    t=t,
+                    eis_types=(pseis.ScanType, pseis.FreqType),
+                )
+            )
+            offset = t[-1] if len(t) else offset
+
+        for curve in measurement.curves:
+            arrays = [curve.x_array, curve.y_array]
+            t = self._recorded_time(arrays, offset)
+
+            sources.append(
+                _Source(
+                    kind='curve',
+                    title=curve.title,
+                    columns=[_Column.record(array._psarray) for array in arrays],
+                    t=t,
+                )
+            )
+            offset = t[-1] if len(t) else offset
+
+        return sources
+
+
+class _SimulatedConnection:
+    """Stand-in for the client connection of a simulated instrument."""
+
+    def __init__(self):
+        self.Semaphore: SemaphoreSlim = SemaphoreSlim(1, 1)
+        self.ReceiveMessage: _Event = _Event()
+        self.MuxChannel: int = 0
+
+    def GetFWCommitHash(self) -> str:
+        return ''
+
+    def SetMuxChannel(self, channel: int) -> None:
+        self.MuxChannel = channel
+
+    def SetMuxChannelAsync(self, channel: int) -> Task:
+        self.SetMuxChannel(channel)
+        return Task.CompletedTask
+
+
+class _SimulatedSerial:
+    def __init__(self, id: str):
+        self._id: str = id
+
+    def TypeToModelName(self) -> str:
+        return 'Simulated'
+
+    def TypeToString(self) -> str:
+        return 'Simulated'
+
+    def ToString(self) -> str:
+        return self._id
+
+    @override
+    def __str__(self) -> str:
+        return self._id
+
+
+class SimulatedComm:
+    """Stand-in for `PalmSens.Comm.CommManager` of a `SimulatedInstrument`.
+
+    The measurement events are raised from a background thread,
+    like the events of a real instrument.
+    """
+
+    def __init__(self, instrument: SimulatedInstrument):
+        self._instrument: SimulatedInstrument = instrument
+        self._aborted: threading.Event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._rng: np.random.Generator = np.random.default_rng(instrument.seed)
+
+        self.Capabilities: EmStat4HRCapabilities = EmStat4HRCapabilities()
+        self.Capabilities.FirmwareVersion = self.Capabilities.MinFirmwareVersionRequired
+        set_license_mask(
+            self.Capabilities,
+            get_license_mask(self.Capabilities) | _LICENSE_EIS | _LICENSE_GEIS,
+        )
+        self.ClientConnection: _SimulatedConnection = _SimulatedConnection()
+        self.DeviceSerial: _SimulatedSerial = _SimulatedSerial(instrument.id)
+        self.State: CommManager.DeviceState = CommManager.DeviceState.Idle
+
+        self.BeginMeasurementAsync: _Event = _Event()
+        self.EndMeasurementAsync: _Event = _Event()
+        self.BeginReceiveCurve: _Event = _Event()
+        self.BeginReceiveEISData: _Event = _Event()
+        self.Disconnected: _Event = _Event()
+        self.ReceiveStatusAsync: _Event = _Event()
+
+    def __getattr__(self, name: str) -> Any:
+        raise AttributeError(f'{name!r} is not supported by simulated instruments.')
+
+    def get_Current(self) -> float:
+        return self._reading(1.0)
+
+    def get_Potential(self) -> float:
+        return self._reading(0.1)
+
+    def GetCurrentAsync(self) -> Task:
+        return Task.FromResult[System.Single](self.get_Current())
+
+    def GetPotentialAsync(self) -> Task:
+        return Task.FromResult[System.Single](self.get_Potential())
+
+    def _reading(self, amplitude: float) -> float:
+        """Return a noisy sine with a period of 10 s, like the simulated curves."""
+        t = time.perf_counter()
+        value = amplitude * np.sin(2 * np.pi * t / 10)
+        return float(value + self._rng.normal(0, self._instrument.noise))
+
+    def MeasureAsync(self, psmethod: PalmSens.Method) -> Task:
+        self._aborted.clear()
+
+        # Arm before returning, so a trigger by another channel cannot be missed
+        generation = self._instrument.device.arm()
+
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(psmethod, generation),
+            name=f'simulated-{self._instrument.id}',
+            daemon=True,
+        )
+        self._thread.start()
+        return Task.CompletedTask
+
+    def Abort(self) -> None:
+        self._aborted.set()
+
+    def AbortAsync(self) -> Task:
+        self.Abort()
+        return Task.CompletedTask
+
+    def Disconnect(self) -> None:
+        self.Abort()
+
+        if self._thread is not None:
+            self._thread.join()
+
+    def DisconnectAsync(self) -> Task:
+        self.Disconnect()
+        return Task.CompletedTask
+
+    def Dispose(self) -> None:
+        pass
+
+    def _run(self, psmethod: PalmSens.Method, generation: int) -> None:
+        """Run the measurement, called on the measurement thread.
+
+        An error is reported like a communication error, and the end of the
+        measurement is always raised, so that nobody waits for it forever."""
+        try:
+            self._measure(psmethod, generation)
+        except Exception:
+            self.Disconnected(self, System.EventArgs.Empty)
+            raise
+        finally:
+            self.State = CommManager.DeviceState.Idle
+            self.EndMeasurementAsync(self, None)
+
+    def _measure(self, psmethod: PalmSens.Method, generation: int) -> None:
+        device: _SimulatedDevice = self._instrument.device
+
+        psmeasurement = PalmSens.Measurement(psmethod)
+        self.State = CommManager.DeviceState.Measurement
+        self.BeginMeasurementAsync(self, _BeginMeasurementArgs(psmeasurement))
+
+        # MethodSCRIPT enables hardware sync in the script
+        script = str(getattr(psmethod, 'MethodScript', ''))
+
+        if psmethod.UseHWSync or 'set_channel_sync 1' in script:
+            if self._instrument.channel == 1:
+                device.trigger()
+            else:
+                while not (self._aborted.is_set() or device.wait(generation, timeout=0.1)):
+                    pass
+
+        start = time.perf_counter()
+
+        for source in self._instrument._sources(psmethod):
+            if self._aborted.is_set():
+                break
+
+            if source.kind == 'eis':
+                self._emit_eis_data(psmeasurement, source, start)
+            else:
+                self._emit_curve(psmeasurement, source, start)
+
+    def _batches(self, source: _Source, start: float) -> Iterator[tuple[int, int]]:
+        """Yield the index ranges of the new data, waiting until they are due."""
+        speed = self._instrument.speed
+
+        # Split at every batch interval of measurement time
+        ticks = np.floor(source.t / _BATCH_INTERVAL)
+        edges = [0, *(np.flatnonzero(np.diff(ticks)) + 1).tolist(), len(source.t)]
+
+        for first, stop in zip(edges[:-1], edges[1:]):
+            delay = start + source.t[stop - 1] / speed - time.perf_counter()
+
+            if delay > 0 and self._aborted.wait(delay):
+                return
+
+            if self._aborted.is_set():
+                return
+
+            yield first, stop
+
+    def _emit_curve(
+        self, psmeasurement: PalmSens.Measurement, source: _Source, start: float
+    ) -> None:
+        arrays = [column.new_psarray() for column in source.columns]
+
+        pscurve = PalmSens.Plottables.Curve(arrays[0], arrays[1], source.title, False)
+        _ = psmeasurement.AddCurve(pscurve)
+
+        curve = _PlottableProxy(pscurve)
+        self.BeginReceiveCurve(self, _CurveEventArgs(curve))
+
+        for first, stop in self._batches(source, start):
+            for psarray, column in zip(arrays, source.columns):
+                column.extend(psarray, first, stop)
+
+            curve.NewDataAdded(curve, _ArrayDataAddedArgs(first, stop - first))
+
+        pscurve.Finish()
+        curve.Finished(curve, None)
+
+    def _emit_eis_data(
+        self, psmeasurement: PalmSens.Measurement, source: _Source, start: float
+    ) -> None:
+        pseis = PalmSens.Plottables.EISData(*source.eis_types, False)
+        pseis.Title = source.title
+
+        # Replace the default arrays of the data set by the columns of the source
+        pseis.EISDataSet.Clear()
+
+        arrays = [
+            pseis.EISDataSet.AddDataArray(column.new_psarray()) for column in source.columns
+        ]
+
+        psmeasurement.EISdata.Add(pseis)
+
+        eis_data = _PlottableProxy(pseis)
+        self.BeginReceiveEISData(self, eis_data)
+
+        for first, stop in self._batches(source, start):
+            for psarray, column in zip(arrays, source.columns):
+                column.extend(psarray, first, stop)
+
+            eis_data.NewDataAdded(eis_data, None)
+
+        pseis.Finish()
+        eis_data.Finished(eis_data, None)
@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Iterator, TypeVar
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from .._data.data_array import DataArray
+    from .._data.measurement import Measurement
+    from .._data.types import AllowedArrayTypes
+
+T = TypeVar('T')
+
+
+class _StartGate:
+    """Call `MeasureAsync` on several channels together.
+
+    Every channel stages its start function after it has acquired the
+    connection lock and converted the method. When the last channel is staged,
+    all start functions are called back to back, without yielding to the event loop.
+
+    Parameters
+    ----------
+    n_channels : int
+        Number of channels that must be staged before the release.
+    """
+
+    def __init__(self, n_channels: int):
+        self.n_channels: int = n_channels
+
+        self.released: float | None = None
+        """Time of the release, `time.perf_counter()`."""
+
+        self.spread: float | None = None
+        """Time in s between the first and the last start call."""
+
+        self._staged: list[tuple[Callable[[], Any], asyncio.Future[Any]]] = []
+        self._error: BaseException | None = None
+
+    async def start(self, start: Callable[[], T]) -> T:
+        """Stage the start function and return its result after the release."""
+        if self._error is not None:
+            raise self._error
+
+        future: asyncio.Future[T] = asyncio.get_running_loop().create_future()
+        self._staged.append((start, future))
+
+        if len(self._staged) == self.n_channels:
+            self._release()
+
+        return await future
+
+    def cancel(self, error: BaseException) -> None:
+        """Fail the staged channels, if the release has not happened yet."""
+        if self.released is not None:
+            return
+
+        self._error = error
+
+        for _, future in self._staged:
+            if not future.done():
+                future.set_exception(error)
+
+    def _on_done(self, task: asyncio.Future[Any]) -> None:
+        """Cancel the start if a channel failed before it was staged."""
+        if task.cancelled():
+            self.cancel(
+                RuntimeError('Synchronized start cancelled, another channel was cancelled.')
+            )
+        elif (error := task.exception()) is not None:
+            cancelled = RuntimeError('Synchronized start cancelled, another channel failed.')
+            cancelled.__cause__ = error
+            self.cancel(cancelled)
+
+    def _release(self) -> None:
+        self.released = time.perf_counter()
+
+        for start, future in self._staged:
+            # Do not start channels that were cancelled while waiting
+            if future.done():
+                continue
+
+            try:
+                future.set_result(start())
+            except Exception as ex:
+                future.set_exception(ex)
+
+        self.spread = time.perf_counter() - self.released
+
+
+@dataclass(frozen=True, slots=True)
+class SyncResult:
+    """Measurements started together, see `InstrumentPoolAsync.measure_synchronized()`.
+
+    The channels start within a few milliseconds of each other, but not exactly
+    at the same time. The time of every point is relative to the begin of its own
+    measurement. `offsets` corrects for the measured start skew,
+    use `time()` or `aligned()` to compare the channels on a common time axis.
+
+    The data are taken from the first curve of every measurement, or from the
+    measurement data set if the curve has no time array, e.g. for voltammetry.
+    """
+
+    measurements: list[Measurement]
+    """Measurements in the order of the channels in the pool."""
+
+    begin_times: list[float]
+    """Time of the begin measurement event of every channel, `time.perf_counter()`."""
+
+    released: float
+    """Time `MeasureAsync` was called on the channels, `time.perf_counter()`."""
+
+    release_spread: float
+    """Time in s between the first and the last call to `MeasureAsync`."""
+
+    def __len__(self) -> int:
+        return len(self.measurements)
+
+    def __iter__(self) -> Iterator[Measurement]:
+        yield from self.measurements
+
+    def __getitem__(self, index: int) -> Measurement:
+        return self.measurements[index]
+
+    @property
+    def offsets(self) -> np.ndarray:
+        """Begin of every channel in s after the channel that began first."""
+        begin_times = np.asarray(self.begin_times)
+        return begin_times - begin_times.min()
+
+    @property
+    def skew(self) -> float:
+        """Time in s between the first and the last channel to begin."""
+        return float(self.offsets.max())
+
+    def time(self, index: int) -> np.ndarray:
+        """Return the time of every point of a channel on the common time axis.
+
+        Parameters
+        ----------
+        index : int
+            Index of the channel in the pool.
+
+        Returns
+        -------
+        time : np.ndarray
+            Time in s since the begin of the channel that began first.
+        """
+        t, _ = _arrays(self.measurements[index], 'Time')
+        return t + self.offsets[index]
+
+    def aligned(
+        self,
+        type: AllowedArrayTypes = 'Current',
+        *,
+        interval: float | None = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Interpolate an array of every channel on a common time grid.
+
+        The grid covers the time in which all channels were measuring.
+
+        Parameters
+        ----------
+        type : str
+            Type of the array, e.g. 'Current' or 'Potential'.
+        interval : float, optional
+            Time between the grid points in s, by default the largest
+            median interval between the points of the channels.
+
+        Returns
+        -------
+        time : np.ndarray
+            Time of the grid points in s, see `time()`.
+        values : np.ndarray
+            Array with shape `(n_channels, n_points)`.
+        """
+        times = []
+        arrays = []
+
+        for measurement, offset in zip(self.measurements, self.offsets):
+            t, array = _arrays(measurement, type)
+            times.append(t + offset)
+            arrays.append(array)
+
+        if any(len(t) == 0 for t in times):
+            raise ValueError('Every channel must have data.')
+
+        start = max(t[0] for t in times)
+        stop = min(t[-1] for t in times)
+
+        if stop < start:
+            raise ValueError('The channels do not overlap in time.')
+
+        if interval is None:
+            interval = max(
+                (float(np.median(np.diff(t))) for t in times if len(t) > 1), default=0.0
+            )
+
+        if interval <= 0:
+            raise ValueError('Interval must be positive.')
+
+        grid = start + np.arange(int((stop - start) / interval + 1e-9) + 1) * interval
+        values = np.array([np.interp(grid, t, y) for t, y in zip(times, arrays)])
+
+        return grid, values
+
+
+def _arrays(measurement: Measurement, type: AllowedArrayTypes) -> tuple[np.ndarray, np.ndarray]:
+    """Return the time and the first array of this type, from the first curve or the data set."""
+    sources = [[curve.x_array, curve.y_array] for curve in measurement.curves[:1]]
+    sources.append(list(measurement.dataset.arrays()))
+
+    for arrays in sources:
+        by_type: dict[str, DataArray] = {}
+
+        for array in arrays:
+            _ = by_type.setdefault(array.type, array)
+
+        if 'Time' in by_type and type in by_type:
+            return by_type['Time'].to_numpy(), by_type[type].to_numpy()
+
+    raise ValueError(f'Measurement has no time and {type!r} arrays.')
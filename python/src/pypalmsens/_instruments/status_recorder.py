@@ -0,0 +1,333 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from threading import Lock
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from PalmSens.Comm import CommManager
+from System.Threading.Tasks import Task
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pandas as pd
+    from PalmSens.Comm import StatusEventArgs
+
+    from .._types import AllowedDeviceState
+
+_FIELDS: tuple[str, ...] = ('potential', 'current', 'current_we2', 'aux_input', 'noise')
+
+
+@dataclass(frozen=True, slots=True)
+class StatusRecord:
+    """Copy of the idle status recorded by a `StatusRecorder`, oldest first.
+
+    The status fields are single precision, like the values sent by the instrument."""
+
+    timestamp: np.ndarray
+    """Time (`time.time()`) at which every status was received."""
+
+    potential: np.ndarray
+    """Potential in V."""
+
+    current: np.ndarray
+    """Current in µA."""
+
+    current_we2: np.ndarray
+    """Current of WE2 in µA."""
+
+    aux_input: np.ndarray
+    """Raw aux input."""
+
+    noise: np.ndarray
+    """Measured noise."""
+
+    state: np.ndarray
+    """Device state code for every status, see `state_names` for the names."""
+
+    state_names: dict[int, AllowedDeviceState]
+    """Device state name for every code in `state`."""
+
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+    def device_states(self) -> list[AllowedDeviceState]:
+        """Return the device state name for every status."""
+        names = self.state_names
+        return [names[code] for code in self.state.tolist()]
+
+    def to_dict(self) -> dict[str, np.ndarray]:
+        """Return record as mapping of column name to array.
+
+        The mapping can be used to create a pandas or polars dataframe,
+        or to save the data with `np.savez()`.
+
+        Returns
+        -------
+        dct : dict[str, np.ndarray]
+            Dictionary with the timestamp, the status fields and the state code.
+        """
+        dct = {'timestamp': self.timestamp}
+        dct.update({name: getattr(self, name) for name in _FIELDS})
+        dct['state'] = self.state
+        return dct
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Return record as pandas DataFrame.
+        Requires pandas to be installed.
+
+        The device state is stored as categorical column.
+
+        Returns
+        -------
+        df : pd.DataFrame
+            Dataframe with one row per status.
+        """
+        import pandas as pd
+
+        df = pd.DataFrame(self.to_dict())
+        df['state'] = pd.Categorical.from_codes(
+            np.searchsorted(sorted(self.state_names), self.state),
+            categories=[self.state_names[code] for code in sorted(self.state_names)],
+        )
+        return df
+
+
+class StatusRecorder:
+    """Growing columnar buffer with the idle status of an instrument.
+
+    Pass an instance to `InstrumentManager.record_status()` or
+    `InstrumentManagerAsync.record_status()` to record the status events
+    that the instrument sends when it is idle or in a pretreatment phase.
+
+    Unlike `register_status_callback()`, the recorder does not create a `Status`
+    object per event. The raw fields are written directly to numpy arrays on the
+    thread that receives the event, which keeps the overhead small when logging
+    for hours. The arrays grow as needed.
+
+    The recorder can be read from any thread. Reads only copy the requested
+    rows, and the internal lock is held only for the copy.
+
+    Parameters
+    ----------
+    decimation : int
+        Only keep every n-th status event.
+    capacity : int
+        Initial number of rows to allocate.
+    """
+
+    def __init__(self, decimation: int = 1, capacity: int = 4096):
+        if decimation < 1:
+            raise ValueError('Decimation must be at least 1.')
+
+        if capacity < 1:
+            raise ValueError('Capacity must be at least 1.')
+
+        self.decimation: int = decimation
+        """Only every n-th status event is kept."""
+
+        self._lock: Lock = Lock()
+        self._n: int = 0
+        self._n_received: int = 0
+        self._time: np.ndarray = np.empty(capacity, dtype=np.float64)
+        self._values: np.ndarray = np.empty((capacity, len(_FIELDS)), dtype=np.float32)
+        self._state: np.ndarray = np.empty(capacity, dtype=np.int8)
+        self._state_names: dict[int, AllowedDeviceState] = {}
+
+    def __repr__(self):
+        return (
+            f'{type(self).__name__}(decimation={self.decimation}, '
+            f'n_rows={len(self)}, n_received={self.n_received})'
+        )
+
+    def __len__(self) -> int:
+        return self._n
+
+    @property
+    def n_received(self) -> int:
+        """Total number of status events received since the last reset."""
+        return self._n_received
+
+    def reset(self) -> None:
+        """Remove all rows."""
+        with self._lock:
+            self._n = 0
+            self._n_received = 0
+
+    def _grow(self) -> None:
+        """Double the capacity of the arrays. Must hold the lock."""
+        capacity = 2 * len(self._time)
+        n = self._n
+
+        time_ = np.empty(capacity, dtype=self._time.dtype)
+        time_[:n] = self._time[:n]
+        values = np.empty((capacity, len(_FIELDS)), dtype=self._values.dtype)
+        values[:n] = self._values[:n]
+        state = np.empty(capacity, dtype=self._state.dtype)
+        state[:n] = self._state[:n]
+
+        self._time, self._values, self._state = time_, values, state
+
+    def append(
+        self,
+        potential: float,
+        current: float,
+        current_we2: float = np.nan,
+        aux_input: float = np.nan,
+        noise: float = np.nan,
+        state: AllowedDeviceState = 'Idle',
+        *,
+        timestamp: float | None = None,
+    ) -> None:
+        """Append a status row, subject to decimation.
+
+        Status events of the instrument are recorded automatically,
+        use this to add readings from another source.
+
+        Parameters
+        ----------
+        potential : float
+            Potential in V.
+        current : float
+            Current in µA.
+        current_we2 : float, optional
+            Current of WE2 in µA.
+        aux_input : float, optional
+            Raw aux input.
+        noise : float, optional
+            Measured noise.
+        state : AllowedDeviceState
+            Device state.
+        timestamp : float, optional
+            Time the status was received, defaults to `time.time()`.
+        """
+        self._write(
+            (potential, current, current_we2, aux_input, noise),
+            int(getattr(CommManager.DeviceState, state)),
+            state,
+            time.time() if timestamp is None else timestamp,
+        )
+
+    def _write(
+        self,
+        values: tuple[Any, ...],
+        code: int,
+        name: Any,
+        timestamp: float,
+    ) -> None:
+        with self._lock:
+            self._n_received += 1
+
+            if (self._n_received - 1) % self.decimation:
+                return
+
+            if self._n == len(self._time):
+                self._grow()
+
+            i = self._n
+            self._time[i] = timestamp
+            self._values[i] = values
+            self._state[i] = code
+            self._n += 1
+
+            if code not in self._state_names:
+                self._state_names[code] = str(name)  # type: ignore
+
+    def _status_handler(self, sender, args: StatusEventArgs) -> Task.CompletedTask:
+        """Handler for `ReceiveStatusAsync`, called on the receiving thread."""
+        if self._n_received % self.decimation:
+            # Skip reading the fields of events that are decimated away
+            with self._lock:
+                self._n_received += 1
+            return Task.CompletedTask
+
+        status = args.GetStatus()
+        state = args.DeviceState
+
+        self._write(
+            (
+                status.PotentialReading.Value,
+                status.CurrentReading.Value,
+                status.CurrentReadingWE2.Value,
+                status.AuxInput,
+                status.Noise,
+            ),
+            int(state),
+            state,
+            time.time(),
+        )
+        return Task.CompletedTask
+
+    def _slice(self, start: int, stop: int) -> StatusRecord:
+        """Return copy of rows `start` to `stop`. Must hold the lock."""
+        values = self._values[start:stop].T.copy()
+
+        return StatusRecord(
+            timestamp=self._time[start:stop].copy(),
+            **{name: column for name, column in zip(_FIELDS, values)},
+            state=self._state[start:stop].copy(),
+            state_names=dict(self._state_names),
+        )
+
+    def last(self, n: int | None = None) -> StatusRecord:
+        """Return the last `n` rows.
+
+        Parameters
+        ----------
+        n : int, optional
+            Number of rows, defaults to all rows.
+
+        Returns
+        -------
+        record : StatusRecord
+            Copy of the rows, oldest first.
+        """
+        with self._lock:
+            start = 0 if n is None else max(self._n - n, 0)
+            return self._slice(start, self._n)
+
+    def between(self, start: float, stop: float | None = None) -> StatusRecord:
+        """Return the rows received in a time window.
+
+        Parameters
+        ----------
+        start : float
+            Start of the window as `time.time()` timestamp, inclusive.
+        stop : float, optional
+            End of the window, exclusive. Defaults to the newest row.
+
+        Returns
+        -------
+        record : StatusRecord
+            Copy of the rows, oldest first.
+        """
+        with self._lock:
+            timestamps = self._time[: self._n]
+            first = int(np.searchsorted(timestamps, start, side='left'))
+            last = (
+                self._n if stop is None else int(np.searchsorted(timestamps, stop, side='left'))
+            )
+            return self._slice(first, max(first, last))
+
+    def save(self, path: str | Path) -> None:
+        """Save all rows to a numpy `.npz` file.
+
+        The file contains one array per column of `StatusRecord.to_dict()`
+        and the `state_names` as two arrays `state_codes` and `state_labels`.
+
+        Parameters
+        ----------
+        path : str | Path
+            Path to the file.
+        """
+        record = self.last()
+        codes = sorted(record.state_names)
+
+        np.savez(
+            path,
+            **record.to_dict(),
+            state_codes=np.array(codes, dtype=np.int8),
+            state_labels=np.array([record.state_names[code] for code in codes]),
+        )
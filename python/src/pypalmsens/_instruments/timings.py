@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from threading import Lock
+from typing import Sequence
+
+import numpy as np
+
+_STAGES: tuple[tuple[str, str, str], ...] = (
+    ('prepare', 'called', 'lock_requested'),
+    ('lock_wait', 'lock_requested', 'lock_acquired'),
+    ('start', 'lock_acquired', 'started'),
+    ('begin', 'started', 'begin_event'),
+    ('first_data', 'begin_event', 'first_data'),
+    ('data', 'first_data', 'last_data'),
+    ('end', 'last_data', 'end_event'),
+    ('finish', 'end_event', 'finished'),
+    ('total', 'called', 'finished'),
+)
+"""Stage name, and the timestamps at the start and end of the stage."""
+
+
+@dataclass(slots=True)
+class MeasurementTimings:
+    """Timestamps of the stages of a single measurement.
+
+    All timestamps are `time.perf_counter()` values in s,
+    or None if the stage was not reached, e.g. `first_data` if no data were received.
+    See `durations()` for the time spent in every stage.
+    """
+
+    called: float | None = None
+    """`measure()` was called."""
+
+    lock_requested: float | None = None
+    """Method converted and validated, waiting for the connection lock."""
+
+    lock_acquired: float | None = None
+    """Connection lock acquired."""
+
+    started: float | None = None
+    """`MeasureAsync` returned."""
+
+    begin_event: float | None = None
+    """Begin measurement event received from the instrument."""
+
+    first_data: float | None = None
+    """First batch of data received."""
+
+    last_data: float | None = None
+    """Last batch of data received."""
+
+    end_event: float | None = None
+    """End measurement event received from the instrument."""
+
+    finished: float | None = None
+    """All callbacks finished, `measure()` returns."""
+
+    def _mark(self, name: str) -> None:
+        setattr(self, name, time.perf_counter())
+
+    def _mark_data(self) -> None:
+        now = time.perf_counter()
+        if self.first_data is None:
+            self.first_data = now
+        self.last_data = now
+
+    def durations(self) -> dict[str, float]:
+        """Return the time spent in every stage.
+
+        The stages are:
+
+        - `prepare`: method conversion and validation
+        - `lock_wait`: waiting for the connection lock
+        - `start`: sending the method with `MeasureAsync`
+        - `begin`: until the instrument reports the start of the measurement
+        - `first_data`: until the first data are received
+        - `data`: from the first until the last data
+        - `end`: until the instrument reports the end of the measurement
+        - `finish`: until the remaining callbacks are finished
+        - `total`: from calling until returning from `measure()`
+
+        Returns
+        -------
+        durations : dict[str, float]
+            Duration in s by stage name, stages that were not reached are left out.
+        """
+        ret = {}
+
+        for stage, start, stop in _STAGES:
+            t0 = getattr(self, start)
+            t1 = getattr(self, stop)
+
+            if t0 is not None and t1 is not None:
+                ret[stage] = t1 - t0
+
+        return ret
+
+
+@dataclass(frozen=True, slots=True)
+class StageHistogram:
+    """Distribution of the duration of a single stage, see `TimingStats.histograms()`."""
+
+    stage: str
+    """Stage name, see `MeasurementTimings.durations()`."""
+
+    count: int
+    """Number of measurements that reached the stage."""
+
+    percentiles: dict[float, float]
+    """Duration in s by percentile."""
+
+    counts: np.ndarray
+    """Number of measurements in every bin."""
+
+    edges: np.ndarray
+    """Bin edges in s, logarithmically spaced, one more than `counts`."""
+
+
+class TimingStats:
+    """Collects the stage timings of many measurements.
+
+    Assign an instance to `InstrumentManager.timing_stats` or
+    `InstrumentManagerAsync.timing_stats` to record the timings of every
+    measurement, also available as `measurement.timings`.
+    Use `InstrumentPool.enable_timings()` to aggregate the timings of all channels
+    in a pool. Recording only takes a few timestamps per measurement
+    and one per data batch.
+
+    Parameters
+    ----------
+    maxlen : int
+        Maximum number of measurements to keep, the oldest are removed first.
+    """
+
+    def __init__(self, maxlen: int = 10_000):
+        self.maxlen: int = maxlen
+        self._timings: list[MeasurementTimings] = []
+        self._lock: Lock = Lock()
+
+    def __repr__(self):
+        return f'{type(self).__name__}(n_measurements={len(self)})'
+
+    def __len__(self) -> int:
+        return len(self._timings)
+
+    def reset(self) -> None:
+        """Remove all timings."""
+        with self._lock:
+            self._timings.clear()
+
+    def _add(self, timings: MeasurementTimings) -> None:
+        with self._lock:
+            self._timings.append(timings)
+
+            if len(self._timings) > self.maxlen:
+                del self._timings[: len(self._timings) - self.maxlen]
+
+    def timings(self) -> list[MeasurementTimings]:
+        """Return the recorded timings, oldest first."""
+        with self._lock:
+            return list(self._timings)
+
+    def durations(self) -> dict[str, np.ndarray]:
+        """Return the durations of every stage as numpy arrays.
+
+        Returns
+        -------
+        durations : dict[str, np.ndarray]
+            Durations in s by stage name, for the measurements that reached the stage.
+        """
+        per_stage: dict[str, list[float]] = {stage: [] for stage, _, _ in _STAGES}
+
+        for timings in self.timings():
+            for stage, duration in timings.durations().items():
+                per_stage[stage].append(duration)
+
+        return {stage: np.array(values) for stage, values in per_stage.items()}
+
+    def histograms(
+        self,
+        percentiles: Sequence[float] = (50, 90, 99),
+        bins: int = 20,
+    ) -> dict[str, StageHistogram]:
+        """Return the distribution of the duration of every stage.
+
+        Parameters
+        ----------
+        percentiles : Sequence[float]
+            Percentiles to compute, between 0 and 100.
+        bins : int
+            Number of logarithmically spaced bins.
+
+        Returns
+        -------
+        histograms : dict[str, StageHistogram]
+            Histogram by stage name, stages that no measurement reached are left out.
+        """
+        ret = {}
+
+        for stage, values in self.durations().items():
+            if not len(values):
+                continue
+
+            # Stages can take from microseconds to hours, use logarithmic bins
+            low = max(values.min(), 1e-6)
+            high = max(values.max(), low * 10)
+            counts, edges = np.histogram(
+                np.clip(values, low, high), bins=np.geomspace(low, high, bins + 1)
+            )
+
+            ret[stage] = StageHistogram(
+                stage=stage,
+                count=len(values),
+                percentiles={
+                    q: float(value)
+                    for q, value in zip(percentiles, np.percentile(values, percentiles))
+                },
+                counts=counts,
+                edges=edges,
+            )
+
+        return ret
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from .capabilities import estimated_duration
+
+if TYPE_CHECKING:
+    import PalmSens
+    from PalmSens.Devices import DeviceCapabilities
+
+
+@dataclass(frozen=True, slots=True)
+class Watchdog:
+    """Abort measurements that take too long or stop sending data.
+
+    Assign a watchdog to `InstrumentManagerAsync.watchdog` or
+    `InstrumentManager.watchdog`, or use `InstrumentPoolAsync.enable_watchdog()`
+    for all channels in a pool. When a limit is exceeded, the measurement is
+    aborted and `measure()` raises a `MeasurementTimeoutError`
+    with the data measured so far.
+
+    Parameters
+    ----------
+    factor : float | None
+        The deadline is the estimated duration of the method, including the
+        pretreatment, multiplied by this factor plus `margin`.
+        Use None to disable the deadline. Methods without an estimated duration,
+        for example MethodSCRIPT, have no deadline.
+    margin : float
+        Time in s added to the deadline.
+    data_timeout : float | None
+        Abort if no new data are received for this time in s.
+        Must be longer than the interval between data points.
+        The first data may take the estimated pretreatment duration longer.
+        Use None to disable.
+    abort_timeout : float
+        Time in s to wait for the instrument to accept the abort.
+    """
+
+    factor: float | None = 1.5
+    margin: float = 30.0
+    data_timeout: float | None = 60.0
+    abort_timeout: float = 5.0
+
+    def deadline(self, duration: float) -> float | None:
+        """Return the deadline in s for a method with the given estimated duration.
+
+        Parameters
+        ----------
+        duration : float
+            Estimated duration in s, including the pretreatment.
+
+        Returns
+        -------
+        deadline : float | None
+            Time in s after the start of the measurement, or None if there is no deadline.
+        """
+        if self.factor is None or duration <= 0:
+            return None
+        return duration * self.factor + self.margin
+
+    def _limits(
+        self,
+        psmethod: PalmSens.Method,
+        capabilities: DeviceCapabilities,
+    ) -> tuple[float | None, float]:
+        """Return the deadline and the estimated pretreatment duration in s."""
+        duration = estimated_duration(psmethod, capabilities)
+        total = estimated_duration(psmethod, capabilities, include_pretreatment=True)
+
+        return self.deadline(total if duration > 0 else 0.0), total - duration
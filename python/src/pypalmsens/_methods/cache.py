@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Generator, Hashable
+from contextlib import contextmanager
+
+import PalmSens
+from pydantic import BaseModel
+
+from .._types import MethodTypeCompatible
+
+
+class PSMethodCache:
+    """Cache of converted .NET methods, keyed by the content of the method parameters.
+
+    Converting a method with `_to_psmethod()` sets every parameter through
+    .NET interop, which is slow for large methods, e.g. a multiplexer with
+    all channels enabled. The cache keeps the converted methods so that a
+    method with unchanged parameters is only converted once.
+
+    A converted method is only used by one caller at a time, see `lease()`.
+    Concurrent callers with the same parameters, e.g. the channels of a pool,
+    each get their own copy.
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of different methods to keep.
+    """
+
+    def __init__(self, maxsize: int = 32):
+        self.maxsize: int = maxsize
+        self.hits: int = 0
+        """Number of leases served from the cache."""
+        self.misses: int = 0
+        """Number of leases that needed a conversion."""
+
+        self._idle: OrderedDict[Hashable, list[PalmSens.Method]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._idle)
+
+    def clear(self) -> None:
+        """Remove all converted methods."""
+        with self._lock:
+            self._idle.clear()
+
+    @contextmanager
+    def lease(
+        self, method: PalmSens.Method | MethodTypeCompatible
+    ) -> Generator[PalmSens.Method]:
+        """Return a converted method for exclusive use until the context exits.
+
+        Parameters
+        ----------
+        method : MethodType
+            Method parameters to convert. A .NET method is returned as is.
+
+        Yields
+        ------
+        psmethod : PalmSens.Method
+            Converted method, do not modify.
+        """
+        if isinstance(method, PalmSens.Method):
+            yield method
+            return
+
+        key = _content_key(method)
+
+        if key is None:
+            # Content cannot be compared, always convert
+            yield method._to_psmethod()
+            return
+
+        with self._lock:
+            idle = self._idle.get(key)
+            psmethod = idle.pop() if idle else None
+
+            if psmethod is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        if psmethod is None:
+            psmethod = method._to_psmethod()
+
+        try:
+            yield psmethod
+        finally:
+            with self._lock:
+                self._idle.setdefault(key, []).append(psmethod)
+                self._idle.move_to_end(key)
+
+                while len(self._idle) > self.maxsize:
+                    _ = self._idle.popitem(last=False)
+
+
+def _content_key(method: MethodTypeCompatible) -> Hashable | None:
+    """Return key that is equal for methods with the same type and parameters."""
+    if not isinstance(method, BaseModel):
+        return None
+    return type(method), method.model_dump_json()
+
+
+psmethod_cache = PSMethodCache()
+"""Cache shared by all instrument managers."""
@@ -125,6 +125,8 @@ class MethodType(MethodTypeCompatible, Protocol):
     def _use_hardware_sync(self) -> bool: ...
 
     def to_dict(self) -> dict[str, Any]: ...
+    @classmethod
+    def from_dict(cls, obj: dict[str, Any]) -> MethodType: ...
     def _serialize(self) -> str: ...
     def _update_params(self, psmethod: PalmSens.Method, /) -> None: ...
     def _update_params_nested(self, psmethod: PalmSens.Method, /) -> None: ...
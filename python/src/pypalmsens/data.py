@@ -9,25 +9,85 @@ from ._data.dataset import DataSet
 from ._data.eisdata import EISData
 from ._data.measurement import DeviceInfo, Measurement
 from ._data.peak import Peak
+from ._data.stream import (
+    RecoveredCurve,
+    RecoveredEISData,
+    RecoveredMeasurement,
+    StreamManifest,
+    StreamSegment,
+)
+from ._instruments.broadcast import LiveBatch
 from ._instruments.callback import (
     CallbackData,
     CallbackDataEIS,
+    CallbackDataEISProtocol,
+    CallbackDataProtocol,
+    DetachedCallbackData,
+    DetachedCallbackDataEIS,
     Status,
 )
+from ._instruments.dispatch import CallbackMetrics
+from ._instruments.health import HealthEvent
+from ._instruments.live_buffer import DecimatedSnapshot, LiveBuffer, LiveSnapshot
+from ._instruments.mux_sweep import MuxChannelResult, MuxSweepResult
+from ._instruments.sampling import Samples
+from ._instruments.scheduler import (
+    ChannelStats,
+    DurationRecord,
+    DurationReport,
+    Job,
+    JobPlan,
+    PlannedJob,
+    SchedulerStats,
+)
+from ._instruments.software_sync import SyncResult
+from ._instruments.status_recorder import StatusRecord, StatusRecorder
+from ._instruments.timings import MeasurementTimings, StageHistogram, TimingStats
 
 __all__ = [
     'CallbackData',
     'CallbackDataEIS',
+    'CallbackDataEISProtocol',
+    'CallbackDataProtocol',
+    'CallbackMetrics',
+    'ChannelStats',
     'CurrentArray',
     'CurrentReading',
     'Curve',
     'DataArray',
     'DataSet',
+    'DecimatedSnapshot',
+    'DetachedCallbackData',
+    'DetachedCallbackDataEIS',
     'DeviceInfo',
+    'DurationRecord',
+    'DurationReport',
     'EISData',
+    'HealthEvent',
+    'Job',
+    'JobPlan',
+    'LiveBatch',
+    'LiveBuffer',
+    'LiveSnapshot',
     'Measurement',
+    'MeasurementTimings',
+    'MuxChannelResult',
+    'MuxSweepResult',
     'Peak',
+    'PlannedJob',
     'PotentialArray',
     'PotentialReading',
+    'RecoveredCurve',
+    'RecoveredEISData',
+    'RecoveredMeasurement',
+    'Samples',
+    'SchedulerStats',
+    'StageHistogram',
     'Status',
+    'StatusRecord',
+    'StatusRecorder',
+    'StreamManifest',
+    'StreamSegment',
+    'SyncResult',
+    'TimingStats',
 ]
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import sys
+import threading
+
+import numpy as np
+import pytest
+
+import pypalmsens as ps
+from pypalmsens.data import LiveBatch
+
+
+@pytest.fixture
+def batch():
+    return LiveBatch(
+        kind='curve',
+        source='CH001',
+        id=123,
+        start=5,
+        names=('x', 'y'),
+        data=np.arange(6.0).reshape(3, 2),
+    )
+
+
+def test_live_batch_encode(batch):
+    frame = batch._encode()
+    decoded = LiveBatch._decode(frame[4:])
+
+    assert decoded.kind == batch.kind
+    assert decoded.source == batch.source
+    assert decoded.id == batch.id
+    assert decoded.start == batch.start
+    assert decoded.names == batch.names
+    np.testing.assert_array_equal(decoded.data, batch.data)
+    np.testing.assert_array_equal(decoded['y'], [1.0, 3.0, 5.0])
+
+
+def test_live_batch_encode_long_names(batch):
+    long = dataclasses.replace(batch, source='CH' * 200, names=('x', 'µ' * 300))
+    decoded = LiveBatch._decode(long._encode()[4:])
+
+    assert decoded.source == long.source
+    assert decoded.names == long.names
+
+    with pytest.raises(ValueError, match='limited to 65535 bytes'):
+        _ = dataclasses.replace(batch, source='C' * 70000)._encode()
+
+
+async def _roundtrip(address, batch):
+    async with ps.LivePublisher(address, max_queue=4) as publisher:
+        local = publisher.subscribe()
+
+        async with ps.LiveSubscriber(publisher.address) as subscriber:
+            await asyncio.sleep(0.05)
+
+            publisher.publish(batch)
+
+            # publishing from another thread
+            thread = threading.Thread(target=publisher._publish_end, args=('CH001',))
+            thread.start()
+            thread.join()
+
+            received = await anext(subscriber)
+            assert received.source == batch.source
+            np.testing.assert_array_equal(received.data, batch.data)
+
+            received = await anext(subscriber)
+            assert received.kind == 'end'
+
+            assert await anext(local) is batch
+
+            # slow subscribers drop the oldest batches
+            for _ in range(10):
+                publisher.publish(batch)
+
+            await asyncio.sleep(0.05)
+
+            assert local.n_dropped > 0
+            assert publisher.n_published == 12
+
+    assert len([batch async for batch in local]) <= 4
+
+
+@pytest.mark.asyncio
+async def test_publisher_tcp(batch):
+    await _roundtrip(('127.0.0.1', 0), batch)
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(sys.platform == 'win32', reason='Unix domain sockets only')
+async def test_publisher_unix(batch, tmp_path):
+    await _roundtrip(tmp_path / 'live.sock', batch)
+    assert not (tmp_path / 'live.sock').exists()
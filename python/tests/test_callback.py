@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import pickle
+
+import numpy as np
+import pytest
+
+from pypalmsens.data import (
+    CallbackData,
+    CallbackDataEIS,
+    CallbackDataEISProtocol,
+    CallbackDataProtocol,
+    DetachedCallbackData,
+    DetachedCallbackDataEIS,
+)
+
+
+def _new_points(data: CallbackDataProtocol) -> list[dict[str, float]]:
+    return [data.last_datapoint(), *data.new_datapoints()]
+
+
+def _new_points_eis(data: CallbackDataEISProtocol) -> list[dict[str, float]]:
+    return [data.last_datapoint(), *data.new_datapoints()]
+
+
+@pytest.fixture
+def callback_data(data_cv):
+    curve = data_cv[0].curves[0]
+    return CallbackData(x_array=curve.x_array, y_array=curve.y_array, start=5, id=123)
+
+
+@pytest.fixture
+def callback_data_eis(data_eis_5freq):
+    eis = data_eis_5freq[0].eis_data[0]
+    return CallbackDataEIS(data=eis.dataset, start=1, index=3, id=123)
+
+
+def test_callback_data_numpy(callback_data):
+    x = callback_data.x_array.to_numpy()
+    y = callback_data.y_array.to_numpy()
+
+    np.testing.assert_array_equal(callback_data.new_x(), x[5:])
+    np.testing.assert_array_equal(callback_data.new_y(), y[5:])
+
+    block = callback_data.new_block()
+    assert block.shape == (len(x) - 5, 2)
+    np.testing.assert_array_equal(block, np.column_stack((x[5:], y[5:])))
+
+    points = list(callback_data.new_datapoints())
+    assert len(points) == len(x) - 5
+    assert points[0] == {'x': x[5], 'y': y[5], 'index': 5}
+    assert points[-1]['index'] == callback_data.index
+
+
+def test_callback_data_detach(callback_data):
+    detached = pickle.loads(pickle.dumps(callback_data._detach()))
+    assert isinstance(detached, DetachedCallbackData)
+
+    assert detached.start == callback_data.start
+    assert detached.index == callback_data.index
+    assert (detached.last_x, detached.last_y) == (callback_data.last_x, callback_data.last_y)
+    np.testing.assert_array_equal(detached.new_block(), callback_data.new_block())
+    assert _new_points(detached) == _new_points(callback_data)
+    assert list(detached._streaming_rows()) == list(callback_data._streaming_rows())
+
+
+def test_callback_data_eis_numpy(callback_data_eis):
+    columns = callback_data_eis.new_columns()
+
+    arrays = [array for array in callback_data_eis.data.values() if not array.is_derived]
+    assert list(columns) == [array.name for array in arrays]
+
+    # Same values as the rows, `to_numpy()` differs for miDC
+    for array in arrays:
+        np.testing.assert_array_equal(columns[array.name], [array[i] for i in range(1, 4)])
+
+    points = list(callback_data_eis.new_datapoints())
+    assert [point['index'] for point in points] == [1, 2, 3]
+    assert points[-1] == callback_data_eis.last_datapoint()
+
+
+def test_callback_data_eis_detach(callback_data_eis):
+    detached = pickle.loads(pickle.dumps(callback_data_eis._detach()))
+    assert isinstance(detached, DetachedCallbackDataEIS)
+
+    assert detached.index == callback_data_eis.index
+    assert _new_points_eis(detached) == _new_points_eis(callback_data_eis)
+    assert list(detached._streaming_rows()) == list(callback_data_eis._streaming_rows())
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import math
+
+import pytest
+
+import pypalmsens as ps
+from pypalmsens._instruments.shared import MethodIncompatibleError
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ps.CapabilitiesStore(tmp_path / 'profiles')
+
+
+def test_capabilities_simulated_connect():
+    with ps.connect(ps.SimulatedInstrument(speed=math.inf)) as manager:
+        capabilities = manager.capabilities
+
+    # The simulator has no connection or firmware build info
+    assert capabilities.connection == ''
+    assert capabilities.firmware_build_date == ''
+    assert capabilities.firmware_special_description == ''
+    assert capabilities.supported_methods
+
+
+def test_capabilities_snapshot(store):
+    instrument = ps.SimulatedInstrument(speed=math.inf)
+    manager = ps.InstrumentManager(instrument)
+    manager.capabilities_store = store
+
+    with manager:
+        capabilities = manager.capabilities
+        assert manager.capabilities is capabilities
+        assert manager.supported_methods() == capabilities.supported_methods
+
+    assert instrument.id in store
+    assert list(store) == [instrument.id]
+
+    loaded = store.load(instrument.id)
+    assert loaded == capabilities
+
+
+def _validates(validate, method) -> bool:
+    try:
+        validate(method)
+    except MethodIncompatibleError:
+        return False
+    return True
+
+
+def test_capabilities_offline(store):
+    methods = [
+        ps.ChronoAmperometry(interval_time=0.1, run_time=5.0),
+        ps.ElectrochemicalImpedanceSpectroscopy(),
+        ps.FastImpedanceSpectroscopy(),
+        ps.GalvanostaticImpedanceSpectroscopy(),
+    ]
+
+    with ps.connect(ps.SimulatedInstrument(speed=math.inf)) as manager:
+        online = [_validates(manager.validate_method, method) for method in methods]
+        durations = [manager.get_estimated_duration(method) for method in methods]
+        _ = store.save(manager.capabilities)
+        serial_number = manager.capabilities.serial_number
+
+    capabilities = store.load(serial_number)
+    assert capabilities.supports_impedance
+
+    # The licensed impedance methods validate the same without connection
+    assert [_validates(capabilities.validate_method, method) for method in methods] == online
+    assert all(online)
+    assert [capabilities.get_estimated_duration(method) for method in methods] == durations
+
+
+def test_capabilities_store_missing(store):
+    with pytest.raises(KeyError):
+        _ = store.load('unknown')
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+import pypalmsens as ps
+from pypalmsens._instruments import discovery
+
+
+@pytest.fixture
+def available(monkeypatch):
+    """Replace interface discovery, return the list of available instruments."""
+    instruments = [ps.SimulatedInstrument(id='SimulatedA')]
+    calls = []
+
+    async def discover_async(**kwargs):
+        calls.append(kwargs)
+        return list(instruments)
+
+    monkeypatch.setattr(discovery, 'discover_async', discover_async)
+    return instruments, calls
+
+
+def test_discovery_cache(available, tmp_path):
+    instruments, calls = available
+    path = tmp_path / 'instruments.json'
+
+    cache = ps.DiscoveryCache(ttl=60, path=path, serial=False)
+    assert cache.age is None
+    assert cache.last_known == {}
+
+    assert cache.discover() == instruments
+    assert cache.discover() == instruments
+    assert calls == [{'serial': False}]
+
+    _ = cache.discover(refresh=True)
+    assert len(calls) == 2
+
+    cache.invalidate()
+    _ = cache.discover()
+    assert len(calls) == 3
+
+    # Last known instruments are restored from disk
+    cache = ps.DiscoveryCache(path=path)
+    assert cache.last_known == {'SimulatedA': 'simulated'}
+    assert cache.last_updated is not None
+
+
+def test_discovery_cache_ttl(available):
+    _, calls = available
+
+    cache = ps.DiscoveryCache(ttl=0)
+    _ = cache.discover()
+    _ = cache.discover()
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_instrument_watcher(available):
+    instruments, _ = available
+
+    async with ps.InstrumentWatcher(interval=0.01) as watcher:
+        event = await anext(watcher)
+        assert event.kind == 'added'
+        assert event.instrument.id == 'SimulatedA'
+
+        instruments[:] = [ps.SimulatedInstrument(id='SimulatedB')]
+
+        events = [await anext(watcher), await anext(watcher)]
+        assert [(event.kind, event.instrument.id) for event in events] == [
+            ('removed', 'SimulatedA'),
+            ('added', 'SimulatedB'),
+        ]
+
+    assert not watcher.is_running()
+    assert [event async for event in watcher] == []
+
+
+@pytest.mark.asyncio
+async def test_instrument_watcher_callback(available):
+    events = []
+
+    async def callback(event):
+        events.append(event)
+
+    async with ps.InstrumentWatcher(interval=0.01, callback=callback):
+        await asyncio.sleep(0.05)
+
+    assert [event.kind for event in events] == ['added']
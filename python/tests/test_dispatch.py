@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import pypalmsens as ps
+from pypalmsens._instruments import dispatch
+from pypalmsens._instruments.dispatch import (
+    CallbackDispatcher,
+    CallbackMetrics,
+    EventCoalescer,
+    ExecutorCallback,
+)
+
+
+def test_run_in_executor():
+    callback = ps.run_in_executor(print, 'process')
+    assert isinstance(callback, ExecutorCallback)
+    assert callback.func is print
+    assert callback._in_process
+
+    # rewrapping replaces the executor
+    callback = ps.run_in_executor(callback)
+    assert callback.func is print
+    assert not callback._in_process
+
+
+def test_process_executor_shutdown():
+    executor = dispatch._get_process_executor()
+    assert dispatch._get_process_executor() is executor
+
+    dispatch._shutdown_process_executor()
+    assert dispatch._process_executor is None
+    assert dispatch._get_process_executor() is not executor
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_inline():
+    loop = asyncio.get_running_loop()
+    metrics = CallbackMetrics()
+    dispatcher = CallbackDispatcher(loop, metrics)
+
+    results = []
+
+    def callback(value):
+        results.append((value, threading.get_ident()))
+
+    for i in range(5):
+        dispatcher.call_soon_threadsafe(callback, i, key='curve')
+
+    await asyncio.sleep(0)
+    await dispatcher.join()
+
+    assert [value for value, _ in results] == list(range(5))
+    assert all(ident == threading.get_ident() for _, ident in results)
+    assert metrics.n_calls == 5
+    assert metrics.queue_depth == 0
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_inline_error():
+    loop = asyncio.get_running_loop()
+    dispatcher = CallbackDispatcher(loop, CallbackMetrics())
+
+    errors = []
+    loop.set_exception_handler(lambda loop, context: errors.append(context['exception']))
+
+    results = []
+
+    def failing(value):
+        raise ValueError(value)
+
+    try:
+        for callback in (failing, results.append):
+            dispatcher.dispatch(callback, 1, key='curve')
+    finally:
+        loop.set_exception_handler(None)
+
+    # The error is reported, and does not skip the next callback
+    assert results == [1]
+    assert [str(error) for error in errors] == ['1']
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_executor_order():
+    loop = asyncio.get_running_loop()
+    metrics = CallbackMetrics()
+    dispatcher = CallbackDispatcher(loop, metrics)
+
+    results = []
+
+    def callback(key, value):
+        results.append((key, value, threading.get_ident()))
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        wrapped = ps.run_in_executor(callback, executor)
+
+        for i in range(20):
+            for key in 'ab':
+                dispatcher.call_soon_threadsafe(wrapped, key, i, key=key)
+
+        await asyncio.sleep(0)
+        assert metrics.max_queue_depth > 0
+
+        await dispatcher.join()
+
+    for key in 'ab':
+        assert [value for k, value, _ in results if k == key] == list(range(20))
+
+    assert all(ident != threading.get_ident() for *_, ident in results)
+    assert metrics.n_calls == 40
+    assert metrics.queue_depth == 0
+    assert metrics.mean_latency > 0
+
+    metrics.reset()
+    assert metrics.n_calls == 0
+    assert metrics.max_queue_depth == 0
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_closed():
+    loop = asyncio.get_running_loop()
+    metrics = CallbackMetrics()
+    dispatcher = CallbackDispatcher(loop, metrics)
+
+    results = []
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        wrapped = ps.run_in_executor(results.append, executor)
+
+        dispatcher.call_soon_threadsafe(wrapped, 1, key='curve')
+        await dispatcher.join()
+
+        # Late events do not start new workers
+        dispatcher.call_soon_threadsafe(wrapped, 2, key='curve')
+        dispatcher.call_soon_threadsafe(results.append, 3)
+        await asyncio.sleep(0)
+
+    assert results == [1]
+    assert not dispatcher._workers
+    assert metrics.n_dropped == 2
+    assert metrics.queue_depth == 0
+
+
+@pytest.mark.asyncio
+async def test_event_coalescer():
+    loop = asyncio.get_running_loop()
+    drained = []
+
+    coalescer = EventCoalescer(loop, drained.append)
+
+    def produce():
+        for i in range(100):
+            coalescer.add('a', i, i + 1)
+        coalescer.add('b', 5, 10)
+
+    thread = threading.Thread(target=produce)
+    thread.start()
+    thread.join()
+
+    await asyncio.sleep(0)
+
+    assert coalescer.n_events == 101
+    assert coalescer.n_drains == 1
+    assert len(drained) == 1
+
+    pending = drained[0]
+    assert pending['a'][:2] == (0, 100)
+    assert pending['b'][:2] == (5, 10)
+
+    # nothing pending, no drain
+    coalescer.drain()
+    assert coalescer.n_drains == 1
@@ -7,9 +7,10 @@ from itertools import groupby
 
 import pytest
 from PalmSens.Comm import enumDeviceType
+from System.Threading.Tasks import Task
 
 import pypalmsens as ps
-from pypalmsens._instruments.instrument import Instrument
+from pypalmsens._instruments.instrument import Instrument, _discover_interface
 from pypalmsens._instruments.shared import firmware_warning
 from pypalmsens.data import Measurement
 
@@ -162,6 +163,35 @@ async def test_discover_async():
     assert len(instruments) >= 0
 
 
+@pytest.mark.instrument
+@pytest.mark.asyncio
+async def test_discover_iter_async():
+    instruments = [instrument async for instrument in ps.discover_iter_async()]
+    assert len(instruments) >= 0
+
+
+class SlowInterface:
+    @staticmethod
+    def DiscoverDevicesAsync():
+        return Task.Delay(5000)
+
+
+@pytest.mark.asyncio
+async def test_discover_interface_timeout():
+    with pytest.warns(UserWarning, match='timed out'):
+        instruments = await _discover_interface('slow', SlowInterface, timeout=0.05)
+
+    assert instruments == []
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        instruments = await _discover_interface(
+            'slow', SlowInterface, timeout=0.05, ignore_errors=True
+        )
+
+    assert instruments == []
+
+
 @pytest.mark.instrument
 @pytest.mark.asyncio
 async def test_idle_status_callback_async():
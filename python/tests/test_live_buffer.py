@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import threading
+
+import numpy as np
+import pytest
+
+from pypalmsens.data import LiveBuffer
+
+
+def test_live_buffer_wraparound():
+    buffer = LiveBuffer(capacity=10)
+    assert len(buffer.last()) == 0
+
+    buffer.append(np.arange(4.0), np.arange(4.0) * 2, timestamp=1.0)
+
+    snapshot = buffer.last()
+    np.testing.assert_array_equal(snapshot.x, np.arange(4.0))
+    np.testing.assert_array_equal(snapshot.y, np.arange(4.0) * 2)
+
+    buffer._start_curve()
+    buffer._start_curve()
+    buffer.append(np.arange(4.0, 15.0), np.arange(4.0, 15.0), timestamp=2.0)
+
+    assert len(buffer) == 10
+    assert buffer.n_written == 15
+
+    snapshot = buffer.last()
+    np.testing.assert_array_equal(snapshot.x, np.arange(5.0, 15.0))
+    np.testing.assert_array_equal(snapshot.curve, np.ones(10))
+
+    np.testing.assert_array_equal(buffer.last(3).x, [12.0, 13.0, 14.0])
+
+    buffer.reset()
+    assert len(buffer) == 0
+
+
+def test_live_buffer_last_seconds():
+    buffer = LiveBuffer(capacity=10)
+    assert len(buffer.last_seconds(1.0)) == 0
+
+    for i in range(6):
+        buffer.append(np.array([i, i + 0.5]), np.zeros(2), timestamp=float(i))
+
+    np.testing.assert_array_equal(buffer.last_seconds(0.5).x, [5.0, 5.5])
+    np.testing.assert_array_equal(buffer.last_seconds(2.0).x, [3.0, 3.5, 4.0, 4.5, 5.0, 5.5])
+    assert len(buffer.last_seconds(100.0)) == 10
+
+
+def test_live_buffer_decimated():
+    buffer = LiveBuffer(capacity=100)
+
+    y = np.zeros(100)
+    y[70] = 9.0
+    y[20] = -9.0
+    buffer.append(np.arange(100.0), y)
+
+    decimated = buffer.decimated(4)
+    np.testing.assert_array_equal(decimated.x, [0.0, 25.0, 50.0, 75.0])
+    np.testing.assert_array_equal(decimated.y_min, [-9.0, 0.0, 0.0, 0.0])
+    np.testing.assert_array_equal(decimated.y_max, [0.0, 0.0, 9.0, 0.0])
+
+    assert len(buffer.decimated(1000)) == 100
+
+
+def test_live_buffer_threads():
+    buffer = LiveBuffer(capacity=1000)
+
+    def produce():
+        for i in range(500):
+            buffer.append(np.arange(i * 10, (i + 1) * 10, dtype=float), np.zeros(10))
+
+    thread = threading.Thread(target=produce)
+    thread.start()
+
+    while thread.is_alive():
+        x = buffer.last(100).x
+        # snapshots are always consecutive points
+        assert np.all(np.diff(x) == 1.0)
+
+    thread.join()
+    assert buffer.n_written == 5000
+
+
+def test_live_buffer_invalid():
+    with pytest.raises(ValueError):
+        _ = LiveBuffer(capacity=0)
+
+    with pytest.raises(ValueError):
+        LiveBuffer().append(np.zeros(2), np.zeros(3))
+
+
+class _GrowingData:
+    """Callback data of a curve that grows by one point after every copy."""
+
+    def __init__(self):
+        self.n = 3
+
+    def _grow(self, values: np.ndarray) -> np.ndarray:
+        self.n += 1
+        return values
+
+    def new_x(self) -> np.ndarray:
+        return self._grow(np.arange(float(self.n)))
+
+    def new_y(self) -> np.ndarray:
+        return self._grow(np.arange(float(self.n)))
+
+    def new_block(self) -> np.ndarray:
+        return self._grow(np.column_stack((np.arange(float(self.n)), np.arange(float(self.n)))))
+
+
+def test_live_buffer_append_data():
+    buffer = LiveBuffer(capacity=10)
+
+    buffer._start_curve()
+    buffer._append_data(_GrowingData())  # type: ignore
+
+    snapshot = buffer.last()
+    np.testing.assert_array_equal(snapshot.x, [0.0, 1.0, 2.0])
+    np.testing.assert_array_equal(snapshot.y, [0.0, 1.0, 2.0])
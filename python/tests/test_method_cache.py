@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import math
+
+import pypalmsens as ps
+from pypalmsens._methods.cache import PSMethodCache, psmethod_cache
+
+
+def test_method_cache_reuse():
+    cache = PSMethodCache()
+    method = ps.CyclicVoltammetry(scanrate=0.5)
+
+    with cache.lease(method) as first:
+        pass
+
+    with cache.lease(ps.CyclicVoltammetry(scanrate=0.5)) as second:
+        assert second is first
+
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+def test_method_cache_content():
+    cache = PSMethodCache()
+    method = ps.CyclicVoltammetry(scanrate=0.5)
+
+    with cache.lease(method) as first:
+        pass
+
+    method.scanrate = 1.0
+
+    with cache.lease(method) as second:
+        assert second is not first
+        assert second.Scanrate == 1.0
+
+    assert len(cache) == 2
+
+
+def test_method_cache_concurrent():
+    cache = PSMethodCache()
+    method = ps.ChronoAmperometry()
+
+    with cache.lease(method) as first, cache.lease(method) as second:
+        assert second is not first
+
+    assert cache.misses == 2
+
+
+def test_method_cache_maxsize():
+    cache = PSMethodCache(maxsize=2)
+
+    for run_time in (1.0, 2.0, 3.0):
+        with cache.lease(ps.ChronoAmperometry(run_time=run_time)):
+            pass
+
+    assert len(cache) == 2
+
+
+def test_method_cache_measure():
+    method = ps.ChronoAmperometry(interval_time=0.1, run_time=0.5)
+    instrument = ps.SimulatedInstrument(n_points=5, speed=math.inf)
+
+    with ps.connect(instrument) as manager:
+        _ = manager.measure(method)
+        misses = psmethod_cache.misses
+
+        for _ in range(3):
+            _ = manager.measure(method)
+
+    assert psmethod_cache.misses == misses
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import asyncio
+import math
+
+import pytest
+
+import pypalmsens as ps
+from pypalmsens._instruments.shared import MethodIncompatibleError
+
+
+@pytest.fixture
+def method():
+    return ps.ChronoAmperometry(interval_time=0.1, run_time=1.0)
+
+
+@pytest.mark.asyncio
+async def test_scheduler(method):
+    instruments = ps.SimulatedInstrument.multichannel(4, n_points=10, speed=math.inf)
+
+    async with ps.InstrumentPoolAsync(instruments) as pool:
+        async with ps.JobScheduler(pool) as scheduler:
+            futures = [scheduler.submit(method, priority=i % 3) for i in range(12)]
+
+        measurements = [future.result() for future in futures]
+
+    assert all(len(measurement.curves[0]) == 10 for measurement in measurements)
+
+    stats = scheduler.stats()
+    assert stats.n_done == 12
+    assert stats.n_pending == stats.n_running == stats.n_failed == 0
+    assert sum(channel.n_jobs for channel in stats.channels) == 12
+    assert all(0 <= channel.utilization <= 1 for channel in stats.channels)
+    assert stats.max_wait_time >= stats.mean_wait_time >= 0
+
+
+@pytest.mark.asyncio
+async def test_scheduler_constraints(method):
+    instruments = ps.SimulatedInstrument.multichannel(3, n_points=10, speed=math.inf)
+
+    async with ps.InstrumentPoolAsync(instruments) as pool:
+        async with ps.JobScheduler(pool) as scheduler:
+            future = scheduler.submit(method, constraints=ps.JobConstraints(channels=[2]))
+            incompatible = scheduler.submit(
+                method, constraints=ps.JobConstraints(instruments=['Other'])
+            )
+
+    assert future.result()
+    job = scheduler.jobs[0]
+    assert job.manager is not None
+    assert job.manager.instrument.channel == 2
+    assert job.wait_time is not None
+    assert job.run_time is not None
+
+    with pytest.raises(MethodIncompatibleError):
+        incompatible.result()
+
+
+@pytest.mark.asyncio
+async def test_scheduler_plan():
+    instruments = ps.SimulatedInstrument.multichannel(2, n_points=10, speed=math.inf)
+    methods = [ps.ChronoAmperometry(interval_time=0.1, run_time=t) for t in (1, 2, 3, 4, 6)]
+
+    async with ps.InstrumentPoolAsync(instruments) as pool:
+        async with ps.JobScheduler(pool) as scheduler:
+            plan = scheduler.plan(methods)
+            futures = scheduler.submit_plan(plan)
+
+    assert [entry.index for entry in plan.entries] == list(range(5))
+    assert all(future.result() for future in futures)
+
+    # Longest first: 6 + 2 on one channel, 4 + 3 + 1 on the other
+    channels = plan.channels()
+    assert sorted(len(entries) for entries in channels.values()) == [2, 3]
+    assert plan.makespan == max(entries[-1].end for entries in channels.values())
+
+    for job, entry in zip(plan.jobs, plan.entries):
+        assert job.manager is entry.manager
+        assert job.estimated_duration == entry.duration
+
+    report = plan.report()
+    assert len(report.records) == 5
+    assert report.predicted_makespan == plan.makespan
+    assert report.actual_makespan > 0
+    assert report.scale > 0
+
+
+@pytest.mark.asyncio
+async def test_scheduler_requeue(method):
+    instruments = ps.SimulatedInstrument.multichannel(2, n_points=10, speed=math.inf)
+
+    async with ps.InstrumentPoolAsync(instruments) as pool:
+        dropped = pool[0]
+        measure = dropped.measure
+
+        async def measure_once(*args, **kwargs):
+            dropped.measure = measure
+            raise ConnectionError('Device not recognized')
+
+        dropped.measure = measure_once
+
+        monitor = pool.enable_health_checks(interval=60.0, backoff=ps.Backoff(initial=0.01))
+
+        async with ps.JobScheduler(pool) as scheduler:
+            futures = [scheduler.submit(method) for _ in range(4)]
+
+        assert all(future.result() for future in futures)
+        assert sorted(job.attempts for job in scheduler.jobs) == [1, 1, 1, 2]
+
+        while monitor.quarantined:
+            await asyncio.sleep(0.01)
+
+        assert [event.kind for event in monitor.events] == ['quarantined', 'restored']
+        assert dropped.is_connected()
+
+
+@pytest.mark.asyncio
+async def test_scheduler_retry_timeout(method):
+    instruments = ps.SimulatedInstrument.multichannel(1, n_points=10, speed=math.inf)
+
+    async with ps.InstrumentPoolAsync(instruments) as pool:
+        dropped = pool[0]
+
+        async def measure_dropped(*args, **kwargs):
+            raise ConnectionError('Device not recognized')
+
+        async def connect_dropped():
+            raise ConnectionError('Device not recognized')
+
+        dropped.measure = measure_dropped
+        dropped.connect = connect_dropped
+
+        monitor = pool.enable_health_checks(interval=60.0, backoff=ps.Backoff(initial=0.01))
+
+        scheduler = ps.JobScheduler(pool, retry_timeout=0.1)
+        future = scheduler.submit(method)
+
+        await asyncio.wait_for(scheduler.join(), 5.0)
+
+        with pytest.raises(ConnectionError):
+            _ = future.result()
+
+        assert scheduler.jobs[0].attempts == 1
+        assert monitor._listeners.count(scheduler._on_health_event) == 1
+
+
+def test_backoff():
+    backoff = ps.Backoff(initial=0.5, factor=2.0, maximum=3.0, jitter=0.0)
+    assert [backoff.delay(attempt) for attempt in range(4)] == [0.5, 1.0, 2.0, 3.0]
@@ -419,6 +419,7 @@ def test_GeneralSettings():
     [
         ({'id': 'cv', 'general': {'use_hardware_sync': True}}, True),
         ({'id': 'cv', 'general': {'use_hardware_sync': False}}, False),
+        ({'id': 'ad', 'general': {'use_hardware_sync': True}}, True),
         ({'id': 'ms', 'script': 'set_channel_sync 1\n'}, True),
         ({'id': 'ms', 'script': 'set_channel_sync 0\n'}, False),
     ],
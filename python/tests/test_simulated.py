@@ -0,0 +1,590 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import multiprocessing
+import pickle
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from PalmSens.Comm import CommManager
+from System.Threading.Tasks import Task
+
+import pypalmsens as ps
+from pypalmsens._instruments.measurement_manager_async import MeasurementManagerAsync
+from pypalmsens._instruments.process_pool import _N_STARTED, SharedRingBuffer, _Worker
+from pypalmsens._instruments.rpc import RemoteError, _open, _read_head
+from pypalmsens._instruments.simulated import SimulatedComm
+
+
+@pytest.fixture
+def method():
+    return ps.ChronoAmperometry(interval_time=0.1, run_time=1.0)
+
+
+def test_simulated_measure(method):
+    instrument = ps.SimulatedInstrument(n_points=50, n_curves=2, speed=math.inf, seed=1)
+
+    batches = []
+
+    with ps.connect(instrument) as manager:
+        assert not manager.is_measuring()
+        measurement = manager.measure(method, callback=batches.append)
+
+    assert len(measurement.curves) == 2
+    assert all(len(curve) == 50 for curve in measurement.curves)
+
+    assert sum(batch.index - batch.start + 1 for batch in batches) == 100
+
+
+def test_simulated_callback_thread(method):
+    instrument = ps.SimulatedInstrument(n_points=20, speed=math.inf)
+
+    threads = set()
+
+    with ps.connect(instrument) as manager:
+        _ = manager.measure(method, callback=lambda data: threads.add(threading.get_ident()))
+
+    # The synchronous API calls back on the calling thread, not on the background loop
+    assert threads == {threading.get_ident()}
+
+
+def test_simulated_pool_callback_thread(method):
+    instruments = ps.SimulatedInstrument.multichannel(2, n_points=10, speed=math.inf)
+
+    threads = set()
+
+    with ps.InstrumentPool(instruments) as pool:
+        _ = pool.measure(method, callback=lambda data: threads.add(threading.get_ident()))
+
+    assert threads == {threading.get_ident()}
+
+
+def test_simulated_curve_arrays_released(method, monkeypatch):
+    instrument = ps.SimulatedInstrument(n_points=50, n_curves=3, speed=math.inf)
+
+    managers = []
+    init = MeasurementManagerAsync.__init__
+
+    def spy_init(self, *args, **kwargs):
+        managers.append(self)
+        init(self, *args, **kwargs)
+
+    monkeypatch.setattr(MeasurementManagerAsync, '__init__', spy_init)
+
+    batches = []
+
+    with ps.connect(instrument) as manager:
+        _ = manager.measure(method, callback=batches.append)
+
+    # All data are dispatched before the arrays of a finished curve are dropped
+    assert sum(batch.index - batch.start + 1 for batch in batches) == 150
+    assert [manager._curve_arrays for manager in managers] == [{}]
+
+
+def test_simulated_measure_error(method, monkeypatch):
+    def fail(self, psmethod):
+        raise RuntimeError('broken source')
+
+    errors = []
+
+    monkeypatch.setattr(ps.SimulatedInstrument, '_sources', fail)
+    monkeypatch.setattr(threading, 'excepthook', lambda args: errors.append(args.exc_value))
+
+    with ps.connect(ps.SimulatedInstrument(speed=math.inf)) as manager:
+        # The measurement ends instead of waiting for the end event forever
+        _ = manager.measure(method)
+        assert manager._comm.State == CommManager.DeviceState.Idle
+
+    assert [str(error) for error in errors] == ['broken source']
+
+
+def test_simulated_noise(method):
+    instrument = ps.SimulatedInstrument(n_points=20, noise=0.0, speed=math.inf)
+
+    with ps.connect(instrument) as manager:
+        measurement = manager.measure(method)
+
+    curve = measurement.curves[0]
+    x = np.array(curve.x_array)
+    np.testing.assert_allclose(x, np.arange(20) / 100)
+    np.testing.assert_allclose(np.array(curve.y_array), np.sin(2 * np.pi * x / 10), atol=1e-6)
+
+
+def test_simulated_speed(method):
+    instrument = ps.SimulatedInstrument(n_points=20, rate=100, speed=2)
+
+    with ps.connect(instrument) as manager:
+        measurement = manager.measure(method)
+
+    # 0.2 s of measurement time at twice the speed
+    assert len(measurement.curves[0]) == 20
+
+
+def test_simulated_measure_nowait(method):
+    instruments = ps.SimulatedInstrument.multichannel(3, n_points=20, rate=100)
+    managers = [ps.connect(instrument) for instrument in instruments]
+
+    try:
+        futures = [manager.measure_nowait(method) for manager in managers]
+        measurements = [future.result(timeout=5) for future in futures]
+    finally:
+        for manager in managers:
+            manager.disconnect()
+
+    assert all(len(measurement.curves[0]) == 20 for measurement in measurements)
+
+
+def test_simulated_pool_measure_nowait(method):
+    instruments = ps.SimulatedInstrument.multichannel(2, n_points=10, speed=math.inf)
+
+    with ps.InstrumentPool(instruments) as pool:
+        measurements = pool.measure_nowait(method).result(timeout=5)
+
+    assert len(measurements) == 2
+
+
+def test_simulated_eis():
+    method = ps.ElectrochemicalImpedanceSpectroscopy()
+    instrument = ps.SimulatedInstrument(n_points=11, speed=math.inf)
+
+    batches = []
+
+    with ps.connect(instrument) as manager:
+        measurement = manager.measure(method, callback=batches.append)
+
+    assert len(measurement.eis_data) == 1
+    assert measurement.eis_data[0].n_points == 11
+    assert batches[-1].index == 10
+
+
+@pytest.mark.asyncio
+async def test_simulated_hardware_sync(method, monkeypatch):
+    instruments = ps.SimulatedInstrument.multichannel(4, n_points=10, speed=math.inf)
+    assert [instrument.channel for instrument in instruments] == [1, 2, 3, 4]
+
+    method.general.use_hardware_sync = True
+    assert method._use_hardware_sync
+
+    measure_hw_sync = ps.InstrumentPoolAsync._measure_hw_sync
+    calls = []
+
+    async def spy(self, *args, **kwargs):
+        calls.append(self)
+        return await measure_hw_sync(self, *args, **kwargs)
+
+    monkeypatch.setattr(ps.InstrumentPoolAsync, '_measure_hw_sync', spy)
+
+    async with ps.InstrumentPoolAsync(instruments) as pool:
+        results = await pool.measure(method)
+
+    assert calls == [pool]
+
+    assert len(results) == 4
+    assert all(len(result.curves[0]) == 10 for result in results)
+
+
+def test_simulated_replay_curves(data_cv_3scan):
+    recorded = data_cv_3scan[0]
+    instrument = ps.SimulatedInstrument(replay=recorded, speed=math.inf)
+
+    batches = []
+
+    with ps.connect(instrument) as manager:
+        measurement = manager.measure(recorded.method, callback=batches.append)
+
+    assert len(measurement.curves) == len(recorded.curves)
+
+    for curve, recorded_curve in zip(measurement.curves, recorded.curves):
+        assert curve.title == recorded_curve.title
+        np.testing.assert_array_equal(
+            curve.x_array.to_numpy(), recorded_curve.x_array.to_numpy()
+        )
+        np.testing.assert_array_equal(
+            curve.y_array.to_numpy(), recorded_curve.y_array.to_numpy()
+        )
+
+    assert sum(batch.index - batch.start + 1 for batch in batches) == sum(
+        len(curve) for curve in recorded.curves
+    )
+
+
+def test_simulated_replay_eis():
+    path = Path(__file__).parent / 'test_data' / 'eis_5freq.pssession'
+
+    instrument = ps.SimulatedInstrument.from_session(path, speed=math.inf)
+    recorded = instrument.replay
+    assert recorded
+
+    with ps.connect(instrument) as manager:
+        measurement = manager.measure(recorded.method)
+
+    assert len(measurement.eis_data) == 1
+    eis_data = measurement.eis_data[0]
+    recorded_eis_data = recorded.eis_data[0]
+
+    assert eis_data.n_points == recorded_eis_data.n_points
+    np.testing.assert_array_equal(
+        eis_data.dataset['Frequency'].to_numpy(),
+        recorded_eis_data.dataset['Frequency'].to_numpy(),
+    )
+
+
+def test_simulated_sample():
+    instrument = ps.SimulatedInstrument(noise=0.0)
+
+    with ps.connect(instrument) as manager:
+        samples = manager.sample(['current', 'potential'], rate=100, duration=0.2)
+
+    assert len(samples) == 20
+    assert samples.values.shape == (20, 2)
+    assert np.all(np.diff(samples.time) > 0)
+    # Readings are due every 10 ms
+    assert samples.time[-1] >= 0.18
+    assert np.all(np.abs(samples['current']) <= 1.0)
+    assert np.all(np.abs(samples['potential']) <= 0.1)
+
+
+@pytest.mark.asyncio
+async def test_simulated_sample_iter():
+    instrument = ps.SimulatedInstrument()
+
+    async with await ps.connect_async(instrument) as manager:
+        blocks = []
+        async for samples in manager.sample_iter('potential', rate=200, block_size=10):
+            blocks.append(samples)
+            if len(blocks) == 3:
+                break
+
+    assert [len(block) for block in blocks] == [10, 10, 10]
+    assert blocks[1].time[0] > blocks[0].time[-1]
+    assert blocks[0].quantities == ('potential',)
+
+
+def test_sample_invalid_quantity():
+    with ps.connect(ps.SimulatedInstrument()) as manager:
+        with pytest.raises(ValueError):
+            _ = manager.sample('charge')  # type: ignore
+
+
+class _StatusEventArgs:
+    def __init__(self, potential: float, current: float):
+        self.DeviceState = CommManager.DeviceState.Idle
+        self._status = SimpleNamespace(
+            PotentialReading=SimpleNamespace(Value=potential),
+            CurrentReading=SimpleNamespace(Value=current),
+            CurrentReadingWE2=SimpleNamespace(Value=0.0),
+            AuxInput=0.0,
+            Noise=0.01,
+        )
+
+    def GetStatus(self):
+        return self._status
+
+
+@pytest.mark.asyncio
+async def test_simulated_record_status():
+    instrument = ps.SimulatedInstrument()
+
+    async with await ps.connect_async(instrument) as manager:
+        recorder = manager.record_status(ps.data.StatusRecorder(decimation=2))
+
+        for i in range(10):
+            manager._comm.ReceiveStatusAsync(manager._comm, _StatusEventArgs(i / 10, i))
+
+        assert manager.stop_recording_status() is recorder
+        manager._comm.ReceiveStatusAsync(manager._comm, _StatusEventArgs(1.0, 10))
+
+    assert recorder.n_received == 10
+
+    record = recorder.last()
+    np.testing.assert_allclose(record.potential, [0.0, 0.2, 0.4, 0.6, 0.8], rtol=1e-6)
+    np.testing.assert_array_equal(record.current, [0, 2, 4, 6, 8])
+    assert record.device_states() == ['Idle'] * 5
+
+
+@pytest.mark.asyncio
+async def test_simulated_mux_sweep(method, tmp_path):
+    instrument = ps.SimulatedInstrument(n_points=10, speed=math.inf)
+
+    async with await ps.connect_async(instrument) as manager:
+        sweep = ps.MuxSweep(
+            manager, method, channels=[3, 1, 2], stream=tmp_path / 'ch{channel}.jsonl'
+        )
+        result = await sweep.run()
+
+        assert manager._comm.ClientConnection.MuxChannel == 2
+
+    assert result.channels == [3, 1, 2]
+    assert all(len(measurement.curves[0]) == 10 for measurement in result.measurements)
+    assert all(len(values) == 10 for values in result[1].arrays.values())
+    assert result.total_time >= result.switch_time + result.measure_time
+    assert (tmp_path / 'ch3.jsonl').exists()
+
+
+def test_mux_sweep_methods_mismatch(method):
+    with pytest.raises(ValueError):
+        _ = ps.MuxSweep(None, [method], channels=[0, 1])  # type: ignore
+
+
+def test_simulated_timings(method):
+    instruments = ps.SimulatedInstrument.multichannel(2, n_points=10, speed=math.inf)
+
+    with ps.InstrumentPool(instruments) as pool:
+        stats = pool.enable_timings()
+        measurements = pool.measure(method)
+
+    assert len(stats) == 2
+
+    for measurement in measurements:
+        assert measurement.timings is not None
+        durations = measurement.timings.durations()
+        assert set(durations) == {
+            'prepare',
+            'lock_wait',
+            'start',
+            'begin',
+            'first_data',
+            'data',
+            'end',
+            'finish',
+            'total',
+        }
+        assert all(duration >= 0 for duration in durations.values())
+
+    histograms = stats.histograms(percentiles=(50, 99))
+    assert histograms['total'].count == 2
+    assert list(histograms['total'].percentiles) == [50, 99]
+
+
+async def _instrument_id(manager):
+    return manager.instrument.id
+
+
+@pytest.mark.asyncio
+async def test_simulated_process_pool(method):
+    instruments = ps.SimulatedInstrument.multichannel(2, n_points=20, speed=math.inf)
+    batches = []
+
+    async with ps.InstrumentProcessPoolAsync(instruments) as pool:
+        measurements = await pool.measure(method, callback=batches.append)
+        ids = await pool.submit(_instrument_id)
+
+        assert pool.n_dropped() == [0, 0]
+
+    assert not pool.is_connected()
+    assert ids == [instrument.id for instrument in instruments]
+    assert all(len(measurement.curves[0]) == 20 for measurement in measurements)
+    assert sum(len(batch.new_x()) for batch in batches) == 40
+
+
+def test_shared_ring_buffer_pickle():
+    ring = SharedRingBuffer(capacity=4, n_columns=2)
+    reader = pickle.loads(pickle.dumps(ring))
+
+    try:
+        ring.write(np.arange(12.0).reshape(6, 2))
+
+        np.testing.assert_array_equal(reader.read(), np.arange(4.0, 12.0).reshape(4, 2))
+        assert reader.n_dropped == 2
+        assert not reader._owner
+    finally:
+        reader.close()
+        ring.close()
+
+
+def test_shared_ring_buffer_torn_write():
+    ring = SharedRingBuffer(capacity=4, n_columns=1)
+
+    try:
+        ring.write(np.arange(4.0).reshape(4, 1))
+
+        # A write of two rows is in progress, its first row is already written
+        ring._header[_N_STARTED] = 6
+        ring._data[0] = -1.0
+
+        np.testing.assert_array_equal(ring.read(), [[2.0], [3.0]])
+        assert ring.n_dropped == 2
+    finally:
+        ring.close()
+
+
+@pytest.mark.asyncio
+async def test_process_worker_cancel():
+    worker = _Worker(ps.SimulatedInstrument(), capacity=1)
+    worker._conn, child = multiprocessing.Pipe()
+    executor = ThreadPoolExecutor(max_workers=2)
+
+    try:
+        first = asyncio.ensure_future(worker.request(executor, 'submit', 1))
+        await asyncio.sleep(0.1)
+        _ = first.cancel()
+
+        second = asyncio.ensure_future(worker.request(executor, 'submit', 2))
+        await asyncio.sleep(0.1)
+
+        # The next request waits until the reply to the cancelled one is read
+        assert child.recv() == ('submit', 1)
+        assert not child.poll(0.1)
+        child.send(('ok', 1))
+        assert await asyncio.to_thread(child.recv) == ('submit', 2)
+        child.send(('ok', 2))
+
+        assert await asyncio.wait_for(second, 5) == 2
+    finally:
+        executor.shutdown()
+        worker.ring.close()
+        child.close()
+
+
+@pytest.mark.asyncio
+async def test_simulated_rpc(method):
+    instrument = ps.SimulatedInstrument(n_points=20, speed=math.inf)
+    pool = ps.InstrumentPoolAsync([instrument])
+    batches = []
+
+    async with ps.InstrumentServer(pool) as server:
+        async with ps.InstrumentClient(server.address) as client:
+            assert [info['id'] for info in await client.instruments()] == [instrument.id]
+
+            manager = await client.connect(instrument.id)
+            assert await manager.is_connected()
+            assert not await manager.is_measuring()
+
+            measurement = await manager.measure(method, callback=batches.append)
+
+            with pytest.raises(KeyError):
+                await client.manager('unknown').status()
+
+            await manager.disconnect()
+
+    assert pool.is_disconnected()
+    assert len(measurement.curves[0]) == 20
+    assert sum(len(batch.new_x()) for batch in batches) == 20
+
+
+@pytest.mark.asyncio
+async def test_simulated_rpc_calls():
+    instrument = ps.SimulatedInstrument(noise=0.0)
+    pool = ps.InstrumentPoolAsync([instrument])
+
+    async with ps.InstrumentServer(pool) as server:
+        async with ps.InstrumentClient(server.address) as client:
+            async with client.manager(instrument.id) as manager:
+                assert await manager.is_connected()
+                assert not await manager.is_measuring()
+                assert isinstance(await manager.read_current(), float)
+
+                # Errors on the server are raised on the client
+                with pytest.raises(RemoteError, match='not supported'):
+                    await manager.get_instrument_serial()
+
+            assert not await manager.is_connected()
+
+            with pytest.raises(KeyError):
+                await client.manager('unknown').is_connected()
+
+
+@pytest.mark.asyncio
+async def test_simulated_rpc_bad_request():
+    instrument = ps.SimulatedInstrument()
+    pool = ps.InstrumentPoolAsync([instrument])
+
+    async with ps.InstrumentServer(pool) as server:
+        path = f'/instruments/{instrument.id}/measure'
+
+        async with ps.InstrumentClient(server.address) as client:
+            with pytest.raises(ValueError, match='interval_time'):
+                _ = await client._request('POST', path, {'id': 'ad', 'interval_time': 'fast'})
+
+        # The size is checked before the body is read
+        reader, writer = await _open(server.address)
+        writer.write(f'POST {path} HTTP/1.1\r\nContent-Length: {1 << 30}\r\n\r\n'.encode())
+        await writer.drain()
+
+        status_line, _ = await _read_head(reader)
+        writer.close()
+
+    assert status_line.split()[1] == '413'
+
+
+@pytest.mark.asyncio
+async def test_simulated_watchdog(method):
+    instrument = ps.SimulatedInstrument(n_points=50, speed=0.05)
+
+    async with ps.InstrumentManagerAsync(instrument) as manager:
+        manager.watchdog = ps.Watchdog(factor=None, data_timeout=0.2)
+
+        with pytest.raises(ps.MeasurementTimeoutError) as info:
+            _ = await manager.measure(method)
+
+        assert info.value.reason == 'no_data'
+        assert info.value.measurement is not None
+
+        # The connection lock is released after the abort
+        assert isinstance(await manager.read_current(), float)
+
+
+@pytest.mark.asyncio
+async def test_simulated_watchdog_start(method, monkeypatch):
+    instrument = ps.SimulatedInstrument(n_points=50, speed=0.05)
+
+    measure_async = SimulatedComm.MeasureAsync
+    abort_async = SimulatedComm.AbortAsync
+    starts = []
+    started_before_abort = []
+
+    def slow_measure_async(self, psmethod):
+        _ = measure_async(self, psmethod)
+        starts.append(Task.Delay(300))
+        return starts[-1]
+
+    def spy_abort_async(self):
+        started_before_abort.append(starts[-1].IsCompleted)
+        return abort_async(self)
+
+    monkeypatch.setattr(SimulatedComm, 'MeasureAsync', slow_measure_async)
+    monkeypatch.setattr(SimulatedComm, 'AbortAsync', spy_abort_async)
+
+    async with ps.InstrumentManagerAsync(instrument) as manager:
+        manager.watchdog = ps.Watchdog(factor=0.001, margin=0.0, data_timeout=None)
+
+        with pytest.raises(ps.MeasurementTimeoutError) as info:
+            _ = await manager.measure(method)
+
+        assert info.value.reason == 'deadline'
+
+        # The lock is kept until the instrument has started, then aborted
+        assert started_before_abort == [True]
+        assert isinstance(await manager.read_current(), float)
+
+
+def test_watchdog_deadline():
+    watchdog = ps.Watchdog(factor=2.0, margin=10.0)
+    assert watchdog.deadline(60.0) == 130.0
+    assert watchdog.deadline(0.0) is None
+    assert ps.Watchdog(factor=None).deadline(60.0) is None
+
+
+@pytest.mark.asyncio
+async def test_simulated_measure_synchronized(method):
+    instruments = [
+        ps.SimulatedInstrument(id=f'Sim{i}', n_points=20, speed=10.0) for i in range(3)
+    ]
+
+    async with ps.InstrumentPoolAsync(instruments) as pool:
+        result = await pool.measure_synchronized(method)
+
+    assert len(result) == 3
+    assert all(len(measurement.curves[0]) == 20 for measurement in result)
+    assert result.offsets.min() == 0.0
+    assert 0.0 <= result.skew < 1.0
+    assert result.release_spread >= 0.0
+
+    t, currents = result.aligned('Current')
+    assert currents.shape == (3, len(t))
+    assert t[0] >= result.skew
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from pypalmsens.data import StatusRecorder
+
+
+def test_status_recorder_grow():
+    recorder = StatusRecorder(capacity=2)
+    assert len(recorder.last()) == 0
+
+    for i in range(10):
+        recorder.append(potential=i / 10, current=i, timestamp=float(i))
+
+    assert len(recorder) == 10
+
+    record = recorder.last()
+    np.testing.assert_array_equal(record.timestamp, np.arange(10.0))
+    np.testing.assert_array_equal(record.current, np.arange(10.0))
+    assert record.potential.dtype == np.float32
+    assert np.isnan(record.noise).all()
+    assert record.device_states() == ['Idle'] * 10
+
+    np.testing.assert_array_equal(recorder.last(3).current, [7, 8, 9])
+
+
+def test_status_recorder_decimation():
+    recorder = StatusRecorder(decimation=3)
+
+    for i in range(10):
+        recorder.append(potential=0.0, current=i)
+
+    assert recorder.n_received == 10
+    np.testing.assert_array_equal(recorder.last().current, [0, 3, 6, 9])
+
+    recorder.reset()
+    assert len(recorder) == 0
+    assert recorder.n_received == 0
+
+
+def test_status_recorder_between():
+    recorder = StatusRecorder()
+
+    for i in range(10):
+        recorder.append(potential=0.0, current=i, timestamp=float(i))
+
+    np.testing.assert_array_equal(recorder.between(3, 6).current, [3, 4, 5])
+    np.testing.assert_array_equal(recorder.between(8).current, [8, 9])
+    assert len(recorder.between(7, 2)) == 0
+
+
+def test_status_recorder_save(tmp_path):
+    recorder = StatusRecorder()
+    recorder.append(potential=0.5, current=1.0, state='Idle')
+    recorder.append(potential=0.5, current=2.0, state='Pretreatment')
+
+    path = tmp_path / 'status.npz'
+    recorder.save(path)
+
+    with np.load(path) as data:
+        np.testing.assert_array_equal(data['current'], [1.0, 2.0])
+        labels = dict(zip(data['state_codes'].tolist(), data['state_labels'].tolist()))
+        assert [labels[code] for code in data['state'].tolist()] == ['Idle', 'Pretreatment']
+
+
+def test_status_recorder_invalid():
+    with pytest.raises(ValueError):
+        _ = StatusRecorder(decimation=0)
@@ -12,7 +12,8 @@ import pypalmsens as ps
 from pypalmsens._data.curve import CurveMetadata
 from pypalmsens._data.eisdata import EISDataMetadata
 from pypalmsens._data.measurement import MeasurementMetadata
-from pypalmsens._instruments.callback import DataRow
+from pypalmsens._instruments.callback import CallbackData, DataRow
+from pypalmsens._instruments.measurement_manager_async import JSONWriter
 from pypalmsens.types import MethodTypeCompatible
 
 
@@ -178,3 +179,142 @@ def test_measure_stream_eis(tmpdir):
             assert ref_array.quantity == metadata.quantities[i]
 
             np.testing.assert_allclose(data[:, i], ref_array)
+
+
+def _write_stream(path: Path, measurement: ps.data.Measurement):
+    adapter = TypeAdapter(DataRow)
+
+    with open(path, 'wb') as f:
+        _ = f.write(measurement.metadata_json() + b'\n')
+
+        for curve in measurement.curves:
+            _ = f.write(curve.metadata_json() + b'\n')
+
+            curve_id = curve._pscurve.GetHashCode()
+            for x, y in zip(curve.x_array, curve.y_array):
+                _ = f.write(adapter.dump_json(DataRow(id=curve_id, data=[x, y])) + b'\n')
+
+
+def test_recover_stream(tmp_path, data_cv_3scan):
+    measurement = data_cv_3scan[0]
+
+    path = tmp_path / 'cv.jsonl'
+    _write_stream(path, measurement)
+
+    recovered = ps.recover_stream(path)
+
+    assert not recovered.truncated
+    assert recovered.metadata
+    assert recovered.metadata.title == measurement.title
+    assert len(recovered.curves) == len(measurement.curves)
+
+    for curve, ref in zip(recovered.curves, measurement.curves):
+        assert curve.title == ref.title
+        np.testing.assert_allclose(curve.x, ref.x_array)
+        np.testing.assert_allclose(curve.y, ref.y_array)
+
+
+def test_recover_stream_truncated(tmp_path, data_cv_1scan):
+    measurement = data_cv_1scan[0]
+
+    path = tmp_path / 'cv.jsonl'
+    _write_stream(path, measurement)
+
+    # Simulate a power cut halfway through the last line
+    data = path.read_bytes()
+    _ = path.write_bytes(data[:-10])
+
+    recovered = ps.recover_stream(path)
+
+    assert recovered.truncated
+    assert len(recovered.curves[0]) == measurement.curves[0].n_points - 1
+
+
+def test_recover_stream_session(tmp_path, data_cv_1scan):
+    measurement = data_cv_1scan[0]
+
+    path = tmp_path / 'cv.jsonl'
+    _write_stream(path, measurement)
+
+    session = tmp_path / 'cv.pssession'
+    _ = ps.recover_stream(path, session=session)
+
+    loaded = ps.load_session_file(session)[0]
+    ref = measurement.curves[0]
+
+    assert loaded.title == measurement.title
+    np.testing.assert_allclose(loaded.curves[0].x_array, ref.x_array)
+    np.testing.assert_allclose(loaded.curves[0].y_array, ref.y_array)
+
+
+def _write_segmented_stream(stream: ps.DataStream | Path, measurement: ps.data.Measurement):
+    """Drive the stream writer like the measurement manager does."""
+    callbacks = JSONWriter.from_stream(stream).callbacks
+
+    callbacks.setup[0]()
+    callbacks.measurement_begin[0](measurement)
+
+    for curve in measurement.curves:
+        callbacks.curve_start[0](curve)
+
+        curve_id = curve._pscurve.GetHashCode()
+        for start in range(0, curve.n_points, 7):
+            stop = min(start + 7, curve.n_points)
+            data = CallbackData(
+                x_array=curve.x_array,
+                y_array=curve.y_array,
+                start=start,
+                id=curve_id,
+                _stop=stop,
+            )
+            callbacks.curve_new_data[0](data)
+
+        callbacks.curve_finished[0](curve)
+
+    callbacks.teardown[0]()
+
+
+@pytest.mark.parametrize('compress', (False, True))
+def test_stream_segments(tmp_path, data_cv_3scan, compress):
+    measurement = data_cv_3scan[0]
+
+    stream = ps.DataStream(tmp_path / 'cv.jsonl', max_rows=20, compress=compress)
+    _write_segmented_stream(stream, measurement)
+
+    manifest = ps.data.StreamManifest.model_validate_json(
+        (tmp_path / 'cv.manifest.json').read_bytes()
+    )
+
+    assert manifest.finished
+    assert len(manifest.segments) > 1
+    assert all(segment.closed for segment in manifest.segments)
+    assert all(segment.compressed == compress for segment in manifest.segments)
+    assert sum(segment.n_rows for segment in manifest.segments) == sum(
+        curve.n_points for curve in measurement.curves
+    )
+
+    suffix = '.jsonl.gz' if compress else '.jsonl'
+    assert manifest.segments[1].filename == f'cv.0001{suffix}'
+
+    # Segments start with the metadata, and can be read on their own
+    segment = ps.recover_stream(tmp_path / manifest.segments[1].filename)
+    assert segment.metadata
+    assert segment.metadata.title == measurement.title
+
+    recovered = ps.recover_stream(tmp_path / 'cv.manifest.json')
+
+    assert len(recovered.curves) == len(measurement.curves)
+
+    for curve, ref in zip(recovered.curves, measurement.curves):
+        np.testing.assert_allclose(curve.x, ref.x_array)
+        np.testing.assert_allclose(curve.y, ref.y_array)
+
+
+def test_stream_plain_path(tmp_path, data_cv_1scan):
+    measurement = data_cv_1scan[0]
+
+    path = tmp_path / 'cv.jsonl'
+    _write_segmented_stream(path, measurement)
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['cv.jsonl']
+    assert len(ps.recover_stream(path).curves[0]) == measurement.curves[0].n_points
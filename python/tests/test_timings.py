@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import numpy as np
+
+from pypalmsens.data import MeasurementTimings, TimingStats
+
+
+def test_measurement_timings_durations():
+    timings = MeasurementTimings(
+        called=0.0,
+        lock_requested=0.1,
+        lock_acquired=0.3,
+        started=0.4,
+        begin_event=1.0,
+    )
+
+    durations = timings.durations()
+    assert list(durations) == ['prepare', 'lock_wait', 'start', 'begin']
+    np.testing.assert_allclose(list(durations.values()), [0.1, 0.2, 0.1, 0.6])
+
+
+def test_timing_stats_histograms():
+    stats = TimingStats(maxlen=100)
+
+    for i in range(1, 201):
+        stats._add(MeasurementTimings(called=0.0, finished=i / 100))
+
+    assert len(stats) == 100
+
+    histograms = stats.histograms(bins=10)
+    assert list(histograms) == ['total']
+
+    total = histograms['total']
+    assert total.count == 100
+    assert total.counts.sum() == 100
+    assert len(total.edges) == 11
+    np.testing.assert_allclose(total.percentiles[50], 1.505)